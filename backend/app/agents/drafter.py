@@ -4,11 +4,13 @@ Drafting Agent: Senior Legal Draftsman.
 Transforms research findings into formal legal petitions.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Callable
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langsmith import traceable
 
+from ..utils.llm_cache import LLMResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,8 @@ class DrafterAgent:
     Requires a system_prompt to be provided - no default prompt.
     """
     
-    def __init__(self, model_name: str = "gpt-4.1", temperature: float = 0.2, system_prompt: str = None):
+    def __init__(self, model_name: str = "gpt-4.1", temperature: float = 0.2, system_prompt: str = None,
+                 cache: Optional[LLMResponseCache] = None):
         """
         Initialize the Drafter Agent.
         
@@ -28,6 +31,7 @@ class DrafterAgent:
             model_name: The LLM model to use for drafting
             temperature: Controls creativity (slightly higher for natural language)
             system_prompt: Domain-specific system prompt (REQUIRED)
+            cache: Optional response cache; identical calls skip the LLM
             
         Raises:
             ValueError: If system_prompt is not provided
@@ -40,6 +44,9 @@ class DrafterAgent:
         
         self.llm = ChatOpenAI(model=model_name, temperature=temperature)
         self.system_prompt = system_prompt
+        self.model_name = model_name
+        self.temperature = temperature
+        self.cache = cache
         
         # Domain-agnostic human message template
         self.prompt = ChatPromptTemplate.from_messages([
@@ -58,7 +65,13 @@ Create your analysis/document based on the above information.""")
         self.chain = self.prompt | self.llm
     
     @traceable(name="legal_petition_drafting")
-    async def draft(self, grievance: str, research_findings: Dict[str, Any], feedback: str = "") -> str:
+    async def draft(
+        self,
+        grievance: str,
+        research_findings: Dict[str, Any],
+        feedback: str = "",
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Draft a formal legal petition based on research findings.
         
@@ -66,6 +79,8 @@ Create your analysis/document based on the above information.""")
             grievance: The original user grievance
             research_findings: Output from the Researcher Agent
             feedback: Optional feedback from Expert Reviewer for refinement
+            on_token: Optional callback; when given, the completion is streamed
+                      and each token is passed to it as it arrives
             
         Returns:
             The complete drafted legal petition as a string
@@ -77,27 +92,57 @@ Create your analysis/document based on the above information.""")
         if feedback:
             feedback_section = f"\n**EXPERT REVIEWER FEEDBACK (Address these issues):**\n{feedback}\n"
         
+        inputs = {
+            "grievance": grievance,
+            "research_findings": self._format_research(research_findings),
+            "feedback_section": feedback_section
+        }
+        cache_key = self._cache_key(inputs) if self.cache else None
+        if cache_key:
+            cached = await self.cache.aget(cache_key)
+            if cached is not None:
+                logger.info(f"Drafter Agent: Returning cached draft ({len(cached)} characters)")
+                if on_token:
+                    on_token(cached)
+                return cached
+        
         try:
-            result = await self.chain.ainvoke({
-                "grievance": grievance,
-                "research_findings": self._format_research(research_findings),
-                "feedback_section": feedback_section
-            })
-            
-            draft = result.content
+            if on_token:
+                parts = []
+                async for chunk in self.chain.astream(inputs):
+                    if chunk.content:
+                        parts.append(chunk.content)
+                        on_token(chunk.content)
+                draft = "".join(parts)
+            else:
+                result = await self.chain.ainvoke(inputs)
+                draft = result.content
             logger.info(f"Drafter Agent: Draft complete ({len(draft)} characters)")
+            if cache_key:
+                await self.cache.aset(cache_key, draft)
             return draft
             
         except Exception as e:
             logger.error(f"Drafter Agent: Error during drafting - {str(e)}")
             raise
     
+    def _cache_key(self, inputs: Dict[str, Any]) -> str:
+        """Content-addressed cache key for the rendered prompt."""
+        rendered = self.prompt.format_messages(**inputs)[-1].content
+        return LLMResponseCache.make_key(self.model_name, self.temperature, self.system_prompt, rendered)
+    
     def _format_research(self, research: Dict[str, Any]) -> str:
         """Format research findings for the prompt."""
-        return f"""
+        formatted = f"""
 Summary of Facts: {research.get('summary_of_facts', [])}
 Legal Provisions: {research.get('legal_provisions', [])}
 Merits Score: {research.get('merits_score', 'N/A')}/10
 Reasoning: {research.get('reasoning', '')}
 Kerala-Specific: {research.get('kerala_specific', 'None')}
 """
+        if research.get("provision_texts"):
+            # Exact statute wording from the citation index (see orchestrator)
+            formatted += "Provision Text:\n" + "\n\n".join(
+                f"{citation}:\n{text}" for citation, text in research["provision_texts"].items()
+            ) + "\n"
+        return formatted
@@ -4,12 +4,14 @@ Expert Reviewer Agent: Senior Advocate & Quality Auditor.
 Audits legal drafts for zero-error compliance with Indian legal standards.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langsmith import traceable
 
+from ..utils.llm_cache import LLMResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,8 @@ class ExpertReviewerAgent:
     Requires a system_prompt to be provided - no default prompt.
     """
     
-    def __init__(self, model_name: str = "gpt-4.1", temperature: float = 0.0, system_prompt: str = None):
+    def __init__(self, model_name: str = "gpt-4.1", temperature: float = 0.0, system_prompt: str = None,
+                 cache: Optional[LLMResponseCache] = None):
         """
         Initialize the Expert Reviewer Agent.
         
@@ -29,6 +32,7 @@ class ExpertReviewerAgent:
             model_name: The LLM model to use for review
             temperature: Controls consistency (0 for deterministic reviews)
             system_prompt: Domain-specific system prompt (REQUIRED)
+            cache: Optional response cache; identical calls skip the LLM
             
         Raises:
             ValueError: If system_prompt is not provided
@@ -42,6 +46,9 @@ class ExpertReviewerAgent:
         self.llm = ChatOpenAI(model=model_name, temperature=temperature)
         self.parser = JsonOutputParser()
         self.system_prompt = system_prompt
+        self.model_name = model_name
+        self.temperature = temperature
+        self.cache = cache
         
         # Domain-agnostic human message template
         self.prompt = ChatPromptTemplate.from_messages([
@@ -71,11 +78,21 @@ Provide your audit results in JSON format.""")
         """
         logger.info("Expert Reviewer Agent: Starting audit of legal draft")
         
+        inputs = {
+            "draft": draft,
+            "research_findings": self._format_research(research_findings)
+        }
+        cache_key = self._cache_key(inputs) if self.cache else None
+        if cache_key:
+            cached = await self.cache.aget(cache_key)
+            if cached is not None:
+                logger.info("Expert Reviewer Agent: Returning cached audit")
+                return cached
+        
         try:
-            result = await self.chain.ainvoke({
-                "draft": draft,
-                "research_findings": self._format_research(research_findings)
-            })
+            result = await self.chain.ainvoke(inputs)
+            if cache_key:
+                await self.cache.aset(cache_key, result)
             
             approval_status = "APPROVED" if result.get("is_approved") else "REJECTED"
             logger.info(f"Expert Reviewer Agent: Audit complete - {approval_status}")
@@ -89,10 +106,21 @@ Provide your audit results in JSON format.""")
             logger.error(f"Expert Reviewer Agent: Error during review - {str(e)}")
             raise
     
+    def _cache_key(self, inputs: Dict[str, Any]) -> str:
+        """Content-addressed cache key for the rendered prompt."""
+        rendered = self.prompt.format_messages(**inputs)[-1].content
+        return LLMResponseCache.make_key(self.model_name, self.temperature, self.system_prompt, rendered)
+    
     def _format_research(self, research: Dict[str, Any]) -> str:
         """Format research findings for the prompt."""
-        return f"""
+        formatted = f"""
 Legal Provisions Cited: {research.get('legal_provisions', [])}
 Merits Score: {research.get('merits_score', 'N/A')}/10
 Kerala-Specific Context: {research.get('kerala_specific', 'None')}
 """
+        if research.get("provision_texts"):
+            # Exact statute wording from the citation index (see orchestrator)
+            formatted += "Provision Text:\n" + "\n\n".join(
+                f"{citation}:\n{text}" for citation, text in research["provision_texts"].items()
+            ) + "\n"
+        return formatted
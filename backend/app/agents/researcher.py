@@ -4,12 +4,14 @@ Researcher Agent: Legal Analyst & Citation Expert.
 Identifies specific sections of Indian Law relevant to user grievances.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langsmith import traceable
 
+from ..utils.llm_cache import LLMResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,8 @@ class ResearcherAgent:
     Requires a system_prompt to be provided - no default prompt.
     """
     
-    def __init__(self, model_name: str = "gpt-4.1", temperature: float = 0.1, system_prompt: str = None):
+    def __init__(self, model_name: str = "gpt-4.1", temperature: float = 0.1, system_prompt: str = None,
+                 cache: Optional[LLMResponseCache] = None):
         """
         Initialize the Researcher Agent.
         
@@ -29,6 +32,7 @@ class ResearcherAgent:
             model_name: The LLM model to use for research
             temperature: Controls randomness (lower = more focused)
             system_prompt: Domain-specific system prompt (REQUIRED)
+            cache: Optional response cache; identical calls skip the LLM
             
         Raises:
             ValueError: If system_prompt is not provided
@@ -42,6 +46,9 @@ class ResearcherAgent:
         self.llm = ChatOpenAI(model=model_name, temperature=temperature)
         self.parser = JsonOutputParser()
         self.system_prompt = system_prompt
+        self.model_name = model_name
+        self.temperature = temperature
+        self.cache = cache
         
         # Domain-agnostic human message template
         self.prompt = ChatPromptTemplate.from_messages([
@@ -65,15 +72,30 @@ class ResearcherAgent:
         """
         logger.info("Researcher Agent: Starting analysis of grievance")
         
+        inputs = {
+            "grievance": grievance,
+            "rag_context": rag_context or "No additional context provided."
+        }
+        cache_key = self._cache_key(inputs) if self.cache else None
+        if cache_key:
+            cached = await self.cache.aget(cache_key)
+            if cached is not None:
+                logger.info("Researcher Agent: Returning cached analysis")
+                return cached
+        
         try:
-            result = await self.chain.ainvoke({
-                "grievance": grievance,
-                "rag_context": rag_context or "No additional context provided."
-            })
+            result = await self.chain.ainvoke(inputs)
             
             logger.info(f"Researcher Agent: Analysis complete. Merits score: {result.get('merits_score', 'N/A')}")
+            if cache_key:
+                await self.cache.aset(cache_key, result)
             return result
             
         except Exception as e:
             logger.error(f"Researcher Agent: Error during analysis - {str(e)}")
             raise
+    
+    def _cache_key(self, inputs: Dict[str, Any]) -> str:
+        """Content-addressed cache key for the rendered prompt."""
+        rendered = self.prompt.format_messages(**inputs)[-1].content
+        return LLMResponseCache.make_key(self.model_name, self.temperature, self.system_prompt, rendered)
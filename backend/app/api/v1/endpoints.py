@@ -1,8 +1,10 @@
 """API v1 Endpoints for Legal Aid Generation."""
+import asyncio
+import json
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from ...models.schemas import (
     LegalAidRequest, 
@@ -10,12 +12,20 @@ from ...models.schemas import (
     ResearchApprovalRequest,
     DraftReviewRequest,
     FinalizeRequest,
-    WorkflowStatusResponse
+    WorkflowStatusResponse,
+    JobStatusResponse
 )
-from ...services.orchestrator import LegalAidOrchestrator
+from ...services.orchestrator import AgentTrace
+from ...services.orchestrator_registry import orchestrator_registry
+from ...services.job_queue import job_queue, SUCCEEDED, FINISHED_STATES
 from ...services.workflow_state import WorkflowState
 from ...services.transcription_state import TranscriptionState
 from ...services.translation_service import TranslationService
+from ...utils.llm_cache import llm_cache
+from ...services.research_cache import research_cache
+from src.embedding import query_embedding_cache
+from config.domain_loader import DomainLoader
+from src.executors import get_executor_stats
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +65,7 @@ async def generate_legal_aid(request: LegalAidRequest) -> LegalAidResponse:
     try:
         logger.info(f"Received request for domain '{request.domain}': {request.grievance[:100]}...")
         
-        orchestrator = LegalAidOrchestrator(domain=request.domain)
+        orchestrator = await orchestrator_registry.get(request.domain)
         result = await orchestrator.generate_legal_aid(grievance=request.grievance)
         
         logger.info(f"Generation complete. Status: {result['status']}")
@@ -75,6 +85,185 @@ async def generate_legal_aid(request: LegalAidRequest) -> LegalAidResponse:
         )
 
 
+def _format_sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post(
+    "/generate-legal-aid/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Generate Legal Aid Document (Streaming)",
+    description="""
+    Streaming variant of /generate-legal-aid using Server-Sent Events.
+    
+    Events:
+    - started: emitted immediately once the request is accepted
+    - trace: one AgentTraceItem per agent action, as it happens
+    - token: drafter output as it is generated ({"text": ...}); a new draft
+      starts after each creating_initial_draft / refining_draft_iteration_N trace
+    - result: the complete LegalAidResponse
+    - error: generation failed ({"detail": ...})
+    """
+)
+async def generate_legal_aid_stream(request: LegalAidRequest) -> StreamingResponse:
+    """
+    Stream agent traces and draft tokens while the legal aid document is generated.
+    
+    Args:
+        request: Contains the user's grievance and domain
+        
+    Returns:
+        text/event-stream response ending with a result or error event
+        
+    Raises:
+        HTTPException: If the domain does not exist
+    """
+    logger.info(f"Received streaming request for domain '{request.domain}': {request.grievance[:100]}...")
+    
+    try:
+        orchestrator = await orchestrator_registry.get(request.domain)
+    except FileNotFoundError as e:
+        logger.error(f"Domain not found: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    
+    events: asyncio.Queue = asyncio.Queue()
+    trace = AgentTrace(listener=lambda entry: events.put_nowait(("trace", entry)))
+    
+    async def run_workflow():
+        try:
+            result = await orchestrator.generate_legal_aid(
+                grievance=request.grievance,
+                trace=trace,
+                on_token=lambda token: events.put_nowait(("token", {"text": token}))
+            )
+            logger.info(f"Streaming generation complete. Status: {result['status']}")
+            events.put_nowait(("result", LegalAidResponse(**result).model_dump()))
+        except Exception as e:
+            logger.error(f"Error generating document: {str(e)}", exc_info=True)
+            events.put_nowait(("error", {"detail": f"Failed to generate document: {str(e)}"}))
+        finally:
+            events.put_nowait(None)
+    
+    async def event_stream():
+        workflow = asyncio.create_task(run_workflow())
+        try:
+            yield _format_sse("started", {"domain": request.domain})
+            while True:
+                item = await events.get()
+                if item is None:
+                    break
+                yield _format_sse(*item)
+        finally:
+            # Client disconnected before the workflow finished
+            if not workflow.done():
+                workflow.cancel()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# ===== ASYNCHRONOUS JOB ENDPOINTS =====
+
+async def _run_legal_aid_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler: run the full legal aid workflow for a queued request."""
+    orchestrator = await orchestrator_registry.get(payload["domain"])
+    result = await orchestrator.generate_legal_aid(grievance=payload["grievance"])
+    return LegalAidResponse(**result).model_dump()
+
+
+job_queue.register_handler("generate_legal_aid", _run_legal_aid_job)
+
+
+async def _get_job_or_404(job_id: str) -> Dict[str, Any]:
+    job = await job_queue.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+    return job
+
+
+@router.post(
+    "/jobs/generate-legal-aid",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["jobs"],
+    summary="Submit Legal Aid Generation Job",
+    description="Queue /generate-legal-aid as a background job and return immediately with a job ID"
+)
+async def submit_legal_aid_job(request: LegalAidRequest) -> JobStatusResponse:
+    """Queue a full legal aid generation and return the job status."""
+    try:
+        DomainLoader.load_domain(request.domain)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    job = await job_queue.submit(
+        "generate_legal_aid",
+        {"grievance": request.grievance, "domain": request.domain}
+    )
+    return JobStatusResponse(**job)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["jobs"],
+    summary="Get Job Status",
+    description="Poll the status of a submitted job"
+)
+async def get_job_status(job_id: str) -> JobStatusResponse:
+    """Get current job status."""
+    return JobStatusResponse(**await _get_job_or_404(job_id))
+
+
+@router.get(
+    "/jobs/{job_id}/result",
+    response_model=LegalAidResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["jobs"],
+    summary="Get Job Result",
+    description="Fetch the result of a succeeded job (409 while queued/running or if it failed/was cancelled)"
+)
+async def get_job_result(job_id: str) -> LegalAidResponse:
+    """Get the legal aid document produced by a job."""
+    job = await _get_job_or_404(job_id)
+    if job["status"] != SUCCEEDED:
+        detail = f"Job {job_id} is {job['status']}"
+        if job["error"]:
+            detail += f": {job['error']}"
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    return LegalAidResponse(**job["result"])
+
+
+@router.delete(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["jobs"],
+    summary="Cancel Job",
+    description="Cancel a queued or running job"
+)
+async def cancel_job(job_id: str) -> JobStatusResponse:
+    """Cancel a job that has not finished yet."""
+    job = await _get_job_or_404(job_id)
+    if job["status"] in FINISHED_STATES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} already {job['status']}"
+        )
+    return JobStatusResponse(**await job_queue.cancel(job_id))
+
+
 @router.get(
     "/domains",
     status_code=status.HTTP_200_OK,
@@ -118,6 +307,24 @@ async def health_check():
     )
 
 
+@router.get(
+    "/performance-stats",
+    status_code=status.HTTP_200_OK,
+    summary="Performance Statistics",
+    description="Report warm-orchestrator reuse, executor queue depth and wait times, job queue load and cache hit rates"
+)
+async def performance_stats() -> Dict:
+    """Get performance statistics for the request path."""
+    return {
+        "orchestrators": orchestrator_registry.get_stats(),
+        "executors": get_executor_stats(),
+        "jobs": job_queue.get_stats(),
+        "llm_cache": llm_cache.get_stats(),
+        "research_cache": research_cache.get_stats(),
+        "query_embeddings": query_embedding_cache.get_stats()
+    }
+
+
 # ===== HUMAN-IN-THE-LOOP ENDPOINTS =====
 
 @router.post(
@@ -138,7 +345,7 @@ async def start_legal_aid(request: LegalAidRequest) -> Dict:
         if was_translated:
             logger.info("Input was translated from regional language to English")
         
-        orchestrator = LegalAidOrchestrator()
+        orchestrator = await orchestrator_registry.get()
         result = await orchestrator.start_research(translated_text)
         result["is_approved"] = request.is_approved
         result["was_translated"] = was_translated
@@ -167,7 +374,7 @@ async def approve_research(request: ResearchApprovalRequest) -> Dict:
         if not session:
             raise ValueError(f"Session {request.session_id} not found")
         domain = session.get("domain", "legal_ai")
-        orchestrator = LegalAidOrchestrator(domain=domain)
+        orchestrator = await orchestrator_registry.get(domain)
         if request.is_approved:
             logger.info(f"Research approved for session: {request.session_id}")
             result = await orchestrator.continue_with_draft(
@@ -219,7 +426,7 @@ async def review_draft(request: DraftReviewRequest) -> Dict:
             raise ValueError(f"Session {request.session_id} not found")
         
         domain = session.get("domain", "legal_ai")
-        orchestrator = LegalAidOrchestrator(domain=domain)
+        orchestrator = await orchestrator_registry.get(domain)
         result = await orchestrator.refine_draft(
             request.session_id,
             request.feedback
@@ -259,7 +466,7 @@ async def finalize_legal_aid(request: FinalizeRequest) -> LegalAidResponse:
             raise ValueError(f"Session {request.session_id} not found")
         
         domain = session.get("domain", "legal_ai")
-        orchestrator = LegalAidOrchestrator(domain=domain)
+        orchestrator = await orchestrator_registry.get(domain)
         result = await orchestrator.finalize_workflow(request.session_id)
         
         logger.info(f"Workflow finalized for session: {request.session_id}")
@@ -0,0 +1,44 @@
+"""Configuration for request-path performance features."""
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_list(name: str, default: str = "") -> list:
+    """Parse a comma-separated environment variable into a list of names."""
+    raw = os.getenv(name, default)
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+class PerformanceConfig:
+    """Tunables for warm-up, concurrency and caching of the legal-aid pipeline."""
+
+    # Orchestrator Registry
+    # Domains to build at startup. Empty = every domain in config/domains.
+    WARM_DOMAINS: list = _env_list("WARM_DOMAINS")
+
+    # Context Gathering (per-source timeouts, seconds)
+    RAG_CONTEXT_TIMEOUT: float = float(os.getenv("RAG_CONTEXT_TIMEOUT", "20"))
+    WEB_CONTEXT_TIMEOUT: float = float(os.getenv("WEB_CONTEXT_TIMEOUT", "15"))
+
+    # Job Queue
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_JOURNAL_PATH: str = os.getenv("JOB_JOURNAL_PATH", "data/jobs.db")
+
+    # LLM Response Cache (per-domain bypass: "use_llm_cache" in the domain JSON)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+    LLM_CACHE_TTL_SECONDS: float = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", "data/llm_cache.db")
+
+    # Semantic Research Cache (near-duplicate grievances reuse research findings)
+    RESEARCH_CACHE_ENABLED: bool = os.getenv("RESEARCH_CACHE_ENABLED", "true").lower() == "true"
+    RESEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("RESEARCH_CACHE_MAX_ENTRIES", "256"))
+    RESEARCH_CACHE_THRESHOLD: float = float(os.getenv("RESEARCH_CACHE_THRESHOLD", "0.92"))
+    RESEARCH_CACHE_MODEL: str = os.getenv("RESEARCH_CACHE_MODEL", "all-MiniLM-L6-v2")
+
+
+# Create singleton instance
+performance_config = PerformanceConfig()
@@ -2,11 +2,16 @@
 
 import logging
 import socketio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.endpoints import router
 from app.sockets.transcription_handlers import register_transcription_handlers
+from app.services.orchestrator_registry import orchestrator_registry
+from app.services.job_queue import job_queue
+from app.config.performance_config import performance_config
+from src.executors import shutdown_executors
 
 # Configure logging
 logging.basicConfig(
@@ -25,11 +30,25 @@ sio = socketio.AsyncServer(
     engineio_logger=True
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build shared resources once at startup and release them on shutdown."""
+    await orchestrator_registry.warm_up(performance_config.WARM_DOMAINS)
+    logger.info("Orchestrator registry warmed up")
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    orchestrator_registry.clear()
+    shutdown_executors(wait=False)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Nyaya-Flow Legal Aid API",
     description="Multi-agent AI system for generating legal aid documents with real-time transcription",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
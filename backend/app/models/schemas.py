@@ -128,3 +128,14 @@ class WorkflowStatusResponse(BaseModel):
     stage: str
     message: str
     data: Optional[Dict[str, Any]] = None
+
+
+class JobStatusResponse(BaseModel):
+    """Status of an asynchronous job."""
+    
+    job_id: str = Field(..., description="Job ID used for polling and cancellation")
+    kind: str = Field(..., description="Job type (e.g., generate_legal_aid)")
+    status: str = Field(..., description="queued, running, succeeded, failed or cancelled")
+    error: Optional[str] = Field(None, description="Failure reason if status is failed")
+    created_at: str = Field(..., description="ISO timestamp of submission")
+    updated_at: str = Field(..., description="ISO timestamp of the last status change")
@@ -0,0 +1,296 @@
+"""
+Job Queue: Asynchronous execution of long-running workflows.
+
+Clients submit a job, poll its status and fetch the result later instead of
+holding an HTTP connection open for the whole multi-agent loop. Jobs run on a
+fixed number of in-process worker tasks and every state change is written to
+a SQLite journal, so queued and finished jobs survive restarts. Jobs that were
+running when the process stopped are re-queued on the next start.
+"""
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Any, Optional, Callable, Awaitable, Set
+from uuid import uuid4
+
+from src.executors import run_io
+from ..config.performance_config import performance_config
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobQueue:
+    """
+    In-process worker pool backed by a durable SQLite journal.
+
+    Handlers are registered per job kind and receive the job payload; their
+    return value is stored as the job result.
+    """
+
+    def __init__(self, db_path: str, concurrency: int = 2):
+        """
+        Args:
+            db_path: Path of the SQLite journal file
+            concurrency: Number of jobs executed at the same time
+        """
+        self.db_path = db_path
+        self.concurrency = max(1, concurrency)
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._queued: Set[str] = set()
+        self._claiming: Set[str] = set()
+        self._cancel_requested: Set[str] = set()
+        self._stopping = False
+        self._schema_ready = False
+
+    # ----- Journal (blocking; always called through run_io) -----
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the journal, creating it on first use."""
+        if not self._schema_ready:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        if not self._schema_ready:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+            self._schema_ready = True
+        return conn
+
+    def _recover(self) -> list:
+        """Re-queue jobs interrupted by a shutdown and return all queued IDs in order."""
+        conn = self._connect()
+        conn.execute(
+            "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?",
+            (QUEUED, datetime.utcnow().isoformat(), RUNNING)
+        )
+        conn.commit()
+        rows = conn.execute(
+            "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+        ).fetchall()
+        conn.close()
+        return [row["job_id"] for row in rows]
+
+    def _insert(self, job: Dict[str, Any]):
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO jobs (job_id, kind, payload, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (job["job_id"], job["kind"], json.dumps(job["payload"]), job["status"],
+             job["created_at"], job["updated_at"])
+        )
+        conn.commit()
+        conn.close()
+
+    def _transition(self, job_id: str, from_status: str, to_status: str,
+                    result: Any = None, error: str = None) -> bool:
+        """Move a job to a new status only if it is still in from_status.
+
+        The check and the write are a single UPDATE, so two coroutines racing
+        on the same job (a worker claiming it, a client cancelling it) cannot
+        both win. Returns True if this call changed the job.
+        """
+        conn = self._connect()
+        cursor = conn.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ? AND status = ?",
+            (to_status, json.dumps(result) if result is not None else None, error,
+             datetime.utcnow().isoformat(), job_id, from_status)
+        )
+        conn.commit()
+        changed = cursor.rowcount == 1
+        conn.close()
+        return changed
+
+    def _fetch(self, job_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        conn.close()
+        if not row:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    # ----- Lifecycle -----
+
+    def register_handler(self, kind: str, handler: JobHandler):
+        """Register the coroutine that executes jobs of the given kind."""
+        self._handlers[kind] = handler
+
+    async def start(self):
+        """Open the journal, restore pending jobs and start the workers.
+        
+        The in-memory queue is rebuilt from the journal, so jobs submitted
+        before start() (or left over from a previous process) run exactly once.
+        """
+        self._stopping = False
+        self._queue = asyncio.Queue()
+        self._queued = set()
+        pending = await run_io(self._recover)
+        for job_id in pending:
+            self._queue.put_nowait(job_id)
+            self._queued.add(job_id)
+
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        logger.info(f"Job queue started with {self.concurrency} workers ({len(pending)} pending jobs restored)")
+
+    async def stop(self):
+        """Stop the workers; running jobs stay in the journal and resume on restart."""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Job queue stopped")
+
+    # ----- Public API -----
+
+    async def submit(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Journal a new job and queue it for execution.
+
+        Args:
+            kind: Registered job kind (e.g., "generate_legal_aid")
+            payload: JSON-serializable handler input
+
+        Returns:
+            The created job record
+
+        Raises:
+            ValueError: If no handler is registered for the kind
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        now = datetime.utcnow().isoformat()
+        job = {
+            "job_id": str(uuid4()),
+            "kind": kind,
+            "payload": payload,
+            "status": QUEUED,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        await run_io(self._insert, job)
+        self._queue.put_nowait(job["job_id"])
+        self._queued.add(job["job_id"])
+        logger.info(f"Queued job {job['job_id']} ({kind})")
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the journaled job record, or None if unknown."""
+        return await run_io(self._fetch, job_id)
+
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued or running job.
+
+        Returns:
+            The updated job record, or None if the job does not exist.
+            Finished jobs are returned unchanged.
+        """
+        job = await self.get(job_id)
+        if not job or job["status"] in FINISHED_STATES:
+            return job
+
+        if job_id not in self._running and await run_io(self._transition, job_id, QUEUED, CANCELLED):
+            self._queued.discard(job_id)
+        elif job_id in self._running:
+            task = self._running[job_id]
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await run_io(self._transition, job_id, RUNNING, CANCELLED)
+        elif job_id in self._claiming:
+            # A worker claimed the job while we were checking it but has not
+            # started the handler yet; it looks at this set before doing so.
+            self._cancel_requested.add(job_id)
+            await run_io(self._transition, job_id, RUNNING, CANCELLED)
+        logger.info(f"Cancelled job {job_id}")
+        return await self.get(job_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return worker and queue statistics."""
+        return {
+            "workers": self.concurrency,
+            "running": len(self._running),
+            "queued": len(self._queued),
+        }
+
+    # ----- Worker -----
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            job = await self.get(job_id)
+            # Skip jobs cancelled while waiting in the queue
+            if not job or job["status"] != QUEUED:
+                continue
+
+            handler = self._handlers.get(job["kind"])
+            if handler is None:
+                await run_io(self._transition, job_id, QUEUED, FAILED, None, f"Unknown job kind: {job['kind']}")
+                continue
+
+            # Claim the job atomically; a cancel() that got there first wins
+            self._claiming.add(job_id)
+            try:
+                claimed = await run_io(self._transition, job_id, QUEUED, RUNNING)
+            finally:
+                self._claiming.discard(job_id)
+            cancel_requested = job_id in self._cancel_requested
+            self._cancel_requested.discard(job_id)
+            if not claimed:
+                continue
+            if cancel_requested:
+                await run_io(self._transition, job_id, RUNNING, CANCELLED)
+                continue
+
+            task = asyncio.create_task(handler(job["payload"]))
+            self._running[job_id] = task
+            try:
+                result = await task
+                await run_io(self._transition, job_id, RUNNING, SUCCEEDED, result)
+                logger.info(f"Job {job_id} succeeded")
+            except asyncio.CancelledError:
+                if self._stopping:
+                    # Leave the job marked running so it is re-queued on restart
+                    task.cancel()
+                    raise
+                await run_io(self._transition, job_id, RUNNING, CANCELLED)
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+                await run_io(self._transition, job_id, RUNNING, FAILED, None, str(e))
+            finally:
+                self._running.pop(job_id, None)
+
+
+# Create singleton instance
+job_queue = JobQueue(performance_config.JOB_JOURNAL_PATH, performance_config.JOB_WORKERS)
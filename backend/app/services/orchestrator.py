@@ -8,8 +8,10 @@ Implements an iterative self-correction loop with three agents:
 
 The orchestrator manages the feedback loop, ensuring quality output.
 """
+import asyncio
 import logging
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 from langsmith import traceable
 
@@ -17,10 +19,14 @@ from ..agents.researcher import ResearcherAgent
 from ..agents.drafter import DrafterAgent
 from ..agents.expert_reviewer import ExpertReviewerAgent
 from src.search import RAGSearch
+from src.executors import run_io
 from tools.tavily_tool import create_tavily_search_tool, TavilySearchConfig
 from .workflow_state import WorkflowState
+from .research_cache import research_cache
 from ..utils.pii_redactor import pii_redactor
+from ..utils.llm_cache import llm_cache
 from config.domain_loader import DomainLoader
+from ..config.performance_config import performance_config
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +34,14 @@ logger = logging.getLogger(__name__)
 class AgentTrace:
     """Captures the reasoning trace of each agent for frontend display."""
     
-    def __init__(self):
+    def __init__(self, listener: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Args:
+            listener: Optional callback invoked with each entry as it is added
+                      (used to stream traces to the client)
+        """
         self.traces: List[Dict[str, Any]] = []
+        self.listener = listener
     
     def add(self, agent: str, action: str, details: str, timestamp: str = None):
         """
@@ -41,13 +53,16 @@ class AgentTrace:
             details: Detailed description of what the agent is doing
             timestamp: ISO timestamp (auto-generated if not provided)
         """
-        self.traces.append({
+        entry = {
             "agent": agent,
             "action": action,
             "details": details,
             "timestamp": timestamp or datetime.utcnow().isoformat()
-        })
+        }
+        self.traces.append(entry)
         logger.info(f"[{agent}] {action}: {details}")
+        if self.listener:
+            self.listener(entry)
     
     def to_dict(self) -> List[Dict[str, Any]]:
         """Return all traces as a list of dictionaries."""
@@ -82,13 +97,14 @@ class LegalAidOrchestrator:
         self.domain_config = DomainLoader.load_domain(domain)
         self.domain = domain
         
-        # Initialize agents with domain-specific prompts
-        self.researcher = ResearcherAgent(system_prompt=self.domain_config.researcher_prompt)
-        self.drafter = DrafterAgent(system_prompt=self.domain_config.drafter_prompt)
-        self.expert_reviewer = ExpertReviewerAgent(system_prompt=self.domain_config.reviewer_prompt)
+        # Initialize agents with domain-specific prompts (response cache unless the domain opts out)
+        cache = llm_cache if self.domain_config.use_llm_cache else None
+        self.researcher = ResearcherAgent(system_prompt=self.domain_config.researcher_prompt, cache=cache)
+        self.drafter = DrafterAgent(system_prompt=self.domain_config.drafter_prompt, cache=cache)
+        self.expert_reviewer = ExpertReviewerAgent(system_prompt=self.domain_config.reviewer_prompt, cache=cache)
         
         # Initialize RAG search (only used if domain requires it)
-        self.rag_search = RAGSearch() if self.domain_config.use_rag else None
+        self.rag_search = RAGSearch(shards=self.domain_config.rag_shards or None) if self.domain_config.use_rag else None
         
         # Initialize domain-specific Tavily search tool
         if self.domain_config.use_web_search and self.domain_config.search_config:
@@ -107,11 +123,31 @@ class LegalAidOrchestrator:
         logger.info(f"LegalAidOrchestrator initialized for domain: {self.domain_config.display_name}")
         logger.info(f"RAG enabled: {self.domain_config.use_rag}, Web search enabled: {self.domain_config.use_web_search}")
     
+    def close(self):
+        """Release resources held by the RAG search (e.g. shard search threads)."""
+        if self.rag_search:
+            self.rag_search.close()
+    
+    async def _search_local(self, grievance: str) -> str:
+        """RAG lookup: FAISS search plus Groq summarization on the I/O pool."""
+        local_context = await self.rag_search.asearch_and_summarize(grievance, top_k=3)
+        return f"LOCAL DOCUMENTS:\n{local_context}"
+    
+    async def _search_web(self, grievance: str) -> Dict[str, Any]:
+        """Tavily lookup; the synchronous client runs on the I/O pool."""
+        return await run_io(self.tavily_search, grievance)
+    
     @traceable(name="context_gathering")
     async def _gather_context(self, grievance: str, trace: AgentTrace) -> str:
         """
         Gather context from both local documents and web sources.
         
+        Both sources are blocking, so each runs on the shared I/O executor and
+        the two are awaited concurrently under their own timeout. Whatever arrives in
+        time is used; sources that miss their deadline are recorded in the
+        trace and replaced by a placeholder. Context latency is therefore
+        max(RAG, web) rather than their sum.
+        
         Args:
             grievance: The user's query/issue
             trace: Agent trace for logging
@@ -119,7 +155,8 @@ class LegalAidOrchestrator:
         Returns:
             Combined context from RAG and Tavily searches
         """
-        contexts = []
+        started = time.perf_counter()
+        sources = {}
         
         # 1. RAG Search for local documents (if enabled for this domain)
         if self.domain_config.use_rag and self.rag_search:
@@ -128,17 +165,10 @@ class LegalAidOrchestrator:
                 "gathering_rag_context",
                 "Searching local document store (RAG)"
             )
-            try:
-                local_context = self.rag_search.search_and_summarize(grievance, top_k=3)
-                contexts.append(f"LOCAL DOCUMENTS:\n{local_context}")
-                trace.add(
-                    "rag_search",
-                    "local_search_complete",
-                    f"Retrieved {len(local_context)} characters from local documents"
-                )
-            except Exception as e:
-                logger.warning(f"RAG search failed: {e}")
-                contexts.append("LOCAL DOCUMENTS: No local documents found.")
+            sources["rag"] = asyncio.wait_for(
+                self._search_local(grievance),
+                timeout=performance_config.RAG_CONTEXT_TIMEOUT
+            )
         
         # 2. Tavily Search for online resources (if enabled for this domain)
         if self.domain_config.use_web_search and self.tavily_search:
@@ -147,8 +177,50 @@ class LegalAidOrchestrator:
                 "gathering_web_context",
                 "Searching online resources (Tavily)"
             )
-            try:
-                tavily_results = self.tavily_search(grievance)
+            sources["web"] = asyncio.wait_for(
+                self._search_web(grievance),
+                timeout=performance_config.WEB_CONTEXT_TIMEOUT
+            )
+        
+        outcomes = dict(zip(sources, await asyncio.gather(*sources.values(), return_exceptions=True)))
+        contexts = []
+        late_sources = []
+        
+        if "rag" in outcomes:
+            local_context = outcomes["rag"]
+            if isinstance(local_context, asyncio.TimeoutError):
+                late_sources.append("rag")
+                trace.add(
+                    "orchestrator",
+                    "rag_search_timeout",
+                    f"Local document search exceeded {performance_config.RAG_CONTEXT_TIMEOUT}s; continuing without it"
+                )
+                contexts.append("LOCAL DOCUMENTS: No local documents found.")
+            elif isinstance(local_context, Exception):
+                logger.warning(f"RAG search failed: {local_context}")
+                contexts.append("LOCAL DOCUMENTS: No local documents found.")
+            else:
+                contexts.append(local_context)
+                trace.add(
+                    "rag_search",
+                    "local_search_complete",
+                    f"Retrieved {len(local_context)} characters from local documents"
+                )
+        
+        if "web" in outcomes:
+            tavily_results = outcomes["web"]
+            if isinstance(tavily_results, asyncio.TimeoutError):
+                late_sources.append("web")
+                trace.add(
+                    "orchestrator",
+                    "web_search_timeout",
+                    f"Online search exceeded {performance_config.WEB_CONTEXT_TIMEOUT}s; continuing without it"
+                )
+                contexts.append("ONLINE RESOURCES: No online resources found.")
+            elif isinstance(tavily_results, Exception):
+                logger.warning(f"Tavily search failed: {tavily_results}")
+                contexts.append("ONLINE RESOURCES: No online resources found.")
+            else:
                 web_sources = tavily_results.get("sources", [])
                 web_context = "\n\n".join([f"{s['title']}: {s['content']}" for s in web_sources[:3]])
                 contexts.append(f"ONLINE RESOURCES:\n{web_context}")
@@ -157,21 +229,103 @@ class LegalAidOrchestrator:
                     "web_search_complete",
                     f"Found {tavily_results.get('total_results', 0)} relevant online sources"
                 )
-            except Exception as e:
-                logger.warning(f"Tavily search failed: {e}")
-                contexts.append("ONLINE RESOURCES: No online resources found.")
         
         # 3. Combine contexts
         combined = "\n\n".join(contexts) if contexts else "No additional context available."
         
+        late_note = f" Late sources: {', '.join(late_sources)}." if late_sources else ""
         trace.add(
             "orchestrator",
             "context_ready",
-            f"Context gathering complete. Total context: {len(combined)} characters"
+            f"Context gathering complete in {time.perf_counter() - started:.2f}s. "
+            f"Total context: {len(combined)} characters.{late_note}"
         )
         
         return combined
     
+    async def _research(
+        self,
+        grievance: str,
+        redacted_grievance: str,
+        trace: AgentTrace,
+        cacheable: bool = True
+    ) -> tuple:
+        """
+        Produce research findings, reusing those of a near-identical grievance.
+        
+        The semantic cache is keyed on the redacted grievance. On a hit, context
+        gathering and the research call are skipped entirely.
+        
+        Args:
+            grievance: Text sent to the agents
+            redacted_grievance: PII-free text used for the cache lookup
+            trace: Agent trace for logging
+            cacheable: Whether fresh findings may be stored for reuse
+            
+        Returns:
+            Tuple of (research_findings, rag_context)
+        """
+        # Embed with the RAG store's model when there is one, rather than loading a second copy
+        embed_query = self.rag_search.vectorstore.embed_query if self.rag_search else None
+        hit, embedding = await research_cache.lookup(self.domain, redacted_grievance, embed_query)
+        if hit:
+            trace.add(
+                "orchestrator",
+                "research_cache_hit",
+                f"Reusing research findings from a similar grievance (similarity {hit['similarity']}). "
+                f"Skipped context gathering and research."
+            )
+            return hit["research_findings"], hit["rag_context"]
+        
+        # Context Gathering
+        rag_context = await self._gather_context(grievance, trace)
+        
+        # Research Phase
+        trace.add(
+            "researcher",
+            "analyzing_grievance",
+            f"Scanning Indian legal statutes for provisions relevant to: '{grievance[:100]}...'"
+        )
+        
+        research_findings = await self.researcher.analyze(grievance, rag_context)
+        research_findings = self._attach_provision_texts(research_findings, trace)
+        
+        if cacheable:
+            await research_cache.save(self.domain, embedding, research_findings, rag_context)
+        
+        return research_findings, rag_context
+    
+    def _attach_provision_texts(self, research_findings: Dict[str, Any], trace: AgentTrace) -> Dict[str, Any]:
+        """
+        Add the indexed statute text of each provision the researcher cited.
+        
+        Citations resolve through the local citation index (dictionary lookups,
+        no embedding), so the drafter and reviewer see the exact wording.
+        
+        Args:
+            research_findings: Output from the Researcher Agent
+            trace: Agent trace for logging
+            
+        Returns:
+            Findings with a "provision_texts" mapping when any citation resolved
+        """
+        if not self.rag_search or not isinstance(research_findings, dict):
+            return research_findings
+        provisions = research_findings.get("legal_provisions") or []
+        try:
+            texts = self.rag_search.provision_texts("\n".join(str(p) for p in provisions))
+        except Exception as e:
+            logger.warning(f"Provision lookup failed: {e}")
+            return research_findings
+        if not texts:
+            return research_findings
+        trace.add(
+            "orchestrator",
+            "provisions_resolved",
+            f"Attached the text of {len(texts)} cited provisions from the citation index"
+        )
+        return {**research_findings, "provision_texts": texts}
+    
     @traceable(name="workflow_start_research")
     async def start_research(self, grievance: str) -> Dict[str, Any]:
         """Start workflow and return research findings for human review.
@@ -195,17 +349,8 @@ class LegalAidOrchestrator:
             f"Redacted {len(redaction_map)} PII items before sending to agents"
         )
         
-        # Context Gathering
-        rag_context = await self._gather_context(redacted_grievance, trace)
-        
-        # Research Phase
-        trace.add(
-            "researcher",
-            "analyzing_grievance",
-            f"Scanning Indian legal statutes for provisions relevant to: '{redacted_grievance[:100]}...'"
-        )
-        
-        research_findings = await self.researcher.analyze(redacted_grievance, rag_context)
+        # Context Gathering and Research (served from the semantic cache when possible)
+        research_findings, rag_context = await self._research(redacted_grievance, redacted_grievance, trace)
         
         trace.add(
             "researcher",
@@ -454,7 +599,12 @@ class LegalAidOrchestrator:
         return result
     
     @traceable(name="full_legal_aid_workflow")
-    async def generate_legal_aid(self, grievance: str) -> Dict[str, Any]:
+    async def generate_legal_aid(
+        self,
+        grievance: str,
+        trace: Optional[AgentTrace] = None,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """
         Generate a legal aid document through multi-agent collaboration.
         
@@ -467,6 +617,8 @@ class LegalAidOrchestrator:
         
         Args:
             grievance: The user's plain-text description of their legal issue
+            trace: Optional trace to record into (e.g. one with a streaming listener)
+            on_token: Optional callback receiving drafter tokens as they are generated
             
         Returns:
             Dictionary containing:
@@ -477,20 +629,15 @@ class LegalAidOrchestrator:
             - iterations: Number of refinement cycles performed
             - status: "approved" or "max_iterations_reached"
         """
-        trace = AgentTrace()
+        trace = trace or AgentTrace()
         
-        # Phase 0: Context Gathering
-        rag_context = await self._gather_context(grievance, trace)
-        
-        # Phase 1: Research
-        trace.add(
-            "researcher", 
-            "analyzing_grievance",
-            f"Scanning Indian legal statutes for provisions relevant to: '{grievance[:100]}...'"
+        # Phase 0 + 1: Context Gathering and Research. Agents see the original
+        # grievance here, so fresh findings are only cached when it has no PII.
+        redacted_grievance, redaction_map = pii_redactor.redact(grievance)
+        research_findings, rag_context = await self._research(
+            grievance, redacted_grievance, trace, cacheable=not redaction_map
         )
         
-        research_findings = await self.researcher.analyze(grievance, rag_context)
-        
         trace.add(
             "researcher",
             "research_complete",
@@ -523,7 +670,7 @@ class LegalAidOrchestrator:
                     f"Addressing expert feedback: {feedback[:150]}..."
                 )
             
-            draft = await self.drafter.draft(grievance, research_findings, feedback)
+            draft = await self.drafter.draft(grievance, research_findings, feedback, on_token=on_token)
             
             trace.add(
                 "drafter",
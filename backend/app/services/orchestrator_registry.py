@@ -0,0 +1,166 @@
+"""
+Orchestrator Registry: Process-wide cache of warm orchestrators.
+
+Building a LegalAidOrchestrator re-reads the domain JSON, constructs three
+ChatOpenAI agents and, for RAG domains, loads the FAISS index, metadata and
+the SentenceTransformer model from disk. The registry performs that work once
+per domain (at application startup via the FastAPI lifespan hook, or lazily on
+first use) and hands the same instance to every request.
+
+Sharing is safe because the orchestrator keeps no per-request state: traces
+are created per call and workflow data lives in WorkflowState.
+"""
+import asyncio
+import logging
+import os
+import resource
+import sys
+import time
+from typing import Dict, Any, List, Optional
+
+from .orchestrator import LegalAidOrchestrator
+from config.domain_loader import DomainLoader
+from src.executors import run_io
+
+logger = logging.getLogger(__name__)
+
+
+def _current_rss_mb() -> float:
+    """Return the resident set size of this process in megabytes."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        # Fallback: peak RSS (kilobytes on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak / divisor
+
+
+class OrchestratorRegistry:
+    """
+    Keeps one LegalAidOrchestrator per domain for the lifetime of the process.
+
+    Each domain is built at most once; concurrent first requests for the same
+    domain wait on a per-domain lock instead of building duplicates. Build cost
+    (wall time and RSS growth) is recorded so the registry can report how much
+    work every served request avoided.
+    """
+
+    def __init__(self):
+        self._orchestrators: Dict[str, LegalAidOrchestrator] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _lock_for(self, domain: str) -> asyncio.Lock:
+        """Return the build lock for a domain, creating it on first use."""
+        if domain not in self._locks:
+            self._locks[domain] = asyncio.Lock()
+        return self._locks[domain]
+
+    async def get(self, domain: str = "legal_ai") -> LegalAidOrchestrator:
+        """
+        Return the warm orchestrator for a domain, building it if needed.
+
+        Args:
+            domain: Domain name (e.g., "legal_ai", "product_comparison")
+
+        Returns:
+            Shared LegalAidOrchestrator instance
+
+        Raises:
+            FileNotFoundError: If the domain configuration does not exist
+        """
+        orchestrator = await self._ensure(domain)
+        self._stats[domain]["requests_served"] += 1
+        return orchestrator
+
+    async def _ensure(self, domain: str) -> LegalAidOrchestrator:
+        """Return the cached orchestrator, building it under the domain lock."""
+        orchestrator = self._orchestrators.get(domain)
+        if orchestrator is None:
+            async with self._lock_for(domain):
+                orchestrator = self._orchestrators.get(domain)
+                if orchestrator is None:
+                    orchestrator = await self._build(domain)
+        return orchestrator
+
+    async def _build(self, domain: str) -> LegalAidOrchestrator:
+        """Construct an orchestrator off the event loop and record its cost."""
+        rss_before = _current_rss_mb()
+        started = time.perf_counter()
+
+        orchestrator = await run_io(LegalAidOrchestrator, domain)
+
+        build_seconds = time.perf_counter() - started
+        build_memory_mb = max(_current_rss_mb() - rss_before, 0.0)
+
+        self._orchestrators[domain] = orchestrator
+        self._stats[domain] = {
+            "build_seconds": round(build_seconds, 3),
+            "build_memory_mb": round(build_memory_mb, 1),
+            "requests_served": 0,
+        }
+        logger.info(
+            f"Orchestrator for '{domain}' built in {build_seconds:.2f}s "
+            f"(+{build_memory_mb:.1f} MB RSS)"
+        )
+        return orchestrator
+
+    async def warm_up(self, domains: Optional[List[str]] = None):
+        """
+        Build orchestrators ahead of the first request.
+
+        Failures are logged and skipped so a misconfigured domain (e.g. a
+        missing API key) does not prevent the application from starting;
+        that domain will be retried lazily on first use.
+
+        Args:
+            domains: Domain names to build. Defaults to every available domain.
+        """
+        if not domains:
+            domains = [d["domain_name"] for d in DomainLoader.list_available_domains()]
+
+        for domain in domains:
+            try:
+                await self._ensure(domain)
+            except Exception as e:
+                logger.warning(f"Failed to warm orchestrator for '{domain}': {e}")
+
+    def clear(self):
+        """Close and drop all cached orchestrators (used on shutdown and in tests)."""
+        for domain, orchestrator in self._orchestrators.items():
+            try:
+                orchestrator.close()
+            except Exception as e:
+                logger.warning(f"Failed to close orchestrator for '{domain}': {e}")
+        self._orchestrators.clear()
+        self._locks.clear()
+        self._stats.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report build cost and the work avoided by reusing warm orchestrators.
+
+        Returns:
+            Dictionary keyed by domain with build time/memory, number of
+            requests served and the cumulative time and memory saved
+        """
+        domains = {}
+        for domain, stats in self._stats.items():
+            served = stats["requests_served"]
+            domains[domain] = {
+                **stats,
+                "saved_seconds_per_request": stats["build_seconds"],
+                "saved_memory_mb_per_request": stats["build_memory_mb"],
+                "total_saved_seconds": round(stats["build_seconds"] * served, 3),
+            }
+        return {
+            "domains": domains,
+            "rss_mb": round(_current_rss_mb(), 1),
+        }
+
+
+# Create singleton instance
+orchestrator_registry = OrchestratorRegistry()
@@ -0,0 +1,204 @@
+"""
+Research Cache: Semantic reuse of research findings.
+
+Near-identical grievances (defective phone, landlord deposit, RTI delay) would
+otherwise each pay for RAG, Tavily, a Groq summary and a research call. This
+cache embeds the redacted grievance and returns the findings of a previous
+grievance from the same domain when the cosine similarity is above a
+configurable threshold.
+
+Only redacted text is embedded and stored, so cached findings never carry a
+user's personal details into another user's session.
+
+Domains with RAG embed through their vector store (its already-loaded model and
+the shared query embedding cache); the cache only loads its own model for
+domains without one.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable
+from uuid import uuid4
+
+import numpy as np
+
+from src.executors import run_io
+from ..config.performance_config import performance_config
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchCache:
+    """
+    Bounded LRU of (domain, grievance embedding) -> research findings.
+
+    Entries are kept per domain; a lookup compares the query embedding with
+    every entry of that domain, which is cheap at the configured size.
+    """
+
+    def __init__(self, max_entries: int = 256, threshold: float = 0.92,
+                 embedding_model: str = "all-MiniLM-L6-v2", enabled: bool = True):
+        """
+        Args:
+            max_entries: Total entries across all domains before LRU eviction
+            threshold: Minimum cosine similarity for a hit
+            embedding_model: Sentence-transformer used to embed grievances
+                when the caller has no vector store to embed with
+            enabled: Global switch; when False every lookup is a miss
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self.enabled = enabled
+        self._model = None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dimensions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _get_model(self):
+        """Load the embedding model on first use."""
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.embedding_model)
+                logger.info(f"Research cache loaded embedding model: {self.embedding_model}")
+            return self._model
+
+    def embed(self, text: str, embed_query: Optional[Callable[[str], np.ndarray]] = None) -> np.ndarray:
+        """Return the L2-normalized embedding of text (blocking).
+
+        Args:
+            text: Text to embed
+            embed_query: Embedding function of a loaded vector store; the
+                cache's own model is used when omitted
+        """
+        if embed_query is not None:
+            vector = np.asarray(embed_query(text), dtype="float32")
+        else:
+            vector = self._get_model().encode([text])[0].astype("float32")
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def find(self, domain: str, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Return the most similar cached entry for the domain, or None.
+
+        Args:
+            domain: Domain the grievance belongs to
+            embedding: Normalized grievance embedding
+
+        Returns:
+            Dictionary with research_findings, rag_context and similarity on a hit
+        """
+        with self._lock:
+            best_key, best_score = None, -1.0
+            for key, entry in self._entries.items():
+                if entry["domain"] != domain:
+                    continue
+                score = float(np.dot(entry["embedding"], embedding))
+                if score > best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None or best_score < self.threshold:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(best_key)
+            entry = self._entries[best_key]
+            return {
+                "research_findings": entry["research_findings"],
+                "rag_context": entry["rag_context"],
+                "similarity": round(best_score, 4),
+            }
+
+    def store(self, domain: str, embedding: np.ndarray, research_findings: Dict[str, Any], rag_context: str):
+        """Add an entry, evicting the least recently used one when full."""
+        with self._lock:
+            self._dimensions.setdefault(domain, len(embedding))
+            self._entries[str(uuid4())] = {
+                "domain": domain,
+                "embedding": embedding,
+                "research_findings": research_findings,
+                "rag_context": rag_context,
+            }
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def lookup(self, domain: str, redacted_grievance: str,
+                     embed_query: Optional[Callable[[str], np.ndarray]] = None) -> tuple:
+        """
+        Embed the redacted grievance and look it up.
+
+        Args:
+            domain: Domain the grievance belongs to
+            redacted_grievance: PII-free grievance text
+            embed_query: Embedding function of the domain's vector store, so
+                its model is reused instead of loading another copy
+
+        Returns:
+            Tuple of (hit or None, embedding). The embedding is None when the
+            cache is disabled or embedding failed; pass it back to save() to
+            avoid re-embedding.
+
+        A failed embedding only skips the cache for this call. The cache is
+        disabled for good on configuration errors: sentence-transformers
+        missing, or embeddings whose dimension no longer matches the domain's
+        cached entries.
+        """
+        if not self.enabled:
+            return None, None
+        try:
+            embedding = await run_io(self.embed, redacted_grievance, embed_query)
+        except ImportError as e:
+            logger.error(f"Research cache disabled, no embedding model available: {e}")
+            self.enabled = False
+            return None, None
+        except Exception as e:
+            logger.warning(f"Research cache skipped, embedding failed: {e}")
+            return None, None
+        expected = self._dimensions.get(domain)
+        if expected is not None and len(embedding) != expected:
+            logger.error(f"Research cache disabled, {domain} embeddings are {len(embedding)}-d "
+                         f"but cached entries are {expected}-d")
+            self.enabled = False
+            return None, None
+        return self.find(domain, embedding), embedding
+
+    async def save(self, domain: str, embedding: Optional[np.ndarray],
+                   research_findings: Dict[str, Any], rag_context: str):
+        """Store findings for an embedding returned by lookup()."""
+        if not self.enabled or embedding is None:
+            return
+        self.store(domain, embedding, research_findings, rag_context)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._dimensions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and size."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "threshold": self.threshold,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Create singleton instance
+research_cache = ResearchCache(
+    max_entries=performance_config.RESEARCH_CACHE_MAX_ENTRIES,
+    threshold=performance_config.RESEARCH_CACHE_THRESHOLD,
+    embedding_model=performance_config.RESEARCH_CACHE_MODEL,
+    enabled=performance_config.RESEARCH_CACHE_ENABLED,
+)
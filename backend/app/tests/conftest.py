@@ -6,3 +6,17 @@ from pathlib import Path
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_research_cache():
+    """Keep the process-wide research cache from leaking findings between tests."""
+    from app.services.research_cache import research_cache
+    enabled = research_cache.enabled
+    research_cache.enabled = False
+    research_cache.clear()
+    yield research_cache
+    research_cache.enabled = enabled
+    research_cache.clear()
@@ -0,0 +1,148 @@
+"""Tests for the asynchronous job queue."""
+
+import asyncio
+import pytest
+from app.services.job_queue import JobQueue
+
+
+async def _wait_for_status(queue, job_id, status, timeout=2.0):
+    """Poll until the job reaches the given status."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        job = await queue.get(job_id)
+        if job["status"] == status:
+            return job
+        assert asyncio.get_running_loop().time() < deadline, f"job stuck in {job['status']}"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def queue(journal_path):
+    return JobQueue(journal_path, concurrency=2)
+
+
+class TestJobQueue:
+    """Test submit/poll/result/cancel and durability."""
+
+    @pytest.mark.asyncio
+    async def test_job_succeeds_with_result(self, queue):
+        async def echo(payload):
+            return {"grievance": payload["grievance"]}
+        queue.register_handler("echo", echo)
+        await queue.start()
+
+        job = await queue.submit("echo", {"grievance": "Landlord kept deposit"})
+        done = await _wait_for_status(queue, job["job_id"], "succeeded")
+        await queue.stop()
+
+        assert done["result"] == {"grievance": "Landlord kept deposit"}
+
+    @pytest.mark.asyncio
+    async def test_job_failure_is_recorded(self, queue):
+        async def fail(payload):
+            raise RuntimeError("LLM unavailable")
+        queue.register_handler("fail", fail)
+        await queue.start()
+
+        job = await queue.submit("fail", {})
+        done = await _wait_for_status(queue, job["job_id"], "failed")
+        await queue.stop()
+
+        assert "LLM unavailable" in done["error"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_rejected(self, queue):
+        await queue.start()
+
+        with pytest.raises(ValueError):
+            await queue.submit("missing", {})
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job(self, queue):
+        started = asyncio.Event()
+
+        async def slow(payload):
+            started.set()
+            await asyncio.sleep(10)
+        queue.register_handler("slow", slow)
+        await queue.start()
+
+        job = await queue.submit("slow", {})
+        await asyncio.wait_for(started.wait(), 2)
+        cancelled = await queue.cancel(job["job_id"])
+        await queue.stop()
+
+        assert cancelled["status"] == "cancelled"
+        assert queue.get_stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_job_never_runs(self, journal_path):
+        calls = []
+
+        async def record(payload):
+            calls.append(payload)
+            return {}
+        queue = JobQueue(journal_path, concurrency=1)
+        queue.register_handler("record", record)
+
+        job = await queue.submit("record", {"n": 1})
+        await queue.cancel(job["job_id"])
+        assert queue.get_stats()["queued"] == 0
+        await queue.start()
+        await asyncio.sleep(0.05)
+        await queue.stop()
+
+        assert calls == []
+        assert (await queue.get(job["job_id"]))["status"] == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_worker_reads_job_wins(self, queue):
+        calls = []
+
+        async def record(payload):
+            calls.append(payload)
+            return {}
+        queue.register_handler("record", record)
+        job = await queue.submit("record", {"n": 1})
+
+        # The worker sees the job as queued, then the client cancels it
+        # before the worker gets to start the handler.
+        read = queue.get
+        cancelled = {}
+
+        async def read_then_cancel(job_id):
+            snapshot = await read(job_id)
+            if "record" not in cancelled:
+                cancelled["record"] = None
+                cancelled["record"] = await queue.cancel(job_id)
+            return snapshot
+        queue.get = read_then_cancel
+        await queue.start()
+        await asyncio.sleep(0.05)
+        await queue.stop()
+
+        assert cancelled["record"]["status"] == "cancelled"
+        assert calls == []
+        assert (await read(job["job_id"]))["status"] == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_queued_jobs_survive_restart(self, journal_path):
+        async def echo(payload):
+            return payload
+        first = JobQueue(journal_path, concurrency=1)
+        first.register_handler("echo", echo)
+        job = await first.submit("echo", {"n": 1})
+
+        second = JobQueue(journal_path, concurrency=1)
+        second.register_handler("echo", echo)
+        await second.start()
+        done = await _wait_for_status(second, job["job_id"], "succeeded")
+        await second.stop()
+
+        assert done["result"] == {"n": 1}
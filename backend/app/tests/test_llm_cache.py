@@ -0,0 +1,103 @@
+"""Tests for the LLM response cache."""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from app.utils.llm_cache import LLMResponseCache
+
+
+class TestLLMResponseCache:
+    """Test cache keys, tiers, eviction and expiry."""
+
+    def test_key_depends_on_every_component(self):
+        base = LLMResponseCache.make_key("gpt-4.1", 0.1, "system", "input")
+
+        assert base == LLMResponseCache.make_key("gpt-4.1", 0.1, "system", "input")
+        assert base != LLMResponseCache.make_key("gpt-4.1-mini", 0.1, "system", "input")
+        assert base != LLMResponseCache.make_key("gpt-4.1", 0.2, "system", "input")
+        assert base != LLMResponseCache.make_key("gpt-4.1", 0.1, "other system", "input")
+        assert base != LLMResponseCache.make_key("gpt-4.1", 0.1, "system", "other input")
+
+    def test_memory_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")  # "a" becomes most recently used
+        cache.set("c", {"v": 3})
+
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("b") is None
+        assert cache.get("c") == {"v": 3}
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        db_path = str(tmp_path / "llm_cache.db")
+        LLMResponseCache(db_path=db_path).set("key", "cached draft")
+
+        restarted = LLMResponseCache(db_path=db_path)
+
+        assert restarted.get("key") == "cached draft"
+        assert restarted.get_stats()["disk_hits"] == 1
+        # Promoted into memory on the first disk hit
+        assert restarted.get("key") == "cached draft"
+        assert restarted.get_stats()["memory_hits"] == 1
+
+    def test_entries_expire(self, tmp_path):
+        cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), ttl_seconds=0.05)
+        cache.set("key", "value")
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+
+    def test_disabled_cache_never_hits(self):
+        cache = LLMResponseCache(enabled=False)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+    def test_stats_hit_rate(self):
+        cache = LLMResponseCache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+class TestAgentCaching:
+    """Test that agents consult the cache before calling the LLM."""
+
+    @pytest.mark.asyncio
+    async def test_researcher_cache_hit_skips_llm(self):
+        from app.agents.researcher import ResearcherAgent
+
+        with patch("app.agents.researcher.ChatOpenAI"):
+            agent = ResearcherAgent(system_prompt="Research prompt", cache=LLMResponseCache())
+        agent.chain = AsyncMock()
+        agent.chain.ainvoke = AsyncMock(return_value={"merits_score": 7})
+
+        first = await agent.analyze("Defective phone", "context")
+        second = await agent.analyze("Defective phone", "context")
+
+        assert first == second == {"merits_score": 7}
+        assert agent.chain.ainvoke.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_drafter_cache_hit_replays_tokens(self):
+        from app.agents.drafter import DrafterAgent
+
+        with patch("app.agents.drafter.ChatOpenAI"):
+            agent = DrafterAgent(system_prompt="Draft prompt", cache=LLMResponseCache())
+        agent.chain = AsyncMock()
+        agent.chain.ainvoke = AsyncMock(return_value=Mock(content="Draft text"))
+        research = {"merits_score": 7}
+
+        await agent.draft("Defective phone", research)
+        tokens = []
+        cached = await agent.draft("Defective phone", research, on_token=tokens.append)
+
+        assert cached == "Draft text"
+        assert tokens == ["Draft text"]
+        assert agent.chain.ainvoke.call_count == 1
@@ -1,8 +1,11 @@
 """Tests for orchestrator service with all edge cases."""
 
+import asyncio
+import time
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from app.services.orchestrator import LegalAidOrchestrator, AgentTrace
+from app.config.performance_config import performance_config
 
 
 @pytest.fixture
@@ -75,6 +78,13 @@ class TestAgentTrace:
         assert trace.traces[0]["agent"] == "researcher"
         assert trace.traces[0]["action"] == "analyzing"
     
+    def test_listener_receives_entries(self):
+        received = []
+        trace = AgentTrace(listener=received.append)
+        trace.add("researcher", "analyzing", "Analyzing grievance")
+        
+        assert received == trace.traces
+    
     def test_to_dict(self):
         trace = AgentTrace()
         trace.add("drafter", "drafting", "Creating petition")
@@ -274,3 +284,70 @@ class TestEdgeCases:
         
         assert "timestamp" in result
         assert result["timestamp"]
+
+
+@pytest.fixture
+def orchestrator_with_sources():
+    """Orchestrator with mocked agents, RAG and Tavily search function."""
+    with patch("app.services.orchestrator.ResearcherAgent"), \
+         patch("app.services.orchestrator.DrafterAgent"), \
+         patch("app.services.orchestrator.ExpertReviewerAgent"), \
+         patch("app.services.orchestrator.RAGSearch") as rag, \
+         patch("app.services.orchestrator.create_tavily_search_tool") as tavily_factory:
+        
+        rag_instance = Mock()
+        rag_instance.asearch_and_summarize = AsyncMock(return_value="Kerala Public Health Act 2023 provisions")
+        rag.return_value = rag_instance
+        
+        tavily_search = Mock(return_value={
+            "total_results": 1,
+            "sources": [{"title": "Act 1", "content": "Legal content 1"}]
+        })
+        tavily_factory.return_value = tavily_search
+        
+        yield LegalAidOrchestrator(), rag_instance, tavily_search
+
+
+class TestConcurrentContextGathering:
+    """Test concurrent, timeout-bounded context gathering."""
+    
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently(self, orchestrator_with_sources):
+        orchestrator, rag, tavily = orchestrator_with_sources
+        async def slow_rag(*args, **kwargs):
+            return await asyncio.sleep(0.3, result="RAG text")
+        rag.asearch_and_summarize.side_effect = slow_rag
+        tavily.side_effect = lambda q: time.sleep(0.3) or {"total_results": 0, "sources": []}
+        
+        started = time.perf_counter()
+        context = await orchestrator._gather_context("test grievance", AgentTrace())
+        
+        assert time.perf_counter() - started < 0.55
+        assert context.index("LOCAL DOCUMENTS") < context.index("ONLINE RESOURCES")
+    
+    @pytest.mark.asyncio
+    async def test_late_source_is_dropped_and_traced(self, orchestrator_with_sources):
+        orchestrator, rag, _ = orchestrator_with_sources
+        async def late_rag(*args, **kwargs):
+            return await asyncio.sleep(0.5, result="RAG text")
+        rag.asearch_and_summarize.side_effect = late_rag
+        trace = AgentTrace()
+        
+        with patch.object(performance_config, "RAG_CONTEXT_TIMEOUT", 0.1):
+            context = await orchestrator._gather_context("test grievance", trace)
+        
+        actions = [t["action"] for t in trace.traces]
+        assert "rag_search_timeout" in actions
+        assert "No local documents found" in context
+        assert "Legal content 1" in context
+        assert "Late sources: rag" in trace.traces[-1]["details"]
+    
+    @pytest.mark.asyncio
+    async def test_failure_does_not_block_other_source(self, orchestrator_with_sources):
+        orchestrator, _, tavily = orchestrator_with_sources
+        tavily.side_effect = Exception("Tavily error")
+        
+        context = await orchestrator._gather_context("test grievance", AgentTrace())
+        
+        assert "Kerala Public Health Act 2023 provisions" in context
+        assert "No online resources found" in context
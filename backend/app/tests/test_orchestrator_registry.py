@@ -0,0 +1,91 @@
+"""Tests for the warm orchestrator registry."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+from app.services.orchestrator_registry import OrchestratorRegistry
+
+
+@pytest.fixture
+def mock_orchestrator_cls():
+    """Mock the orchestrator constructor so no agents or indexes are built."""
+    with patch("app.services.orchestrator_registry.LegalAidOrchestrator") as mock:
+        mock.side_effect = lambda domain: Mock(domain=domain)
+        yield mock
+
+
+class TestOrchestratorRegistry:
+    """Test orchestrator reuse and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_builds_once_per_domain(self, mock_orchestrator_cls):
+        registry = OrchestratorRegistry()
+
+        first = await registry.get("legal_ai")
+        second = await registry.get("legal_ai")
+
+        assert first is second
+        assert mock_orchestrator_cls.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_domains_are_isolated(self, mock_orchestrator_cls):
+        registry = OrchestratorRegistry()
+
+        legal = await registry.get("legal_ai")
+        product = await registry.get("product_comparison")
+
+        assert legal is not product
+        assert legal.domain == "legal_ai"
+        assert product.domain == "product_comparison"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_requests_share_build(self, mock_orchestrator_cls):
+        registry = OrchestratorRegistry()
+
+        results = await asyncio.gather(*[registry.get("legal_ai") for _ in range(10)])
+
+        assert all(r is results[0] for r in results)
+        assert mock_orchestrator_cls.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_report_savings(self, mock_orchestrator_cls):
+        registry = OrchestratorRegistry()
+        await registry.warm_up(["legal_ai"])
+
+        await registry.get("legal_ai")
+        await registry.get("legal_ai")
+
+        stats = registry.get_stats()["domains"]["legal_ai"]
+        assert stats["requests_served"] == 2
+        assert stats["saved_seconds_per_request"] == stats["build_seconds"]
+        assert stats["total_saved_seconds"] == pytest.approx(stats["build_seconds"] * 2)
+
+    @pytest.mark.asyncio
+    async def test_warm_up_skips_failing_domain(self, mock_orchestrator_cls):
+        mock_orchestrator_cls.side_effect = FileNotFoundError("missing domain")
+        registry = OrchestratorRegistry()
+
+        await registry.warm_up(["missing"])
+
+        assert registry.get_stats()["domains"] == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_domain_raises(self, mock_orchestrator_cls):
+        mock_orchestrator_cls.side_effect = FileNotFoundError("missing domain")
+        registry = OrchestratorRegistry()
+
+        with pytest.raises(FileNotFoundError):
+            await registry.get("missing")
+
+    @pytest.mark.asyncio
+    async def test_clear_closes_orchestrators(self, mock_orchestrator_cls):
+        registry = OrchestratorRegistry()
+        legal = await registry.get("legal_ai")
+        product = await registry.get("product_comparison")
+        legal.close.side_effect = RuntimeError("already closed")
+
+        registry.clear()
+
+        legal.close.assert_called_once()
+        product.close.assert_called_once()
+        assert registry.get_stats()["domains"] == {}
@@ -0,0 +1,148 @@
+"""Tests for the semantic research cache."""
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from app.services.research_cache import ResearchCache
+
+
+def _unit(*values):
+    vector = np.array(values, dtype="float32")
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def cache():
+    """Cache with a fake embedder mapping known texts to fixed vectors."""
+    vectors = {
+        "defective phone": _unit(1.0, 0.0, 0.0),
+        "my phone is defective": _unit(0.99, 0.05, 0.0),
+        "landlord kept deposit": _unit(0.0, 1.0, 0.0),
+    }
+    cache = ResearchCache(max_entries=2, threshold=0.9)
+    cache.embed = Mock(side_effect=lambda text, embed_query=None: vectors[text])
+    return cache
+
+
+class TestResearchCache:
+    """Test similarity lookup, eviction and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_similar_grievance_hits(self, cache):
+        _, embedding = await cache.lookup("legal_ai", "defective phone")
+        await cache.save("legal_ai", embedding, {"merits_score": 8}, "context")
+
+        hit, _ = await cache.lookup("legal_ai", "my phone is defective")
+
+        assert hit["research_findings"] == {"merits_score": 8}
+        assert hit["rag_context"] == "context"
+        assert hit["similarity"] >= 0.9
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_grievance_misses(self, cache):
+        _, embedding = await cache.lookup("legal_ai", "defective phone")
+        await cache.save("legal_ai", embedding, {"merits_score": 8}, "context")
+
+        hit, _ = await cache.lookup("legal_ai", "landlord kept deposit")
+
+        assert hit is None
+
+    @pytest.mark.asyncio
+    async def test_domains_do_not_share_entries(self, cache):
+        _, embedding = await cache.lookup("legal_ai", "defective phone")
+        await cache.save("legal_ai", embedding, {"merits_score": 8}, "context")
+
+        hit, _ = await cache.lookup("product_comparison", "defective phone")
+
+        assert hit is None
+
+    def test_lru_eviction(self, cache):
+        cache.store("legal_ai", _unit(1.0, 0.0, 0.0), {"id": "a"}, "")
+        cache.store("legal_ai", _unit(0.0, 1.0, 0.0), {"id": "b"}, "")
+        cache.find("legal_ai", _unit(1.0, 0.0, 0.0))  # "a" becomes most recently used
+        cache.store("legal_ai", _unit(0.0, 0.0, 1.0), {"id": "c"}, "")
+
+        assert cache.find("legal_ai", _unit(1.0, 0.0, 0.0))["research_findings"] == {"id": "a"}
+        assert cache.find("legal_ai", _unit(0.0, 1.0, 0.0)) is None
+
+    @pytest.mark.asyncio
+    async def test_hit_rate(self, cache):
+        _, embedding = await cache.lookup("legal_ai", "defective phone")
+        await cache.save("legal_ai", embedding, {"merits_score": 8}, "context")
+        await cache.lookup("legal_ai", "my phone is defective")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_vector_store_embedder_is_reused(self):
+        cache = ResearchCache()
+        embed_query = Mock(return_value=np.array([3.0, 4.0, 0.0]))
+
+        with patch.object(cache, "_get_model") as get_model:
+            _, embedding = await cache.lookup("legal_ai", "defective phone", embed_query)
+
+        embed_query.assert_called_once_with("defective phone")
+        get_model.assert_not_called()
+        np.testing.assert_allclose(embedding, [0.6, 0.8, 0.0])
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_skips_only_that_call(self, cache):
+        embed = cache.embed.side_effect
+        cache.embed = Mock(side_effect=[OSError("model unavailable"), embed("defective phone")])
+
+        assert await cache.lookup("legal_ai", "defective phone") == (None, None)
+        _, embedding = await cache.lookup("legal_ai", "defective phone")
+
+        assert cache.enabled is True
+        assert embedding is not None
+
+    @pytest.mark.asyncio
+    async def test_missing_model_disables_cache(self):
+        cache = ResearchCache()
+        cache.embed = Mock(side_effect=ImportError("No module named 'sentence_transformers'"))
+
+        hit, embedding = await cache.lookup("legal_ai", "defective phone")
+
+        assert hit is None and embedding is None
+        assert cache.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_dimension_mismatch_disables_cache(self, cache):
+        cache.store("legal_ai", _unit(1.0, 0.0, 0.0), {"merits_score": 8}, "context")
+        cache.embed = Mock(return_value=_unit(1.0, 0.0, 0.0, 0.0))
+
+        hit, embedding = await cache.lookup("legal_ai", "defective phone")
+
+        assert hit is None and embedding is None
+        assert cache.enabled is False
+
+
+class TestOrchestratorResearchCache:
+    """Test that the orchestrator skips context and research on a hit."""
+
+    @pytest.mark.asyncio
+    async def test_start_research_reuses_findings(self, isolated_research_cache):
+        from app.services.orchestrator import LegalAidOrchestrator
+
+        isolated_research_cache.enabled = True
+
+        with patch.object(isolated_research_cache, "embed", return_value=_unit(1.0, 0.0, 0.0)), \
+             patch("app.services.orchestrator.ResearcherAgent"), \
+             patch("app.services.orchestrator.DrafterAgent"), \
+             patch("app.services.orchestrator.ExpertReviewerAgent"), \
+             patch("app.services.orchestrator.RAGSearch"), \
+             patch("app.services.orchestrator.create_tavily_search_tool"):
+            orchestrator = LegalAidOrchestrator("legal_ai")
+            orchestrator._gather_context = AsyncMock(return_value="context")
+            orchestrator.researcher.analyze = AsyncMock(return_value={"legal_provisions": ["CPA 2019"]})
+
+            first = await orchestrator.start_research("My phone stopped working")
+            second = await orchestrator.start_research("My phone stopped working again")
+
+        assert second["research_findings"] == first["research_findings"]
+        assert orchestrator.researcher.analyze.await_count == 1
+        assert orchestrator._gather_context.await_count == 1
+        assert any(t["action"] == "research_cache_hit" for t in second["agent_traces"])
@@ -0,0 +1,115 @@
+"""Tests for streaming legal aid generation over Server-Sent Events."""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessageChunk
+
+from app.api.v1.endpoints import router
+from app.agents.drafter import DrafterAgent
+
+
+def _parse_events(body: str):
+    """Split an SSE body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def streaming_orchestrator():
+    """Orchestrator whose workflow emits two traces and three tokens."""
+    async def generate(grievance, trace=None, on_token=None):
+        trace.add("drafter", "creating_initial_draft", "Drafting")
+        for token in ["To ", "the ", "Forum"]:
+            on_token(token)
+        trace.add("orchestrator", "workflow_complete", "Done")
+        return {
+            "final_document": "To the Forum",
+            "research_findings": {},
+            "review_result": {"is_approved": True},
+            "agent_traces": trace.to_dict(),
+            "iterations": 1,
+            "status": "approved",
+            "timestamp": "2026-02-27T10:00:00"
+        }
+
+    orchestrator = Mock()
+    orchestrator.generate_legal_aid = AsyncMock(side_effect=generate)
+    with patch("app.api.v1.endpoints.orchestrator_registry") as registry:
+        registry.get = AsyncMock(return_value=orchestrator)
+        yield orchestrator
+
+
+class TestStreamingEndpoint:
+    """Test the /generate-legal-aid/stream endpoint."""
+
+    def test_streams_traces_tokens_and_result(self, client, streaming_orchestrator):
+        response = client.post(
+            "/api/v1/generate-legal-aid/stream",
+            json={"grievance": "Defective phone, seller refuses refund"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_events(response.text)
+        names = [name for name, _ in events]
+        assert names == ["started", "trace", "token", "token", "token", "trace", "result"]
+        assert "".join(data["text"] for name, data in events if name == "token") == "To the Forum"
+        assert events[-1][1]["final_document"] == "To the Forum"
+        assert len(events[-1][1]["agent_traces"]) == 2
+
+    def test_failure_emits_error_event(self, client, streaming_orchestrator):
+        streaming_orchestrator.generate_legal_aid.side_effect = Exception("LLM down")
+
+        response = client.post(
+            "/api/v1/generate-legal-aid/stream",
+            json={"grievance": "Defective phone, seller refuses refund"}
+        )
+
+        name, data = _parse_events(response.text)[-1]
+        assert name == "error"
+        assert "LLM down" in data["detail"]
+
+    def test_unknown_domain_returns_404(self, client):
+        with patch("app.api.v1.endpoints.orchestrator_registry") as registry:
+            registry.get = AsyncMock(side_effect=FileNotFoundError("no such domain"))
+            response = client.post(
+                "/api/v1/generate-legal-aid/stream",
+                json={"grievance": "Defective phone, seller refuses refund", "domain": "missing"}
+            )
+
+        assert response.status_code == 404
+
+
+class TestDrafterStreaming:
+    """Test token streaming in DrafterAgent."""
+
+    @pytest.mark.asyncio
+    async def test_on_token_receives_each_chunk(self):
+        with patch("app.agents.drafter.ChatOpenAI"):
+            drafter = DrafterAgent(system_prompt="You draft petitions.")
+
+        async def astream(inputs):
+            for text in ["Respected ", "Sir", ""]:
+                yield AIMessageChunk(content=text)
+
+        drafter.chain = Mock()
+        drafter.chain.astream = astream
+        tokens = []
+
+        draft = await drafter.draft("grievance", {}, on_token=tokens.append)
+
+        assert tokens == ["Respected ", "Sir"]
+        assert draft == "Respected Sir"
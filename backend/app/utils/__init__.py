@@ -1,5 +1,6 @@
 """Utility functions for Nyaya-Flow."""
 
 from .pii_redactor import pii_redactor, PIIRedactor
+from .llm_cache import llm_cache, LLMResponseCache
 
-__all__ = ["pii_redactor", "PIIRedactor"]
+__all__ = ["pii_redactor", "PIIRedactor", "llm_cache", "LLMResponseCache"]
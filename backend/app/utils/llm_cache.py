@@ -0,0 +1,188 @@
+"""LLM Response Cache for Nyaya-Flow.
+
+Content-addressed cache for agent completions. Keys hash the model name,
+temperature, a hash of the system prompt and the fully rendered human
+message, so any change to the prompt or inputs produces a new key.
+
+Two tiers:
+- Memory: bounded LRU for the hottest entries
+- Disk: SQLite file shared across restarts, with a TTL
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from src.executors import run_io
+from ..config.performance_config import performance_config
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + SQLite) cache for JSON-serializable LLM results."""
+
+    def __init__(self, max_entries: int = 512, db_path: Optional[str] = None,
+                 ttl_seconds: float = 86400, enabled: bool = True):
+        """
+        Args:
+            max_entries: Capacity of the in-memory LRU tier
+            db_path: SQLite file for the disk tier (None disables it)
+            ttl_seconds: Entry lifetime in both tiers
+            enabled: Global switch; when False every lookup is a miss
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(model: str, temperature: float, system_prompt: str, rendered_input: str) -> str:
+        """Build a content-addressed key for one LLM call.
+
+        Args:
+            model: Model name (e.g., "gpt-4.1")
+            temperature: Sampling temperature
+            system_prompt: Agent system prompt (hashed into the key)
+            rendered_input: Human message after template rendering
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps({
+            "model": model,
+            "temperature": temperature,
+            "system_prompt": hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+            "input": rendered_input,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ----- Disk tier -----
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        if not self._schema_ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._schema_ready = True
+        return conn
+
+    def _disk_get(self, key: str) -> Optional[tuple]:
+        conn = self._connect()
+        row = conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row and time.time() - row[1] > self.ttl_seconds:
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            conn.commit()
+            row = None
+        conn.close()
+        return row
+
+    def _disk_set(self, key: str, value: str, created_at: float):
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+            (key, value, created_at)
+        )
+        conn.commit()
+        conn.close()
+
+    # ----- Lookup -----
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss (blocking)."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and time.time() - entry[1] > self.ttl_seconds:
+                del self._memory[key]
+                entry = None
+            if entry:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return json.loads(entry[0])
+
+        row = self._disk_get(key) if self.db_path else None
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, row[0], row[1])
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serializable value in both tiers (blocking)."""
+        if not self.enabled:
+            return
+        serialized = json.dumps(value)
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, serialized, created_at)
+        if self.db_path:
+            self._disk_set(key, serialized, created_at)
+
+    def _remember(self, key: str, serialized: str, created_at: float):
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = (serialized, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Async get; disk reads run on the I/O thread pool."""
+        return await run_io(self.get, key)
+
+    async def aset(self, key: str, value: Any):
+        """Async set; disk writes run on the I/O thread pool."""
+        await run_io(self.set, key, value)
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.db_path and os.path.exists(self.db_path):
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+            conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "memory_entries": len(self._memory),
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Create singleton instance
+llm_cache = LLMResponseCache(
+    max_entries=performance_config.LLM_CACHE_MAX_ENTRIES,
+    db_path=performance_config.LLM_CACHE_PATH or None,
+    ttl_seconds=performance_config.LLM_CACHE_TTL_SECONDS,
+    enabled=performance_config.LLM_CACHE_ENABLED,
+)
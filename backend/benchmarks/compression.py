@@ -0,0 +1,87 @@
+"""Benchmark: compressed vector storage against the float32 flat index.
+
+Rebuilds the vectors of an existing store under each storage configuration
+(fp16 and int8 scalar quantization, PCA and prefix dimension reduction) and
+reports serialized index size, search latency and recall@k against exact
+float32 flat search over the same vectors.
+
+Typical Usage:
+    cd backend
+    python -m benchmarks.compression --persist-dir data/faiss_store --top-k 10
+"""
+
+import argparse
+import tempfile
+from typing import List, Sequence, Tuple
+
+import faiss
+import numpy as np
+
+from src.vectorstore import FaissVectorStore, measure_recall
+
+CONFIGS: Sequence[Tuple[str, dict]] = (
+    ("flat", {}),
+    ("fp16", {}),
+    ("int8", {}),
+    ("flat", {"reduce": "pca", "reduced_dim": 128}),
+    ("int8", {"reduce": "pca", "reduced_dim": 128}),
+    ("flat", {"reduce": "prefix", "reduced_dim": 192}),
+)
+
+
+def _label(index_type: str, params: dict) -> str:
+    """Short configuration name, e.g. "int8+pca128"."""
+    if params.get("reduce"):
+        return f"{index_type}+{params['reduce']}{params['reduced_dim']}"
+    return index_type
+
+
+def run(embeddings: np.ndarray, top_k: int = 10, num_queries: int = 200, configs=CONFIGS) -> List[dict]:
+    """Build each storage configuration and measure it against flat float32.
+
+    Args:
+        embeddings (np.ndarray): float32 vectors, shape (n_vectors, dimension).
+        top_k (int): Neighbours compared per query.
+        num_queries (int): Indexed vectors sampled as queries.
+        configs (Sequence[Tuple[str, dict]]): (index_type, index_params) pairs.
+
+    Returns:
+        List[dict]: One row per configuration with index size, size relative
+        to flat, per-query latency and recall@k.
+    """
+    rng = np.random.default_rng(0)
+    queries = embeddings[rng.choice(len(embeddings), size=min(num_queries, len(embeddings)), replace=False)]
+    flat_bytes = embeddings.nbytes
+    rows = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for index_type, params in configs:
+            store = FaissVectorStore(tmpdir, index_type=index_type, index_params=dict(params))
+            store.add_embeddings(embeddings)
+            report = measure_recall(store.index, embeddings, queries, top_k)
+            index_bytes = faiss.serialize_index(store.index).size
+            rows.append({
+                "config": _label(index_type, store.index_params),
+                "index_mb": round(index_bytes / 2 ** 20, 2),
+                "vs_flat": round(index_bytes / flat_bytes, 3),
+                "ms_per_query": report["index_ms_per_query"],
+                "recall_at_k": report["recall_at_k"],
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fp16/int8 quantization and dimension reduction.")
+    parser.add_argument("--persist-dir", default="data/faiss_store")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    # Vectors come straight from the saved float32 flat index
+    source = faiss.read_index(f"{args.persist_dir}/faiss.index")
+    vectors = source.index if isinstance(source, faiss.IndexIDMap) else source
+    embeddings = vectors.reconstruct_n(0, vectors.ntotal)
+    print(f"{len(embeddings)} vectors x {embeddings.shape[1]} dims")
+    print(f"{'config':<18} {'index MB':>9} {'vs flat':>8} {'ms/query':>9} {'recall@k':>9}")
+    for row in run(embeddings, args.top_k, args.queries):
+        print(f"{row['config']:<18} {row['index_mb']:>9} {row['vs_flat']:>8} "
+              f"{row['ms_per_query']:>9} {row['recall_at_k']:>9}")
@@ -0,0 +1,107 @@
+"""Benchmark: PyTorch versus ONNX Runtime (fp32 and int8) sentence embedding.
+
+Loads the embedding model once per inference backend and reports
+single-query latency (median and p95 over repeated one-text encodes), batch
+throughput (texts/sec at a fixed batch size) and cosine agreement with the
+PyTorch vectors, to pick EMBEDDING_BACKEND for a CPU-only host.
+
+ONNX backends need optimum[onnxruntime]; backends that fail to load are
+reported and skipped.
+
+Typical Usage:
+    cd backend
+    python -m benchmarks.embedding_backends --texts 512 --batch-size 64
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from benchmarks.query_batch import SAMPLE_QUERIES
+from src.embedding import EMBEDDING_BACKENDS, backend_kwargs
+
+
+def cosine_agreement(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity between two embedding matrices."""
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    return np.sum(reference * candidate, axis=1)
+
+
+def run(texts: List[str], backends: Sequence[str] = EMBEDDING_BACKENDS, model_name: str = "all-MiniLM-L6-v2",
+        batch_size: int = 64, latency_repeats: int = 50) -> List[Dict[str, Any]]:
+    """Measure each backend on the same texts.
+
+    Args:
+        texts (List[str]): Texts encoded for throughput and parity.
+        backends (Sequence[str]): Backends to compare; "torch" is the parity reference.
+        model_name (str): Sentence-transformer model name.
+        batch_size (int): Encode batch size for the throughput run.
+        latency_repeats (int): Single-text encodes timed for latency.
+
+    Returns:
+        List[Dict[str, Any]]: One row per backend with p50_ms, p95_ms,
+        texts_per_sec and min/mean cosine to torch (or an "error").
+    """
+    rows, reference = [], None
+    for backend in backends:
+        try:
+            model = SentenceTransformer(model_name, **backend_kwargs(backend))
+        except Exception as e:
+            rows.append({"backend": backend, "error": str(e).splitlines()[0]})
+            continue
+        # Warm up so graph/session setup is not timed
+        model.encode(texts[:batch_size], batch_size=batch_size)
+
+        latencies = []
+        for i in range(latency_repeats):
+            start = time.perf_counter()
+            model.encode([texts[i % len(texts)]])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        embeddings = np.asarray(model.encode(texts, batch_size=batch_size), dtype="float32")
+        elapsed = time.perf_counter() - start
+
+        if backend == "torch":
+            reference = embeddings
+        row = {
+            "backend": backend,
+            "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+            "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+            "texts_per_sec": round(len(texts) / elapsed, 1),
+        }
+        if reference is not None:
+            agreement = cosine_agreement(reference, embeddings)
+            row["min_cosine"] = round(float(agreement.min()), 4)
+            row["mean_cosine"] = round(float(agreement.mean()), 4)
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark embedding inference backends.")
+    parser.add_argument("--data-dir", default=None, help="encode chunks from these documents instead of sample queries")
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--backends", nargs="+", default=list(EMBEDDING_BACKENDS))
+    args = parser.parse_args()
+
+    if args.data_dir:
+        from src.data_loader import load_all_documents
+        from src.embedding import EmbeddingPipeline
+        chunks = EmbeddingPipeline(workers=1).chunk_documents(load_all_documents(args.data_dir))
+        texts = [chunk.page_content for chunk in chunks[:args.texts]]
+    else:
+        texts = (SAMPLE_QUERIES * (args.texts // len(SAMPLE_QUERIES) + 1))[:args.texts]
+    print(f"{len(texts)} texts, batch size {args.batch_size}")
+    print(f"{'backend':<10} {'p50 ms':>7} {'p95 ms':>7} {'texts/s':>9} {'min cos':>8} {'mean cos':>9}")
+    for row in run(texts, args.backends, batch_size=args.batch_size):
+        if "error" in row:
+            print(f"{row['backend']:<10} skipped: {row['error']}")
+            continue
+        print(f"{row['backend']:<10} {row['p50_ms']:>7} {row['p95_ms']:>7} {row['texts_per_sec']:>9} "
+              f"{row.get('min_cosine', '-'):>8} {row.get('mean_cosine', '-'):>9}")
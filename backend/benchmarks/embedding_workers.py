@@ -0,0 +1,63 @@
+"""Benchmark: multi-process chunk encoding throughput.
+
+Encodes the same chunks with EmbeddingPipeline at several worker-process
+counts and reports chunks/sec overall and per core (workers x torch threads
+per worker), to pick EMBED_WORKERS / EMBED_THREADS_PER_WORKER for a build host.
+
+Typical Usage:
+    cd backend
+    python -m benchmarks.embedding_workers --data-dir docustore/pdf --limit 2000 --workers 1 4 8 16
+"""
+
+import argparse
+import os
+from typing import Any, List, Optional, Sequence
+
+from src.data_loader import load_all_documents
+from src.embedding import EmbeddingPipeline
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def run(chunks: List[Any], worker_counts: Sequence[int] = WORKER_COUNTS, threads_per_worker: Optional[int] = None,
+        model_name: str = "all-MiniLM-L6-v2") -> List[dict]:
+    """Encode chunks once per worker count and collect throughput reports.
+
+    Args:
+        chunks (List[Any]): Chunk Documents to encode.
+        worker_counts (Sequence[int]): Encode processes to try (1 = in-process).
+        threads_per_worker (int, optional): Torch threads per process. Defaults
+            to the CPU count split across the workers.
+        model_name (str): Sentence-transformer model name.
+
+    Returns:
+        List[dict]: EmbeddingPipeline.get_encode_report() for each worker count.
+    """
+    rows = []
+    for workers in worker_counts:
+        pipeline = EmbeddingPipeline(model_name=model_name, workers=workers, threads_per_worker=threads_per_worker)
+        try:
+            # Start workers and load their models outside the timing
+            pipeline.embed_chunks(chunks[:workers * 4])
+            pipeline.reset_encode_report()
+            pipeline.embed_chunks(chunks)
+            rows.append(pipeline.get_encode_report())
+        finally:
+            pipeline.close()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark multi-process chunk encoding.")
+    parser.add_argument("--data-dir", default="docustore/pdf")
+    parser.add_argument("--limit", type=int, default=2000, help="chunks to encode")
+    parser.add_argument("--workers", type=int, nargs="+", default=list(WORKER_COUNTS))
+    parser.add_argument("--threads-per-worker", type=int, default=None)
+    args = parser.parse_args()
+
+    chunks = EmbeddingPipeline(workers=1).chunk_documents(load_all_documents(args.data_dir))[:args.limit]
+    print(f"{len(chunks)} chunks on {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'threads':>8} {'cores':>6} {'chunks/s':>10} {'chunks/s/core':>14}")
+    for row in run(chunks, args.workers, args.threads_per_worker):
+        print(f"{row['workers']:>8} {str(row['threads_per_worker'] or '-'):>8} {row['cores']:>6} "
+              f"{row['chunks_per_sec']:>10} {row['chunks_per_sec_per_core']:>14}")
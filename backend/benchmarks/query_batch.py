@@ -0,0 +1,93 @@
+"""Benchmark: batched versus one-at-a-time vector store queries.
+
+Measures query throughput of FaissVectorStore.query (one encode and one
+index.search per query) against FaissVectorStore.query_batch (one encode and
+one index.search per batch) at batch sizes 1, 8, 32 and 128. The query
+embedding cache is disabled while measuring and every query string in a
+batch is distinct, so each timed call includes the transformer forward pass.
+
+Typical Usage:
+    cd backend
+    python -m benchmarks.query_batch --persist-dir data/faiss_store --top-k 5
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from src.embedding import QueryEmbeddingCache
+from src.vectorstore import FaissVectorStore
+
+BATCH_SIZES = (1, 8, 32, 128)
+
+SAMPLE_QUERIES = [
+    "Refund for a defective mobile phone under consumer protection",
+    "Landlord refusing to return the security deposit",
+    "Delay in reply to a right to information application",
+    "Harassment of women at the workplace in Tamil Nadu",
+    "Survey boundary dispute with neighbour in Kerala",
+    "Time limit for delivery of public services",
+    "Penalty on officer for not providing notified service",
+    "Public health nuisance caused by waste dumping",
+]
+
+
+def _queries(size: int) -> List[str]:
+    """Return size distinct query strings built from the sample queries."""
+    return [f"{SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]} (case {i})" for i in range(size)]
+
+
+def _timed(fn: Callable[[], object], repeats: int) -> float:
+    """Return the best wall-clock time of fn over repeats runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(store: FaissVectorStore, top_k: int = 5, repeats: int = 3, batch_sizes=BATCH_SIZES) -> List[dict]:
+    """Benchmark sequential and batched querying on a loaded store.
+
+    Args:
+        store (FaissVectorStore): Store with a loaded index and model.
+        top_k (int): Results per query.
+        repeats (int): Runs per measurement; the fastest is reported.
+        batch_sizes (tuple): Number of queries per batch.
+
+    Returns:
+        List[dict]: One row per batch size with queries/sec for both modes.
+    """
+    # Repeated runs would otherwise be served from the query embedding cache
+    query_cache, store.query_cache = store.query_cache, QueryEmbeddingCache(0)
+    try:
+        store.query_batch(SAMPLE_QUERIES[:2], top_k)  # warm up model and index
+        rows = []
+        for size in batch_sizes:
+            queries = _queries(size)
+            sequential = _timed(lambda: [store.query(q, top_k) for q in queries], repeats)
+            batched = _timed(lambda: store.query_batch(queries, top_k), repeats)
+            rows.append({
+                "batch_size": size,
+                "sequential_qps": round(size / sequential, 1),
+                "batched_qps": round(size / batched, 1),
+                "speedup": round(sequential / batched, 2),
+            })
+    finally:
+        store.query_cache = query_cache
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark FaissVectorStore.query_batch throughput.")
+    parser.add_argument("--persist-dir", default="data/faiss_store")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    store = FaissVectorStore(args.persist_dir, query_cache=QueryEmbeddingCache(0))
+    store.load()
+    print(f"{'batch':>6} {'sequential q/s':>15} {'batched q/s':>12} {'speedup':>8}")
+    for row in run(store, args.top_k, args.repeats):
+        print(f"{row['batch_size']:>6} {row['sequential_qps']:>15} {row['batched_qps']:>12} {row['speedup']:>7}x")
@@ -25,6 +25,9 @@ class DomainConfig:
         self.use_rag = config_data.get("use_rag", False)
         self.use_web_search = config_data.get("use_web_search", True)
         self.search_config = config_data.get("search_config", {})
+        self.use_llm_cache = config_data.get("use_llm_cache", True)
+        # Index shards this domain's RAG queries may be routed to (all when empty)
+        self.rag_shards = config_data.get("rag_shards", [])
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
@@ -34,7 +37,9 @@ class DomainConfig:
             "description": self.description,
             "use_rag": self.use_rag,
             "use_web_search": self.use_web_search,
-            "search_config": self.search_config
+            "search_config": self.search_config,
+            "use_llm_cache": self.use_llm_cache,
+            "rag_shards": self.rag_shards
         }
 
 
@@ -0,0 +1,193 @@
+"""BM25 Lexical Index Module for Nyaya-Flow Legal Aid Platform.
+
+This module provides a sparse BM25 inverted index over the same chunks as the
+FAISS vector store, plus reciprocal rank fusion (RRF) for combining lexical
+and dense rankings. Statute queries often hinge on exact tokens ("Section 35",
+"Act 2019") that sentence embeddings blur; BM25 matches them exactly, so a
+fused ranking reaches the same quality with fewer chunks.
+
+Functionalities:
+    - Tokenization that keeps section and year numbers
+    - Inverted index keyed by FAISS vector ID, with incremental add/remove
+    - Okapi BM25 scoring
+    - JSON persistence (bm25.json next to faiss.index)
+    - Reciprocal rank fusion of several rankings
+
+Typical Usage:
+    from src.bm25 import BM25Index, reciprocal_rank_fusion
+
+    bm25 = BM25Index()
+    bm25.add([0, 1], ["Section 35 of the Act", "Refund of deposit"])
+    lexical = [doc_id for doc_id, _ in bm25.search("section 35", top_k=10)]
+    fused = reciprocal_rank_fusion([dense_ids, lexical])
+"""
+
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+BM25_FILE = "bm25.json"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the to was were with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric tokens without common stopwords.
+
+    Numbers are kept as tokens so "Section 35" matches "section 35".
+
+    Args:
+        text (str): Text to tokenize.
+
+    Returns:
+        List[str]: Tokens in order.
+    """
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[int]], k: int = 60) -> List[Tuple[int, float]]:
+    """Fuse ranked ID lists with reciprocal rank fusion.
+
+    Each list contributes 1 / (k + rank) for every ID it contains (rank
+    starting at 1); IDs are returned by total score.
+
+    Args:
+        rankings (Sequence[Sequence[int]]): Ranked ID lists, best first.
+        k (int): Damping constant; 60 is the usual choice.
+
+    Returns:
+        List[Tuple[int, float]]: (id, fused score) pairs, best first.
+    """
+    scores: Dict[int, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[int(doc_id)] += 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class BM25Index:
+    """Okapi BM25 inverted index over chunk texts keyed by vector ID.
+
+    Attributes:
+        k1 (float): Term-frequency saturation.
+        b (float): Length normalization.
+        postings (Dict[str, Dict[int, int]]): term -> {vector ID: term frequency}.
+        doc_lengths (Dict[int, int]): Token count per vector ID.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """Initialize an empty index.
+
+        Args:
+            k1 (float): Term-frequency saturation. Defaults to 1.5.
+            b (float): Length normalization. Defaults to 0.75.
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.doc_lengths: Dict[int, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, ids: Sequence[int], texts: Sequence[str]):
+        """Index texts under the given vector IDs.
+
+        Args:
+            ids (Sequence[int]): Vector IDs, one per text.
+            texts (Sequence[str]): Chunk texts.
+        """
+        for doc_id, text in zip(ids, texts):
+            doc_id = int(doc_id)
+            tokens = tokenize(text or "")
+            for term, tf in Counter(tokens).items():
+                self.postings[term][doc_id] = tf
+            self.doc_lengths[doc_id] = len(tokens)
+            self._total_length += len(tokens)
+
+    def remove(self, ids: Sequence[int], texts: Sequence[str]):
+        """Drop vector IDs from the index.
+
+        The original texts are re-tokenized to find their postings, so removal
+        touches only the affected terms.
+
+        Args:
+            ids (Sequence[int]): Vector IDs to remove.
+            texts (Sequence[str]): The texts they were indexed with.
+        """
+        for doc_id, text in zip(ids, texts):
+            doc_id = int(doc_id)
+            if doc_id not in self.doc_lengths:
+                continue
+            for term in set(tokenize(text or "")):
+                plist = self.postings.get(term)
+                if plist is not None:
+                    plist.pop(doc_id, None)
+                    if not plist:
+                        del self.postings[term]
+            self._total_length -= self.doc_lengths.pop(doc_id)
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
+        """Score indexed chunks against a query.
+
+        Args:
+            query (str): Query text.
+            top_k (int): Maximum results. Defaults to 10.
+
+        Returns:
+            List[Tuple[int, float]]: (vector ID, BM25 score) pairs, best first.
+        """
+        n_docs = len(self.doc_lengths)
+        if not n_docs:
+            return []
+        avg_length = self._total_length / n_docs or 1.0
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            idf = math.log(1 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+            for doc_id, tf in plist.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+    def save(self, directory: str):
+        """Write bm25.json to directory (atomically, like the FAISS index)."""
+        path = os.path.join(directory, BM25_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({
+                "k1": self.k1,
+                "b": self.b,
+                "doc_lengths": self.doc_lengths,
+                "postings": {term: list(plist.items()) for term, plist in self.postings.items()},
+            }, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, directory: str) -> "BM25Index":
+        """Read bm25.json from directory.
+
+        Raises:
+            FileNotFoundError: If the index has not been saved.
+        """
+        with open(os.path.join(directory, BM25_FILE)) as f:
+            data = json.load(f)
+        index = cls(k1=data["k1"], b=data["b"])
+        index.doc_lengths = {int(doc_id): length for doc_id, length in data["doc_lengths"].items()}
+        index._total_length = sum(index.doc_lengths.values())
+        for term, plist in data["postings"].items():
+            index.postings[term] = {int(doc_id): tf for doc_id, tf in plist}
+        return index
+
+    @classmethod
+    def exists(cls, directory: str) -> bool:
+        """Return True if directory holds a saved BM25 index."""
+        return os.path.exists(os.path.join(directory, BM25_FILE))
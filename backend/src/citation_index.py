@@ -0,0 +1,277 @@
+"""Citation Index Module for Nyaya-Flow Legal Aid Platform.
+
+This module maps normalized (act, section) keys to the vector IDs of the
+chunks that hold each provision, so an explicit citation such as "Section 3
+of the Kerala Right to Public Service Act" resolves with a dictionary lookup
+instead of an embedding and a ranked search. Keys come from the act and
+section metadata of statute chunks (see src.statute_splitter), so the index
+is built alongside the FAISS index and saved next to it.
+
+Act names are normalized by lower-casing, dropping "the", punctuation and
+the year, so "The Kerala Public Health Act, 2023" and "Kerala Public Health
+Act" share a key. A citation naming only part of the title ("Public Health
+Act") falls back to the unique indexed Act whose name ends with it, and lead-in
+words ("under the", "as per") are ignored. Common short names ("BNS", "IPC",
+"CrPC", "RTI Act", ...) are expanded through ACT_ALIASES; any other Act must be
+cited by (the tail of) its title. A bare "the Act" or "this Act" names no
+particular Act and is skipped.
+
+Section lists are expanded: "Sections 3 and 4", "3, 4 and 5" and "3 to 5"
+each cite every listed section.
+
+Functionalities:
+    - Act name normalization and citation parsing ("Section 4A of the ... Act", "s. 3, ... Act",
+      "Sections 3 to 5 of ... Act", "BNS Section 420", "Section 420 IPC")
+    - (act, section) -> vector ID index with incremental add/remove
+    - JSON persistence (citations.json next to faiss.index)
+
+Typical Usage:
+    from src.citation_index import CitationIndex, parse_citations
+
+    citations = CitationIndex()
+    citations.add([7, 8], [{"act": "The Kerala Public Health Act, 2023", "section": "3"}] * 2)
+    citations.resolve("Refund under Section 3 of the Kerala Public Health Act")   # [7, 8]
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+CITATIONS_FILE = "citations.json"
+
+# Short names used in grievances and research output -> normalized Act key
+ACT_ALIASES = {
+    "bns": "bharatiya nyaya sanhita",
+    "bnss": "bharatiya nagarik suraksha sanhita",
+    "bsa": "bharatiya sakshya adhiniyam",
+    "ipc": "indian penal code",
+    "crpc": "code of criminal procedure",
+    "cpc": "code of civil procedure",
+    "cpa": "consumer protection act",
+    "rti": "right to information act",
+    "rti act": "right to information act",
+}
+# Act keys that refer back to an Act named elsewhere rather than naming one
+_GENERIC_ACT_KEYS = {"act", "this act", "said act", "that act", "principal act", "same act", "above act"}
+
+_ACT_NAME = r"((?:the\s+)?[A-Z][A-Za-z'&-]*(?:\s+[A-Za-z'&()-]+){0,12}?\s+Act)(?:,?\s*(?:of\s+)?\d{4})?"
+_SECTION_WORD = r"(?:sections?|secs?\.?|ss?\.)"
+# "3", "4A(2)", and lists of them: "3 and 4", "3, 4 and 5", "3 to 5", "3-5"
+_LABEL = r"\d{1,3}[A-Z]{0,2}(?:\s*\([0-9a-z]+\))*"
+_SECTIONS = r"(" + _LABEL + r"(?:\s*(?:,|&|\band\b|\bor\b|\bto\b|-|–)\s*" + _LABEL + r")*)"
+# Aliases spelled as written ("Cr.P.C." as well as "CrPC")
+_ALIAS_NAME = r"(bnss|bns|bsa|ipc|cr\.?\s?p\.?\s?c\.?|c\.?p\.?c\.?|cpa|rti)(?![A-Za-z])"
+# "Section 3 of the Kerala ... Act", "Sec. 4A(2) of ... Act", "Sections 3 and 4 of ... Act"
+_SECTION_FIRST = re.compile(r"\b" + _SECTION_WORD + r"\s*" + _SECTIONS + r"\s+of\s+" + _ACT_NAME, re.IGNORECASE)
+# "the Kerala ... Act, 2023, Section 3" / "Kerala ... Act s. 3"
+_ACT_FIRST = re.compile(_ACT_NAME + r",?\s+" + _SECTION_WORD + r"\s*" + _SECTIONS + r"\b", re.IGNORECASE)
+# "Section 420 IPC", "Section 420 of the BNS", "s. 7 RTI"
+_SECTION_ALIAS = re.compile(
+    r"\b" + _SECTION_WORD + r"\s*" + _SECTIONS + r"\s+(?:of\s+)?(?:the\s+)?" + _ALIAS_NAME, re.IGNORECASE)
+# "BNS Section 420", "IPC s. 420"
+_ALIAS_SECTION = re.compile(
+    r"(?<![A-Za-z])" + _ALIAS_NAME + r",?\s+" + _SECTION_WORD + r"\s*" + _SECTIONS + r"\b", re.IGNORECASE)
+
+
+def normalize_act_key(act: str) -> str:
+    """Normalize an Act name for lookups.
+
+    Args:
+        act (str): Act name, e.g. "The Kerala Public Health Act, 2023".
+
+    Returns:
+        str: Lower-case key without "the", punctuation or year, e.g. "kerala public health act".
+    """
+    words = re.findall(r"[a-z]+", act.lower())
+    if words and words[0] == "the":
+        words = words[1:]
+    return " ".join(words)
+
+
+def normalize_section(section: str) -> str:
+    """Normalize a section label ("04a" -> "4A")."""
+    section = str(section).strip().upper()
+    return section.lstrip("0") or "0"
+
+
+def _cited_act_key(name: str) -> str:
+    """Key for an Act name matched in free text, dropping lead-in words before "the"."""
+    key = normalize_act_key(re.split(r"\bthe\s+", name, flags=re.IGNORECASE)[-1])
+    return ACT_ALIASES.get(key, key)
+
+
+def _alias_key(alias: str) -> str:
+    """Key for a short Act name as written ("Cr.P.C." -> "code of criminal procedure")."""
+    return ACT_ALIASES[re.sub(r"[^a-z]", "", alias.lower())]
+
+
+def expand_sections(sections: str) -> List[str]:
+    """Expand a cited section list into normalized labels.
+
+    Args:
+        sections (str): "3", "3 and 4", "3, 4 and 5", "3 to 5" or "4A(2)".
+
+    Returns:
+        List[str]: Section labels in order, ranges filled in ("3 to 5" -> 3, 4, 5).
+    """
+    labels = []
+    parts = re.split(r"\s*(,|&|\band\b|\bor\b|\bto\b|-|–)\s*", sections, flags=re.IGNORECASE)
+    for i in range(0, len(parts), 2):
+        label = normalize_section(re.match(r"\d{1,3}[A-Za-z]{0,2}", parts[i]).group())
+        is_range = i >= 2 and parts[i - 1].lower() in ("to", "-", "–")
+        if is_range and labels and labels[-1].isdigit() and label.isdigit() and 0 < int(label) - int(labels[-1]) <= 50:
+            labels.extend(str(n) for n in range(int(labels[-1]) + 1, int(label) + 1))
+        elif label not in labels:
+            labels.append(label)
+    return labels
+
+
+def parse_citations(text: str) -> List[Tuple[str, str]]:
+    """Extract (act key, section) citations from free text.
+
+    Args:
+        text (str): Grievance, research output or query text.
+
+    Returns:
+        List[Tuple[str, str]]: Normalized (act key, section) pairs in order of
+        appearance, without duplicates.
+    """
+    found = []
+    for match in _SECTION_FIRST.finditer(text):
+        found.append((match.start(), _cited_act_key(match.group(2)), match.group(1)))
+    for match in _ACT_FIRST.finditer(text):
+        found.append((match.start(), _cited_act_key(match.group(1)), match.group(2)))
+    for match in _SECTION_ALIAS.finditer(text):
+        found.append((match.start(), _alias_key(match.group(2)), match.group(1)))
+    for match in _ALIAS_SECTION.finditer(text):
+        found.append((match.start(), _alias_key(match.group(1)), match.group(2)))
+    citations = []
+    for _, act, sections in sorted(found):
+        if act in _GENERIC_ACT_KEYS:
+            continue
+        for section in expand_sections(sections):
+            if (act, section) not in citations:
+                citations.append((act, section))
+    return citations
+
+
+class CitationIndex:
+    """Exact-match index from (act, section) to chunk vector IDs.
+
+    Attributes:
+        entries (Dict[Tuple[str, str], List[int]]): (act key, section) -> vector IDs in order.
+        act_names (Dict[str, str]): act key -> display name as indexed.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.entries: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        self.act_names: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, ids: Sequence[int], metadatas: Sequence[Any]):
+        """Index chunks whose metadata names an act and section.
+
+        Args:
+            ids (Sequence[int]): Vector IDs, one per metadata record.
+            metadatas (Sequence[Any]): Chunk metadata dicts; others are skipped.
+        """
+        for doc_id, meta in zip(ids, metadatas):
+            if not meta or not meta.get("act") or not meta.get("section"):
+                continue
+            act = normalize_act_key(meta["act"])
+            self.act_names.setdefault(act, meta["act"])
+            self.entries[(act, normalize_section(meta["section"]))].append(int(doc_id))
+
+    def remove(self, ids: Sequence[int], metadatas: Sequence[Any]):
+        """Drop vector IDs, using their metadata to find the keys.
+
+        Args:
+            ids (Sequence[int]): Vector IDs to remove.
+            metadatas (Sequence[Any]): The metadata they were indexed with.
+        """
+        for doc_id, meta in zip(ids, metadatas):
+            if not meta or not meta.get("act") or not meta.get("section"):
+                continue
+            key = (normalize_act_key(meta["act"]), normalize_section(meta["section"]))
+            ids_for_key = self.entries.get(key)
+            if ids_for_key and int(doc_id) in ids_for_key:
+                ids_for_key.remove(int(doc_id))
+                if not ids_for_key:
+                    del self.entries[key]
+
+    def _act_key(self, act: str) -> Optional[str]:
+        """Return the indexed key for a cited act.
+
+        Tries the exact key, then the key without leading words ("under kerala
+        public health act"), then a unique indexed name ending with the citation.
+        """
+        words = act.split()
+        for start in range(len(words)):
+            if " ".join(words[start:]) in self.act_names:
+                return " ".join(words[start:])
+        matches = [key for key in self.act_names if key.endswith(" " + act)]
+        return matches[0] if len(matches) == 1 else None
+
+    def lookup(self, act: str, section: str) -> List[int]:
+        """Return the vector IDs holding one provision.
+
+        Args:
+            act (str): Act name in any form ("The Kerala Public Health Act, 2023").
+            section (str): Section label ("3", "4A").
+
+        Returns:
+            List[int]: Vector IDs in chunk order; empty if the provision is not indexed.
+        """
+        key = self._act_key(normalize_act_key(act))
+        if key is None:
+            return []
+        return list(self.entries.get((key, normalize_section(section)), []))
+
+    def resolve(self, text: str) -> List[int]:
+        """Return the vector IDs of every indexed provision cited in text.
+
+        Args:
+            text (str): Free text that may contain citations.
+
+        Returns:
+            List[int]: Vector IDs, grouped per citation in order of appearance.
+        """
+        ids = []
+        for act, section in parse_citations(text):
+            ids.extend(i for i in self.lookup(act, section) if i not in ids)
+        return ids
+
+    def save(self, directory: str):
+        """Write citations.json to directory (atomically, like the FAISS index)."""
+        path = os.path.join(directory, CITATIONS_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({
+                "act_names": self.act_names,
+                "entries": [[act, section, ids] for (act, section), ids in self.entries.items()],
+            }, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, directory: str) -> "CitationIndex":
+        """Read citations.json from directory.
+
+        Raises:
+            FileNotFoundError: If the index has not been saved.
+        """
+        with open(os.path.join(directory, CITATIONS_FILE)) as f:
+            data = json.load(f)
+        index = cls()
+        index.act_names = data["act_names"]
+        for act, section, ids in data["entries"]:
+            index.entries[(act, section)] = ids
+        return index
+
+    @classmethod
+    def exists(cls, directory: str) -> bool:
+        """Return True if directory holds a saved citation index."""
+        return os.path.exists(os.path.join(directory, CITATIONS_FILE))
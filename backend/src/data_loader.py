@@ -6,7 +6,8 @@ types including PDF, TXT, CSV, Excel, Word, and JSON documents.
 
 Functionalities:
     - Multi-format document loading (PDF, TXT, CSV, XLSX, DOCX, JSON)
-    - Recursive directory traversal for document discovery
+    - Single recursive directory walk with case-insensitive extension dispatch
+    - Parallel file parsing on the shared executor process pool, with a streaming generator mode
     - Automatic conversion to LangChain document structure
     - Comprehensive error handling and debug logging
     - Support for Indian legal documents and statutes
@@ -16,29 +17,149 @@ Typical Usage:
     
     documents = load_all_documents("backend/data")
     print(f"Loaded {len(documents)} documents for processing")
+
+    for document in iter_documents("backend/data"):
+        ...  # documents arrive as each file finishes parsing
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Any
+from typing import List, Any, Iterator, Optional, Tuple
 from langchain_community.document_loaders import PyPDFLoader, TextLoader, CSVLoader
 from langchain_community.document_loaders import Docx2txtLoader
 from langchain_community.document_loaders.excel import UnstructuredExcelLoader
 from langchain_community.document_loaders import JSONLoader
+from src.executors import CPU_START_METHOD, cpu_pool
+
+# Loader factory per lower-case file extension
+LOADERS = {
+    ".pdf": lambda path: PyPDFLoader(path),
+    ".txt": lambda path: TextLoader(path, encoding='utf-8'),
+    ".csv": lambda path: CSVLoader(path),
+    ".xlsx": lambda path: UnstructuredExcelLoader(path),
+    ".docx": lambda path: Docx2txtLoader(path),
+    ".json": lambda path: JSONLoader(path, jq_schema='.', text_content=False),
+}
+
+
+def find_document_files(data_dir: str) -> List[Path]:
+    """List supported document files under data_dir, matching extensions case-insensitively.
+    
+    Args:
+        data_dir (str): Directory to scan recursively.
+    
+    Returns:
+        List[Path]: Sorted file paths. Empty if the directory doesn't exist.
+    """
+    data_path = Path(data_dir).resolve()
+    if not data_path.exists():
+        return []
+    return sorted(p for p in data_path.rglob('*') if p.is_file() and p.suffix.lower() in LOADERS)
+
+
+def load_document(file_path: str) -> List[Any]:
+    """Load a single supported file into LangChain documents.
+    
+    Args:
+        file_path (str): Path to a file with a supported extension.
+    
+    Returns:
+        List[Any]: Documents for the file (one per page for PDFs).
+    
+    Raises:
+        ValueError: If the extension is not supported.
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix not in LOADERS:
+        raise ValueError(f"Unsupported document type: {file_path}")
+    return LOADERS[suffix](str(file_path)).load()
+
 
-def load_all_documents(data_dir: str) -> List[Any]:
+def _load_file(file_path: str) -> Tuple[str, List[Any], Optional[str]]:
+    """Load one file, capturing errors so a bad file never stops a batch.
+    
+    Defined at module level so it can run in process-pool workers.
+    
+    Returns:
+        Tuple[str, List[Any], Optional[str]]: (path, documents, error message or None).
+    """
+    try:
+        return file_path, load_document(file_path), None
+    except Exception as e:
+        return file_path, [], str(e)
+
+
+def _load_files(files: List[Path], workers: Optional[int], ordered: bool) -> Iterator[Tuple[str, List[Any], Optional[str]]]:
+    """Run _load_file over files, in a process pool when it can help.
+    
+    By default files go to the shared executor process pool (src.executors),
+    so PDF parsing shows up in its statistics and never starts a second set
+    of workers; an explicit worker count gets a dedicated pool of that size.
+    """
+    paths = [str(f) for f in files]
+    if workers == 1 or len(paths) <= 1:
+        yield from (_load_file(path) for path in paths)
+        return
+
+    if workers is None:
+        futures = [cpu_pool.submit(_load_file, path) for path in paths]
+        yield from (future.result() for future in (futures if ordered else as_completed(futures)))
+        return
+
+    context = multiprocessing.get_context(CPU_START_METHOD)
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths)), mp_context=context) as pool:
+        if ordered:
+            yield from pool.map(_load_file, paths)
+        else:
+            futures = [pool.submit(_load_file, path) for path in paths]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def iter_documents(data_dir: str, workers: Optional[int] = None) -> Iterator[Any]:
+    """Yield documents from data_dir as each file finishes loading.
+    
+    Files are parsed in parallel across a process pool and their documents
+    are yielded in completion order, so downstream chunking and embedding can
+    start before the whole corpus has been read.
+    
+    Args:
+        data_dir (str): Path to the directory containing documents to load.
+        workers (int, optional): Loader processes. Defaults to the shared
+            executor process pool (EXECUTOR_CPU_WORKERS); 1 loads serially in
+            the calling process.
+    
+    Yields:
+        Any: LangChain Document objects.
+    """
+    files = find_document_files(data_dir)
+    print(f"[DEBUG] Found {len(files)} supported files in {data_dir}")
+    for path, loaded, error in _load_files(files, workers, ordered=False):
+        if error:
+            print(f"[ERROR] Failed to load {path}: {error}")
+        yield from loaded
+
+
+def load_all_documents(data_dir: str, workers: Optional[int] = None) -> List[Any]:
     """Load all supported document files from the specified directory.
     
-    Recursively scans the data directory for supported file formats and converts
-    them into LangChain document objects for downstream RAG processing. Each document
-    is loaded with its metadata preserved for citation and traceability.
+    Walks the data directory once, dispatches on the file extension
+    case-insensitively (so "Act.PDF" is picked up) and parses the files
+    across a process pool. Each document is loaded with its metadata
+    preserved for citation and traceability.
     
     Args:
         data_dir (str): Path to the directory containing documents to load.
                        Can be relative or absolute path.
+        workers (int, optional): Loader processes. Defaults to the shared
+            executor process pool (EXECUTOR_CPU_WORKERS); 1 loads serially in
+            the calling process.
     
     Returns:
-        List[Any]: List of LangChain Document objects containing page_content and metadata.
-                   Returns empty list if no documents found or directory doesn't exist.
+        List[Any]: List of LangChain Document objects containing page_content and metadata,
+                   in file path order. Returns empty list if no documents found or
+                   directory doesn't exist.
     
     Supported Formats:
         - PDF (.pdf): Legal statutes, case laws, petitions
@@ -56,7 +177,7 @@ def load_all_documents(data_dir: str) -> List[Any]:
     Note:
         - Errors during individual file loading are caught and logged
         - Processing continues even if some files fail to load
-        - Debug logs track the loading progress for each file type
+        - Use iter_documents() to consume documents as files finish
     """
     data_path = Path(data_dir).resolve()
     
@@ -64,90 +185,20 @@ def load_all_documents(data_dir: str) -> List[Any]:
         print(f"[ERROR] Data directory does not exist: {data_path}")
         return []
     
-    print(f"[DEBUG] Data path: {data_path}")
+    files = find_document_files(data_dir)
+    print(f"[DEBUG] Found {len(files)} supported files in {data_path}")
     documents = []
+    failed = 0
+    for path, loaded, error in _load_files(files, workers, ordered=True):
+        if error:
+            failed += 1
+            print(f"[ERROR] Failed to load {path}: {error}")
+        documents.extend(loaded)
 
-    # PDF files
-    pdf_files = list(data_path.glob('**/*.pdf'))
-    print(f"[DEBUG] Found {len(pdf_files)} PDF files: {[str(f) for f in pdf_files]}")
-    for pdf_file in pdf_files:
-        print(f"[DEBUG] Loading PDF: {pdf_file}")
-        try:
-            loader = PyPDFLoader(str(pdf_file))
-            loaded = loader.load()
-            print(f"[DEBUG] Loaded {len(loaded)} PDF docs from {pdf_file}")
-            documents.extend(loaded)
-        except Exception as e:
-            print(f"[ERROR] Failed to load PDF {pdf_file}: {e}")
-
-    # TXT files
-    txt_files = list(data_path.glob('**/*.txt'))
-    print(f"[DEBUG] Found {len(txt_files)} TXT files: {[str(f) for f in txt_files]}")
-    for txt_file in txt_files:
-        print(f"[DEBUG] Loading TXT: {txt_file}")
-        try:
-            loader = TextLoader(str(txt_file), encoding='utf-8')
-            loaded = loader.load()
-            print(f"[DEBUG] Loaded {len(loaded)} TXT docs from {txt_file}")
-            documents.extend(loaded)
-        except Exception as e:
-            print(f"[ERROR] Failed to load TXT {txt_file}: {e}")
-
-    # CSV files
-    csv_files = list(data_path.glob('**/*.csv'))
-    print(f"[DEBUG] Found {len(csv_files)} CSV files: {[str(f) for f in csv_files]}")
-    for csv_file in csv_files:
-        print(f"[DEBUG] Loading CSV: {csv_file}")
-        try:
-            loader = CSVLoader(str(csv_file))
-            loaded = loader.load()
-            print(f"[DEBUG] Loaded {len(loaded)} CSV docs from {csv_file}")
-            documents.extend(loaded)
-        except Exception as e:
-            print(f"[ERROR] Failed to load CSV {csv_file}: {e}")
-
-    # Excel files
-    xlsx_files = list(data_path.glob('**/*.xlsx'))
-    print(f"[DEBUG] Found {len(xlsx_files)} Excel files: {[str(f) for f in xlsx_files]}")
-    for xlsx_file in xlsx_files:
-        print(f"[DEBUG] Loading Excel: {xlsx_file}")
-        try:
-            loader = UnstructuredExcelLoader(str(xlsx_file))
-            loaded = loader.load()
-            print(f"[DEBUG] Loaded {len(loaded)} Excel docs from {xlsx_file}")
-            documents.extend(loaded)
-        except Exception as e:
-            print(f"[ERROR] Failed to load Excel {xlsx_file}: {e}")
-
-    # Word files
-    docx_files = list(data_path.glob('**/*.docx'))
-    print(f"[DEBUG] Found {len(docx_files)} Word files: {[str(f) for f in docx_files]}")
-    for docx_file in docx_files:
-        print(f"[DEBUG] Loading Word: {docx_file}")
-        try:
-            loader = Docx2txtLoader(str(docx_file))
-            loaded = loader.load()
-            print(f"[DEBUG] Loaded {len(loaded)} Word docs from {docx_file}")
-            documents.extend(loaded)
-        except Exception as e:
-            print(f"[ERROR] Failed to load Word {docx_file}: {e}")
-
-    # JSON files
-    json_files = list(data_path.glob('**/*.json'))
-    print(f"[DEBUG] Found {len(json_files)} JSON files: {[str(f) for f in json_files]}")
-    for json_file in json_files:
-        print(f"[DEBUG] Loading JSON: {json_file}")
-        try:
-            loader = JSONLoader(str(json_file), jq_schema='.', text_content=False)
-            loaded = loader.load()
-            print(f"[DEBUG] Loaded {len(loaded)} JSON docs from {json_file}")
-            documents.extend(loaded)
-        except Exception as e:
-            print(f"[ERROR] Failed to load JSON {json_file}: {e}")
-
-    print(f"[DEBUG] Total loaded documents: {len(documents)}")
+    print(f"[DEBUG] Total loaded documents: {len(documents)} from {len(files) - failed} files")
     return documents
 
+
 # Example usage
 if __name__ == "__main__":
     docs = load_all_documents("docustore/pdf")
@@ -8,7 +8,12 @@ Functionalities:
     - Document chunking with configurable size and overlap
     - Semantic embedding generation using sentence-transformers
     - Batch processing of document chunks
+    - Streaming chunk-and-embed over document iterators in fixed-size batches
+    - Statute-aware chunking: one chunk per section with act/section metadata
+    - Multi-process chunk encoding with per-worker thread counts and a throughput report
+    - Selectable inference backend: PyTorch, ONNX Runtime, or int8-quantized ONNX
     - Support for legal document structure preservation
+    - Thread-safe LRU cache of query embeddings
 
 Typical Usage:
     from backend.src.embedding import EmbeddingPipeline
@@ -16,13 +21,229 @@ Typical Usage:
     pipeline = EmbeddingPipeline(chunk_size=1000, chunk_overlap=200)
     chunks = pipeline.chunk_documents(documents)
     embeddings = pipeline.embed_chunks(chunks)
+
+    for batch_chunks, batch_embeddings in pipeline.iter_batches(iter_documents("docustore/pdf")):
+        ...  # memory stays bounded by one batch
+
+    # Shard chunk encoding over 8 processes with 4 torch threads each
+    pipeline = EmbeddingPipeline(workers=8, threads_per_worker=4)
+    embeddings = pipeline.embed_chunks(chunks)
+    print(pipeline.get_encode_report())   # chunks_per_sec_per_core, ...
+    pipeline.close()
+
+    # Same model on ONNX Runtime with dynamically quantized int8 weights
+    pipeline = EmbeddingPipeline(backend="onnx-int8")
+
+    from backend.src.embedding import query_embedding_cache
+    vector = query_embedding_cache.get("all-MiniLM-L6-v2", "Section 35 refund")
 """
 
-from typing import List, Any
+import math
+import multiprocessing
+import os
+import threading
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from itertools import groupby
+from typing import List, Any, Dict, Iterable, Iterator, Optional, Tuple
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from sentence_transformers import SentenceTransformer
 import numpy as np
 from src.data_loader import load_all_documents
+from src.executors import CPU_START_METHOD
+from src.statute_splitter import StatuteSplitter, annotate_files
+
+
+def normalize_query(text: str) -> str:
+    """Normalize query text for cache lookups.
+    
+    Applies Unicode NFKC and collapses whitespace. Case is preserved because
+    cased embedding models treat it as signal.
+    
+    Args:
+        text (str): Raw query text.
+    
+    Returns:
+        str: Normalized text.
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class QueryEmbeddingCache:
+    """Bounded, thread-safe LRU cache of query embeddings.
+    
+    Keys are (model name, normalized query text), so one cache can serve
+    every vector store in the process. Cached vectors are read-only.
+    
+    Attributes:
+        max_entries (int): Maximum cached embeddings; 0 disables caching.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """Initialize an empty cache.
+        
+        Args:
+            max_entries (int): Maximum cached embeddings. Defaults to 1024.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for text, or None on a miss.
+        
+        Args:
+            model_name (str): Embedding model the vector came from.
+            text (str): Query text (normalized internally).
+        
+        Returns:
+            Optional[np.ndarray]: 1-D float32 embedding.
+        """
+        key = (model_name, normalize_query(text))
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return vector
+
+    def put(self, model_name: str, text: str, vector: np.ndarray):
+        """Store an embedding, evicting the least recently used entry when full.
+        
+        Args:
+            model_name (str): Embedding model the vector came from.
+            text (str): Query text (normalized internally).
+            vector (np.ndarray): 1-D embedding.
+        """
+        if self.max_entries <= 0:
+            return
+        vector = np.array(vector, dtype='float32')
+        vector.setflags(write=False)
+        key = (model_name, normalize_query(text))
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def encode(self, model: Any, model_name: str, texts: List[str]) -> np.ndarray:
+        """Embed texts, running the model only for cache misses.
+        
+        All misses are encoded together in one forward pass.
+        
+        Args:
+            model (SentenceTransformer): Model used for misses.
+            model_name (str): Name used in cache keys.
+            texts (List[str]): Query texts.
+        
+        Returns:
+            np.ndarray: Array of shape (len(texts), dimension), float32.
+        """
+        vectors = [self.get(model_name, text) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            encoded = model.encode([texts[i] for i in missing], batch_size=len(missing))
+            for i, vector in zip(missing, encoded):
+                self.put(model_name, texts[i], vector)
+                vectors[i] = vector
+        return np.asarray(vectors, dtype='float32')
+
+    def clear(self):
+        """Drop every cached embedding."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss statistics.
+        
+        Returns:
+            Dict[str, Any]: entries, max_entries, hits, misses and hit_rate.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Process-wide cache shared by all vector stores (keys include the model name)
+query_embedding_cache = QueryEmbeddingCache(max_entries=int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024")))
+
+
+# "recursive" = fixed-size character windows; "statute" = one chunk per Act section
+CHUNKING_STRATEGIES = ("recursive", "statute")
+
+# Inference backend for the sentence-transformer: "torch" (PyTorch), "onnx" (the
+# exported graph on ONNX Runtime) or "onnx-int8" (dynamically quantized weights).
+# ONNX backends need optimum[onnxruntime]; the int8 file ships with the Hub model
+# (onnx/model_qint8_avx512_vnni.onnx, onnx/model_quint8_avx2.onnx, ...) or can be
+# written with sentence_transformers.export_dynamic_quantized_onnx_model.
+EMBEDDING_BACKENDS = ("torch", "onnx", "onnx-int8")
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+ONNX_INT8_FILE = os.getenv("EMBEDDING_ONNX_INT8_FILE", "onnx/model_quint8_avx2.onnx")
+
+
+def backend_kwargs(backend: str) -> Dict[str, Any]:
+    """SentenceTransformer constructor arguments for an inference backend.
+    
+    Args:
+        backend (str): "torch", "onnx" or "onnx-int8".
+    
+    Returns:
+        Dict[str, Any]: Keyword arguments ({} for torch).
+    
+    Raises:
+        ValueError: If backend is not supported.
+    """
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unsupported embedding backend '{backend}'. Choose from: {', '.join(EMBEDDING_BACKENDS)}")
+    if backend == "torch":
+        return {}
+    if backend == "onnx":
+        return {"backend": "onnx"}
+    return {"backend": "onnx", "model_kwargs": {"file_name": ONNX_INT8_FILE}}
+
+
+# Multi-process chunk encoding for index builds: worker processes (1 encodes in
+# this process) and torch threads per worker (0 splits the cores evenly)
+EMBED_WORKERS = int(os.getenv("EMBED_WORKERS", "1"))
+EMBED_THREADS_PER_WORKER = int(os.getenv("EMBED_THREADS_PER_WORKER", "0"))
+
+# Model loaded once per encode worker process by _init_encode_worker
+_worker_model = None
+
+
+def _init_encode_worker(model_name: str, threads: int, backend: str = "torch"):
+    """Load a private model copy and pin its intra-op thread count.
+    
+    Runs once in each worker process of EmbeddingPipeline's encode pool.
+    """
+    global _worker_model
+    import torch
+    torch.set_num_threads(threads)
+    kwargs = backend_kwargs(backend)
+    if backend != "torch":
+        import onnxruntime
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = threads
+        kwargs["model_kwargs"] = {**kwargs.get("model_kwargs", {}), "session_options": session_options}
+    _worker_model = SentenceTransformer(model_name, **kwargs)
+
+
+def _encode_shard(texts: List[str]) -> np.ndarray:
+    """Encode one shard of chunk texts with the worker's model."""
+    return np.asarray(_worker_model.encode(texts), dtype='float32')
+
 
 class EmbeddingPipeline:
     """Pipeline for chunking documents and generating semantic embeddings.
@@ -33,27 +254,61 @@ class EmbeddingPipeline:
     Attributes:
         chunk_size (int): Maximum characters per chunk.
         chunk_overlap (int): Overlapping characters between chunks.
+        chunking (str): Splitting strategy, "recursive" or "statute".
         model (SentenceTransformer): Loaded embedding model.
+        workers (int): Encode processes for chunk embedding; 1 encodes in-process.
+        threads_per_worker (int): Torch (or ONNX Runtime) threads in each encode process.
+        backend (str): Inference backend, "torch", "onnx" or "onnx-int8".
     """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", chunk_size: int = 1000, chunk_overlap: int = 200,
+                 workers: Optional[int] = None, threads_per_worker: Optional[int] = None,
+                 start_method: str = CPU_START_METHOD, chunking: str = "recursive", backend: Optional[str] = None):
         """Initialize the embedding pipeline.
         
         Args:
             model_name (str): Sentence-transformer model name. Defaults to "all-MiniLM-L6-v2".
             chunk_size (int): Maximum characters per chunk. Defaults to 1000.
             chunk_overlap (int): Overlapping characters between chunks. Defaults to 200.
+            workers (int, optional): Encode processes, each with its own model copy.
+                Defaults to EMBED_WORKERS (1 = encode in this process).
+            threads_per_worker (int, optional): Torch threads per encode process.
+                Defaults to EMBED_THREADS_PER_WORKER, or the CPU count split across workers.
+            start_method (str): multiprocessing start method for the encode pool.
+                Defaults to EXECUTOR_CPU_START_METHOD.
+            chunking (str): "recursive" (fixed-size character windows) or "statute"
+                (one chunk per section, chunk_size being the longest kept whole).
+                Defaults to "recursive".
+            backend (str, optional): "torch", "onnx" or "onnx-int8". Defaults to EMBEDDING_BACKEND.
+        
+        Raises:
+            ValueError: If chunking or backend is not supported.
         """
+        self.backend = backend or EMBEDDING_BACKEND
+        model_kwargs = backend_kwargs(self.backend)
+        if chunking not in CHUNKING_STRATEGIES:
+            raise ValueError(f"Unsupported chunking '{chunking}'. Choose from: {', '.join(CHUNKING_STRATEGIES)}")
+        self.chunking = chunking
+        self.model_name = model_name
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.model = SentenceTransformer(model_name)
-        print(f"[INFO] Loaded embedding model: {model_name}")
+        self.workers = max(1, workers if workers is not None else EMBED_WORKERS)
+        cores = os.cpu_count() or 1
+        self.threads_per_worker = threads_per_worker or EMBED_THREADS_PER_WORKER or max(1, cores // self.workers)
+        self.start_method = start_method
+        self._pool = None
+        self._encoded_chunks = 0
+        self._encode_seconds = 0.0
+        self.model = SentenceTransformer(model_name, **model_kwargs)
+        print(f"[INFO] Loaded embedding model: {model_name} ({self.backend})")
 
     def chunk_documents(self, documents: List[Any]) -> List[Any]:
         """Split documents into smaller chunks for embedding.
         
         Uses recursive character splitting to preserve document structure while
-        maintaining semantic coherence within chunks.
+        maintaining semantic coherence within chunks, or with chunking="statute"
+        one chunk per Act section carrying act/chapter/section/page metadata.
+        Either way every chunk carries its file's act and jurisdiction.
         
         Args:
             documents (List[Any]): List of LangChain Document objects.
@@ -61,15 +316,20 @@ class EmbeddingPipeline:
         Returns:
             List[Any]: List of chunked Document objects with preserved metadata.
         """
-        splitter = RecursiveCharacterTextSplitter(
+        chunks = self._splitter().split_documents(annotate_files(documents))
+        print(f"[INFO] Split {len(documents)} documents into {len(chunks)} chunks.")
+        return chunks
+
+    def _splitter(self) -> Any:
+        """Build the text splitter for the configured strategy, chunk size and overlap."""
+        if self.chunking == "statute":
+            return StatuteSplitter(max_chars=self.chunk_size, overlap=self.chunk_overlap)
+        return RecursiveCharacterTextSplitter(
             chunk_size=self.chunk_size,
             chunk_overlap=self.chunk_overlap,
             length_function=len,
             separators=["\n\n", "\n", " ", ""]
         )
-        chunks = splitter.split_documents(documents)
-        print(f"[INFO] Split {len(documents)} documents into {len(chunks)} chunks.")
-        return chunks
 
     def embed_chunks(self, chunks: List[Any]) -> np.ndarray:
         """Generate semantic embeddings for document chunks.
@@ -85,10 +345,102 @@ class EmbeddingPipeline:
         """
         texts = [chunk.page_content for chunk in chunks]
         print(f"[INFO] Generating embeddings for {len(texts)} chunks...")
-        embeddings = self.model.encode(texts, show_progress_bar=True)
+        embeddings = self._encode(texts, show_progress_bar=self.workers == 1)
+        if self.workers > 1:
+            print(f"[INFO] Encode throughput: {self.get_encode_report()}")
         print(f"[INFO] Embeddings shape: {embeddings.shape}")
         return embeddings
 
+    def iter_batches(self, documents: Iterable[Any], batch_size: int = 256) -> Iterator[Tuple[List[Any], np.ndarray]]:
+        """Chunk and embed a document stream in fixed-size batches.
+        
+        Documents are split one source file at a time and their chunks
+        buffered until a batch is full, so at most one batch of chunks and embeddings is held in
+        memory regardless of corpus size.
+        
+        Args:
+            documents (Iterable[Any]): LangChain Document objects, e.g. from iter_documents().
+            batch_size (int): Chunks encoded per batch. Defaults to 256.
+        
+        Yields:
+            Tuple[List[Any], np.ndarray]: Chunk Documents and their float32 embeddings,
+            shape (len(chunks), embedding_dim). Only the last batch may be smaller.
+        """
+        splitter = self._splitter()
+        pending: List[Any] = []
+        # Split one source file at a time so statute sections spanning pages stay whole
+        for _, pages in groupby(documents, key=lambda doc: doc.metadata.get("source")):
+            pending.extend(splitter.split_documents(annotate_files(list(pages))))
+            while len(pending) >= batch_size:
+                batch, pending = pending[:batch_size], pending[batch_size:]
+                yield batch, self._encode_batch(batch)
+        if pending:
+            yield pending, self._encode_batch(pending)
+
+    def _encode_batch(self, chunks: List[Any]) -> np.ndarray:
+        """Encode one batch of chunks without progress output."""
+        return self._encode([chunk.page_content for chunk in chunks])
+
+    def _encode(self, texts: List[str], show_progress_bar: bool = False) -> np.ndarray:
+        """Encode texts in-process or sharded across the worker pool, in input order.
+        
+        Shards are contiguous slices (about four per worker for load
+        balancing); pool.map returns them in submission order, so
+        concatenating them restores the original chunk order.
+        """
+        start = time.perf_counter()
+        if self.workers > 1 and len(texts) > 1:
+            shard_size = max(1, math.ceil(len(texts) / (self.workers * 4)))
+            shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+            embeddings = np.concatenate(list(self._get_pool().map(_encode_shard, shards)))
+        else:
+            embeddings = np.asarray(self.model.encode(texts, show_progress_bar=show_progress_bar), dtype='float32')
+        self._encoded_chunks += len(texts)
+        self._encode_seconds += time.perf_counter() - start
+        return embeddings
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the encode pool on first use; workers load the model once."""
+        if self._pool is None:
+            print(f"[INFO] Starting {self.workers} encode workers x {self.threads_per_worker} threads")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_encode_worker,
+                initargs=(self.model_name, self.threads_per_worker, self.backend),
+            )
+        return self._pool
+
+    def get_encode_report(self) -> Dict[str, Any]:
+        """Return encode throughput since the pipeline was created.
+        
+        Returns:
+            Dict[str, Any]: chunks, seconds, workers, threads_per_worker, cores
+            (workers x threads), chunks_per_sec and chunks_per_sec_per_core.
+        """
+        cores = self.workers * self.threads_per_worker if self.workers > 1 else (os.cpu_count() or 1)
+        rate = self._encoded_chunks / self._encode_seconds if self._encode_seconds else 0.0
+        return {
+            "chunks": self._encoded_chunks,
+            "seconds": round(self._encode_seconds, 3),
+            "workers": self.workers,
+            "threads_per_worker": self.threads_per_worker if self.workers > 1 else None,
+            "cores": cores,
+            "chunks_per_sec": round(rate, 1),
+            "chunks_per_sec_per_core": round(rate / cores, 2),
+        }
+
+    def reset_encode_report(self):
+        """Zero the throughput counters, e.g. after a warm-up batch."""
+        self._encoded_chunks = 0
+        self._encode_seconds = 0.0
+
+    def close(self):
+        """Shut down the encode worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
 # Example usage
 if __name__ == "__main__":
     
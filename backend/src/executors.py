@@ -0,0 +1,198 @@
+"""Executor Layer for Nyaya-Flow Legal Aid Platform.
+
+This module keeps blocking and CPU-heavy work off the asyncio event loop. It
+provides two process-wide pools with queue-depth and wait-time accounting so a
+slow embedding or PDF parse cannot stall Socket.IO transcription or other
+requests served by the same loop.
+
+Pools:
+    - io: Bounded thread pool for synchronous clients (Tavily, Groq, SQLite)
+      and for in-process model work (SentenceTransformer.encode, FAISS search),
+      which releases the GIL but holds state that cannot cross process
+      boundaries cheaply.
+    - cpu: Process pool for picklable, CPU-bound work. Document loading
+      (src.data_loader) parses each file on it during index builds.
+
+Configuration (environment variables):
+    - EXECUTOR_IO_WORKERS: Thread pool size. Defaults to 16.
+    - EXECUTOR_CPU_WORKERS: Process pool size. Defaults to the CPU count.
+    - EXECUTOR_CPU_START_METHOD: multiprocessing start method. Defaults to
+      "spawn", which is safe after torch/FAISS have started native threads.
+
+Typical Usage:
+    from src.executors import run_io, run_cpu, get_executor_stats
+
+    results = await run_io(store.query, "Section 35 refund", 5)
+    pages = await run_cpu(load_document, "docustore/pdf/TheKeralaPublicHealthAct2023.pdf")
+    print(get_executor_stats())
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, InvalidStateError, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+IO_WORKERS = int(os.getenv("EXECUTOR_IO_WORKERS", "16"))
+CPU_WORKERS = int(os.getenv("EXECUTOR_CPU_WORKERS", str(os.cpu_count() or 2)))
+CPU_START_METHOD = os.getenv("EXECUTOR_CPU_START_METHOD", "spawn")
+
+
+def _timed_call(fn: Callable, submitted_at: float, args: tuple, kwargs: dict):
+    """Run fn and report how long it waited in the queue.
+
+    Defined at module level so it can be pickled into process-pool workers.
+    Wall-clock time is used because the call may start in another process.
+    """
+    waited = time.time() - submitted_at
+    return waited, fn(*args, **kwargs)
+
+
+class ExecutorPool:
+    """A lazily created executor with queue-depth and wait-time statistics.
+
+    Attributes:
+        name (str): Pool name used in statistics ("io" or "cpu").
+        max_workers (int): Maximum concurrent workers.
+    """
+
+    def __init__(self, name: str, executor_factory: Callable[[int], Executor], max_workers: int):
+        """Initialize the pool without starting any workers.
+
+        Args:
+            name (str): Pool name used in statistics.
+            executor_factory (Callable[[int], Executor]): Builds the executor for a worker count.
+            max_workers (int): Maximum concurrent workers.
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._factory = executor_factory
+        self._executor = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._in_flight = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._factory(self.max_workers)
+            return self._executor
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Submit fn(*args, **kwargs) and return a future for its result.
+
+        Args:
+            fn (Callable): Function to run. Must be picklable for the cpu pool.
+
+        Returns:
+            Future: Resolves to the function's return value.
+        """
+        executor = self._get_executor()
+        with self._lock:
+            self._submitted += 1
+            self._in_flight += 1
+
+        result_future = Future()
+        inner = executor.submit(_timed_call, fn, time.time(), args, kwargs)
+        inner.add_done_callback(lambda f: self._on_done(f, result_future))
+        return result_future
+
+    def _on_done(self, inner: Future, result_future: Future):
+        """Record statistics and forward the result or exception."""
+        if inner.cancelled():
+            with self._lock:
+                self._in_flight -= 1
+            result_future.cancel()
+            return
+
+        error = inner.exception()
+        with self._lock:
+            self._in_flight -= 1
+            if error is not None:
+                self._failed += 1
+            else:
+                waited, _ = inner.result()
+                self._completed += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+
+        try:
+            if error is not None:
+                result_future.set_exception(error)
+            else:
+                result_future.set_result(inner.result()[1])
+        except InvalidStateError:
+            # The awaiting coroutine gave up (e.g. a timeout) before completion
+            pass
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Await fn(*args, **kwargs) on this pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, throughput and wait-time statistics.
+
+        Returns:
+            Dict[str, Any]: Counters plus average and maximum queue wait in ms.
+        """
+        with self._lock:
+            finished = self._completed
+            return {
+                "max_workers": self.max_workers,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "in_flight": self._in_flight,
+                "queue_depth": max(self._in_flight - self.max_workers, 0),
+                "avg_wait_ms": round(self._total_wait / finished * 1000, 2) if finished else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the underlying executor; it is recreated on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+io_pool = ExecutorPool(
+    "io",
+    lambda n: ThreadPoolExecutor(max_workers=n, thread_name_prefix="nyaya-io"),
+    IO_WORKERS,
+)
+cpu_pool = ExecutorPool(
+    "cpu",
+    lambda n: ProcessPoolExecutor(max_workers=n, mp_context=multiprocessing.get_context(CPU_START_METHOD)),
+    CPU_WORKERS,
+)
+
+
+async def run_io(fn: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call on the bounded I/O thread pool."""
+    return await io_pool.run(fn, *args, **kwargs)
+
+
+async def run_cpu(fn: Callable, *args, **kwargs) -> Any:
+    """Run a picklable CPU-bound call on the process pool."""
+    return await cpu_pool.run(fn, *args, **kwargs)
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Return statistics for every pool, keyed by pool name."""
+    return {pool.name: pool.stats() for pool in (io_pool, cpu_pool)}
+
+
+def shutdown_executors(wait: bool = True):
+    """Shut down all pools (called on application shutdown)."""
+    for pool in (io_pool, cpu_pool):
+        pool.shutdown(wait=wait)
@@ -0,0 +1,176 @@
+"""Index Manifest Module for Nyaya-Flow Legal Aid Platform.
+
+This module tracks which source documents are in the FAISS index so the
+vector store can be updated incrementally. For every document it records the
+content hash and the range of vector IDs holding its chunks; adding, changing
+or removing one Act then only embeds, inserts or deletes that Act's chunks.
+
+Functionalities:
+    - Content hashing of source documents
+    - Persistent manifest (manifest.json next to faiss.index)
+    - Diff of the document directory against the index (added/changed/removed)
+    - Command-line status and sync commands
+
+Typical Usage:
+    python -m src.index_manifest status --data-dir docustore/pdf --persist-dir data/faiss_store
+    python -m src.index_manifest sync --data-dir docustore/pdf --persist-dir data/faiss_store
+
+    from src.vectorstore import FaissVectorStore
+    store = FaissVectorStore("data/faiss_store")
+    store.load()
+    store.sync_documents("docustore/pdf")
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.data_loader import find_document_files
+
+MANIFEST_VERSION = 1
+
+
+def hash_file(file_path: Path) -> str:
+    """Return the SHA-256 of a file's content.
+
+    Args:
+        file_path (Path): File to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IndexManifest:
+    """Per-document record of content hashes and vector ID ranges.
+
+    Attributes:
+        path (str): Location of manifest.json.
+        settings (dict): Embedding model and chunking settings the index was built with.
+        documents (Dict[str, dict]): Entries keyed by path relative to the data directory,
+            each with sha256, id_start, id_end (exclusive), num_chunks and indexed_at.
+    """
+
+    def __init__(self, persist_dir: str):
+        """Initialize an empty manifest for persist_dir (call load() to read it).
+
+        Args:
+            persist_dir (str): Vector store directory holding manifest.json.
+        """
+        self.path = os.path.join(persist_dir, "manifest.json")
+        self.settings: Dict[str, Any] = {}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+
+    def exists(self) -> bool:
+        """Return True if a manifest has been saved."""
+        return os.path.exists(self.path)
+
+    def load(self) -> "IndexManifest":
+        """Read manifest.json if present.
+
+        Returns:
+            IndexManifest: self, for chaining.
+        """
+        if self.exists():
+            with open(self.path) as f:
+                data = json.load(f)
+            self.settings = data.get("settings", {})
+            self.documents = data.get("documents", {})
+        return self
+
+    def save(self):
+        """Write manifest.json."""
+        with open(self.path, "w") as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "settings": self.settings,
+                "documents": self.documents,
+            }, f, indent=2)
+
+    def record(self, name: str, sha256: str, ids: List[int]):
+        """Record the vector IDs now holding a document's chunks.
+
+        Args:
+            name (str): Document path relative to the data directory.
+            sha256 (str): Content hash of the indexed version.
+            ids (List[int]): Contiguous vector IDs assigned to its chunks.
+        """
+        self.documents[name] = {
+            "sha256": sha256,
+            "id_start": int(ids[0]) if len(ids) else 0,
+            "id_end": int(ids[-1]) + 1 if len(ids) else 0,
+            "num_chunks": len(ids),
+            "indexed_at": datetime.utcnow().isoformat(),
+        }
+
+    def ids_for(self, name: str) -> List[int]:
+        """Return the vector IDs recorded for a document."""
+        entry = self.documents[name]
+        return list(range(entry["id_start"], entry["id_end"]))
+
+    def diff(self, data_dir: str) -> Dict[str, Any]:
+        """Compare the documents on disk with the manifest.
+
+        Args:
+            data_dir (str): Directory holding the source documents.
+
+        Returns:
+            Dict[str, Any]: "added", "changed", "removed" and "unchanged" lists of
+            relative paths, plus "hashes" mapping each file on disk to its SHA-256.
+        """
+        root = Path(data_dir).resolve()
+        hashes = {str(p.relative_to(root)): hash_file(p) for p in find_document_files(data_dir)}
+        added = [name for name in hashes if name not in self.documents]
+        changed = [name for name in hashes
+                   if name in self.documents and self.documents[name]["sha256"] != hashes[name]]
+        removed = [name for name in self.documents if name not in hashes]
+        unchanged = [name for name in hashes if name not in added and name not in changed]
+        return {"added": added, "changed": changed, "removed": removed,
+                "unchanged": unchanged, "hashes": hashes}
+
+
+def print_status(data_dir: str, persist_dir: str):
+    """Print which documents are stale relative to the index.
+
+    Args:
+        data_dir (str): Directory holding the source documents.
+        persist_dir (str): Vector store directory.
+    """
+    manifest = IndexManifest(persist_dir).load()
+    if not manifest.exists():
+        print(f"[INFO] No manifest in {persist_dir}; the next sync rebuilds the index.")
+    status = manifest.diff(data_dir)
+    for label in ("added", "changed", "removed"):
+        for name in status[label]:
+            print(f"  {label:<9} {name}")
+    stale = sum(len(status[label]) for label in ("added", "changed", "removed"))
+    print(f"[INFO] {len(status['unchanged'])} up to date, {stale} stale")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or update the incremental FAISS index.")
+    parser.add_argument("command", choices=["status", "sync"])
+    parser.add_argument("--data-dir", default="docustore/pdf")
+    parser.add_argument("--persist-dir", default="data/faiss_store")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        print_status(args.data_dir, args.persist_dir)
+    else:
+        from src.vectorstore import FaissVectorStore
+        from src.statute_splitter import STATUTE_MAX_CHARS
+        chunking = os.getenv("CHUNKING_STRATEGY", "recursive")
+        store = FaissVectorStore(args.persist_dir, index_type=os.getenv("FAISS_INDEX_TYPE", "flat"), chunking=chunking,
+                                 chunk_size=STATUTE_MAX_CHARS if chunking == "statute" else 1000)
+        if os.path.exists(os.path.join(args.persist_dir, "faiss.index")):
+            store.load()
+        print(store.sync_documents(args.data_dir))
@@ -0,0 +1,191 @@
+"""Metadata Filter Module for Nyaya-Flow Legal Aid Platform.
+
+This module restricts vector search to chunks matching metadata filters such
+as {"jurisdiction": "Kerala"}. It keeps an inverted index from each
+filterable field value to the vector IDs carrying it, and turns a filter into
+a FAISS IDSelector that is applied inside index.search: vectors outside the
+selection are skipped during the scan (flat, scalar-quantized and IVF
+indexes) or graph traversal (HNSW), instead of being searched and discarded
+afterwards. A Kerala-only grievance therefore scans only Kerala vectors.
+
+Filters AND across fields and OR within a field's list of values. Act values
+are normalized like citations ("The Kerala Public Health Act, 2023" and
+"Kerala Public Health Act" match), other values case-insensitively.
+
+Functionalities:
+    - field -> value -> vector ID postings for jurisdiction, act and source
+    - Incremental add/remove alongside the FAISS index
+    - Filter to ID array resolution and FAISS search parameters with an IDSelector
+    - JSON persistence (filters.json next to faiss.index)
+
+Typical Usage:
+    from src.metadata_filter import MetadataFilterIndex
+
+    filters = MetadataFilterIndex()
+    filters.add([0, 1], [{"jurisdiction": "Kerala"}, {"jurisdiction": "Tamil Nadu"}])
+    filters.select({"jurisdiction": ["Kerala", "India"]})   # array([0])
+"""
+
+import json
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import faiss
+import numpy as np
+
+from src.citation_index import normalize_act_key
+from src.statute_splitter import detect_jurisdiction
+
+FILTERS_FILE = "filters.json"
+FILTER_FIELDS = ("jurisdiction", "act", "source")
+
+
+def filter_key(field: str, value: Any) -> str:
+    """Normalize a field value for matching.
+
+    Args:
+        field (str): One of FILTER_FIELDS.
+        value (Any): Stored or requested value.
+
+    Returns:
+        str: Act key for "act", the normalized path for "source", else the lower-cased value.
+    """
+    if field == "act":
+        return normalize_act_key(str(value))
+    if field == "source":
+        return Path(str(value)).as_posix().lower()
+    return " ".join(str(value).split()).lower()
+
+
+def _field_values(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Filterable values of one chunk (jurisdiction derived for stores that predate it)."""
+    values = {field: metadata.get(field) for field in FILTER_FIELDS}
+    if values["jurisdiction"] is None:
+        values["jurisdiction"] = detect_jurisdiction(metadata.get("act"), metadata.get("source"))
+    return {field: value for field, value in values.items() if value is not None}
+
+
+class MetadataFilterIndex:
+    """Inverted index from filterable metadata values to vector IDs.
+
+    Attributes:
+        postings (Dict[str, Dict[str, List[int]]]): field -> normalized value -> vector IDs.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.postings: Dict[str, Dict[str, List[int]]] = {field: defaultdict(list) for field in FILTER_FIELDS}
+
+    def add(self, ids: Sequence[int], metadatas: Sequence[Any]):
+        """Index the filterable fields of new chunks.
+
+        Args:
+            ids (Sequence[int]): Vector IDs, one per metadata record.
+            metadatas (Sequence[Any]): Chunk metadata dicts; None records are skipped.
+        """
+        for doc_id, meta in zip(ids, metadatas):
+            if not meta:
+                continue
+            for field, value in _field_values(meta).items():
+                self.postings[field][filter_key(field, value)].append(int(doc_id))
+
+    def remove(self, ids: Sequence[int], metadatas: Sequence[Any]):
+        """Drop vector IDs, using their metadata to find the postings.
+
+        Args:
+            ids (Sequence[int]): Vector IDs to remove.
+            metadatas (Sequence[Any]): The metadata they were indexed with.
+        """
+        for doc_id, meta in zip(ids, metadatas):
+            if not meta:
+                continue
+            for field, value in _field_values(meta).items():
+                key = filter_key(field, value)
+                ids_for_key = self.postings[field].get(key)
+                if ids_for_key and int(doc_id) in ids_for_key:
+                    ids_for_key.remove(int(doc_id))
+                    if not ids_for_key:
+                        del self.postings[field][key]
+
+    def values(self, field: str) -> Dict[str, int]:
+        """Return each indexed value of a field with its chunk count."""
+        return {key: len(ids) for key, ids in self.postings[field].items()}
+
+    def select(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Return the vector IDs matching every filter.
+
+        Args:
+            filters (Dict[str, Any]): field -> value or list of accepted values.
+
+        Returns:
+            np.ndarray: Sorted int64 vector IDs (empty if nothing matches).
+
+        Raises:
+            ValueError: If a field is not filterable.
+        """
+        selected: Optional[set] = None
+        for field, accepted in filters.items():
+            if field not in FILTER_FIELDS:
+                raise ValueError(f"Unsupported filter field '{field}'. Choose from: {', '.join(FILTER_FIELDS)}")
+            if isinstance(accepted, (str, int)):
+                accepted = [accepted]
+            ids = set()
+            for value in accepted:
+                ids.update(self.postings[field].get(filter_key(field, value), ()))
+            selected = ids if selected is None else selected & ids
+        return np.array(sorted(selected or ()), dtype="int64")
+
+    def save(self, directory: str):
+        """Write filters.json to directory (atomically, like the FAISS index)."""
+        path = os.path.join(directory, FILTERS_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.postings, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, directory: str) -> "MetadataFilterIndex":
+        """Read filters.json from directory.
+
+        Raises:
+            FileNotFoundError: If the index has not been saved.
+        """
+        with open(os.path.join(directory, FILTERS_FILE)) as f:
+            data = json.load(f)
+        index = cls()
+        for field in FILTER_FIELDS:
+            index.postings[field].update(data.get(field, {}))
+        return index
+
+    @classmethod
+    def exists(cls, directory: str) -> bool:
+        """Return True if directory holds a saved filter index."""
+        return os.path.exists(os.path.join(directory, FILTERS_FILE))
+
+
+def search_parameters(ids: np.ndarray, index_type: str, index_params: Dict[str, Any]) -> faiss.SearchParameters:
+    """Build FAISS search parameters that restrict a search to ids.
+
+    IVF and HNSW indexes take their own parameter classes, which also carry
+    the nprobe / efSearch the store is configured with (explicit parameters
+    replace the values set on the index).
+
+    Args:
+        ids (np.ndarray): Allowed vector IDs (int64).
+        index_type (str): FaissVectorStore index type.
+        index_params (Dict[str, Any]): The store's index parameters.
+
+    Returns:
+        faiss.SearchParameters: Parameters with an IDSelectorBatch; the
+        selector is attached to the returned object so it outlives the call.
+    """
+    selector = faiss.IDSelectorBatch(ids)
+    if index_type in ("ivf", "ivfpq"):
+        params = faiss.SearchParametersIVF(sel=selector, nprobe=int(index_params.get("nprobe", 1)))
+    elif index_type == "hnsw":
+        params = faiss.SearchParametersHNSW(sel=selector, efSearch=int(index_params.get("efSearch", 16)))
+    else:
+        params = faiss.SearchParameters(sel=selector)
+    params.selector_ref = selector
+    return params
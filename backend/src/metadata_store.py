@@ -0,0 +1,160 @@
+"""Metadata Store Module for Nyaya-Flow Legal Aid Platform.
+
+This module stores per-chunk metadata (chunk text, source, ...) for the FAISS
+vector store in a memory-mappable format instead of a pickled list. Records
+are JSON documents concatenated into one blob, with an int64 offset array
+giving each record's byte range, so:
+
+    - Loading only maps the two files; nothing is parsed up front
+    - A lookup decodes just the requested record straight from the mapping
+    - Forked or spawned workers that open the same files share page-cache pages
+
+Files (in the vector store directory):
+    - metadata.bin: Concatenated UTF-8 JSON records
+    - metadata.offsets.npy: int64 offsets, length n + 1; record i is
+      bin[offsets[i]:offsets[i + 1]]. An empty record marks a deleted vector.
+
+Typical Usage:
+    from src.metadata_store import MetadataStore
+
+    MetadataStore.write("data/faiss_store", [{"text": "Section 35 ..."}])
+    metadata = MetadataStore.open("data/faiss_store")
+    print(metadata[0]["text"])
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+BLOB_FILE = "metadata.bin"
+OFFSETS_FILE = "metadata.offsets.npy"
+
+
+class MetadataStore:
+    """List-like view over memory-mapped metadata records.
+
+    Records loaded from disk stay in the mapping; appended or replaced records
+    are kept in memory until the next write(). Index i holds the metadata of
+    vector ID i, and None marks a deleted vector.
+    """
+
+    def __init__(self, records: Optional[Iterable[Any]] = None):
+        """Create an in-memory store, optionally seeded with records.
+
+        Args:
+            records (Iterable[Any], optional): Initial metadata records.
+        """
+        self._blob = None
+        self._offsets = np.zeros(1, dtype='int64')
+        self._overrides: Dict[int, Any] = {}
+        self._appended: List[Any] = list(records or [])
+
+    @classmethod
+    def exists(cls, directory: str) -> bool:
+        """Return True if directory holds a written metadata store."""
+        return os.path.exists(os.path.join(directory, BLOB_FILE)) and \
+            os.path.exists(os.path.join(directory, OFFSETS_FILE))
+
+    @classmethod
+    def open(cls, directory: str) -> "MetadataStore":
+        """Memory-map a store written by write().
+
+        Args:
+            directory (str): Directory holding metadata.bin and metadata.offsets.npy.
+
+        Returns:
+            MetadataStore: Store backed by the mapped files.
+        """
+        store = cls()
+        store._offsets = np.load(os.path.join(directory, OFFSETS_FILE), mmap_mode='r')
+        blob_path = os.path.join(directory, BLOB_FILE)
+        # np.memmap cannot map an empty file
+        store._blob = np.memmap(blob_path, dtype='uint8', mode='r') if os.path.getsize(blob_path) else None
+        return store
+
+    @staticmethod
+    def write(directory: str, records: Iterable[Any]):
+        """Write records to directory, replacing any previous store atomically.
+
+        Files are written under temporary names and renamed into place, so
+        processes that still map the old files keep a consistent view.
+
+        Args:
+            directory (str): Destination directory.
+            records (Iterable[Any]): JSON-serializable records (None for deleted vectors).
+        """
+        blob_path = os.path.join(directory, BLOB_FILE)
+        offsets_path = os.path.join(directory, OFFSETS_FILE)
+        offsets = [0]
+        with open(blob_path + ".tmp", "wb") as f:
+            for record in records:
+                if record is not None:
+                    f.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+                offsets.append(f.tell())
+        with open(offsets_path + ".tmp", "wb") as f:
+            np.save(f, np.asarray(offsets, dtype='int64'))
+        os.replace(blob_path + ".tmp", blob_path)
+        os.replace(offsets_path + ".tmp", offsets_path)
+
+    @property
+    def _base_len(self) -> int:
+        return len(self._offsets) - 1
+
+    def _read(self, i: int) -> Any:
+        start, end = int(self._offsets[i]), int(self._offsets[i + 1])
+        if start == end:
+            return None
+        return json.loads(self._blob[start:end].tobytes())
+
+    def __len__(self) -> int:
+        return self._base_len + len(self._appended)
+
+    def __getitem__(self, i: int) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("metadata index out of range")
+        if i >= self._base_len:
+            return self._appended[i - self._base_len]
+        if i in self._overrides:
+            return self._overrides[i]
+        return self._read(i)
+
+    def __setitem__(self, i: int, record: Any):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("metadata index out of range")
+        if i >= self._base_len:
+            self._appended[i - self._base_len] = record
+        else:
+            self._overrides[i] = record
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, MetadataStore)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def count_live(self) -> int:
+        """Count non-deleted records without decoding them."""
+        lengths = np.diff(self._offsets)
+        live = int(np.count_nonzero(lengths))
+        for i, record in self._overrides.items():
+            live += int(record is not None) - int(lengths[i] > 0)
+        return live + sum(1 for record in self._appended if record is not None)
+
+    def append(self, record: Any):
+        """Add the record for the next vector ID."""
+        self._appended.append(record)
+
+    def extend(self, records: Iterable[Any]):
+        """Add records for the next vector IDs."""
+        self._appended.extend(records)
@@ -0,0 +1,259 @@
+"""Provision Summaries Module for Nyaya-Flow Legal Aid Platform.
+
+This module moves chunk summarization out of the request path. The statute
+corpus changes rarely, so an offline build stage summarizes every indexed
+chunk once (with statute chunking, one chunk is one section) and stores the
+summaries in summaries.json next to faiss.index. At query time RAGSearch
+assembles its context from the stored summaries of the retrieved chunks
+instead of calling Groq.
+
+Summaries are keyed by the SHA-256 of the chunk text, so they survive vector
+ID changes from incremental syncs and go stale only when the text itself
+changes. A rebuild reuses every summary whose chunk hash (and generator) is
+unchanged, generates the missing ones and prunes summaries of chunks that
+are no longer indexed.
+
+Functionalities:
+    - Chunk hashing and a hash -> summary store (summaries.json)
+    - Incremental offline build with Groq or local extractive generators
+    - Periodic saves so an interrupted build resumes where it stopped
+    - Command-line status and build commands
+
+Typical Usage:
+    python -m src.provision_summaries status --persist-dir data/faiss_store
+    python -m src.provision_summaries build --persist-dir data/faiss_store --generator groq --workers 4
+
+    from src.provision_summaries import ProvisionSummaries
+    summaries = ProvisionSummaries.load("data/faiss_store")
+    summaries.get(results[0]["metadata"]["text"])
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+SUMMARIES_FILE = "summaries.json"
+SUMMARIES_VERSION = 1
+GENERATORS = ("groq", "extractive")
+
+SUMMARY_PROMPT = """Summarize the following statutory provision in two or three plain sentences for a legal researcher.
+State who it applies to, what it requires or permits, and any time limits, penalties or remedies.
+Do not add information that is not in the text.
+
+{citation}{text}
+
+Summary:"""
+
+
+def chunk_hash(text: str) -> str:
+    """Return the SHA-256 of a chunk's text (the summary version key).
+
+    Args:
+        text (str): Chunk text as stored in the vector store metadata.
+
+    Returns:
+        str: Hex digest.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _citation(metadata: Dict[str, Any]) -> str:
+    """"[Act, Section N]" heading for statute chunks, else empty."""
+    if metadata.get("act") and metadata.get("section"):
+        return f"[{metadata['act']}, Section {metadata['section']}]\n"
+    return ""
+
+
+def groq_generator(llm_model: str = "llama-3.3-70b-versatile") -> Tuple[str, Callable[[Dict[str, Any]], str]]:
+    """Abstractive generator backed by Groq.
+
+    Args:
+        llm_model (str): Groq model name.
+
+    Returns:
+        Tuple[str, Callable]: Generator name recorded with each summary, and a
+        function from chunk metadata to summary text.
+    """
+    from langchain_groq import ChatGroq
+    llm = ChatGroq(groq_api_key=os.getenv("GROQ_API_KEY", ""), model_name=llm_model)
+
+    def summarize(metadata: Dict[str, Any]) -> str:
+        prompt = SUMMARY_PROMPT.format(citation=_citation(metadata), text=metadata.get("text", ""))
+        return llm.invoke([prompt]).content.strip()
+
+    return f"groq:{llm_model}", summarize
+
+
+def extractive_generator(model: Any, max_sentences: int = 3, max_chars: int = 600) -> Tuple[str, Callable[[Dict[str, Any]], str]]:
+    """Local generator that keeps a chunk's most representative sentences.
+
+    Sentences are picked by MMR against the section title (or the chunk's
+    first sentence when it has none); no network call is made.
+
+    Args:
+        model (SentenceTransformer): Loaded embedding model.
+        max_sentences (int): Sentences kept per summary. Defaults to 3.
+        max_chars (int): Character budget per summary. Defaults to 600.
+
+    Returns:
+        Tuple[str, Callable]: Generator name and summarize function.
+    """
+    from src.extractive_summarizer import ExtractiveSummarizer, split_sentences
+    summarizer = ExtractiveSummarizer(model, max_sentences=max_sentences, max_chars=max_chars)
+
+    def summarize(metadata: Dict[str, Any]) -> str:
+        text = metadata.get("text", "")
+        focus = metadata.get("section_title") or next(iter(split_sentences(text)), "")
+        return " ".join(sentence for _, _, sentence in summarizer.select(focus, [{"metadata": {"text": text}}]))
+
+    return f"extractive:{max_sentences}x{max_chars}", summarize
+
+
+class ProvisionSummaries:
+    """Summaries of indexed chunks, keyed by chunk text hash.
+
+    Attributes:
+        entries (Dict[str, dict]): chunk hash -> {"summary", "generator", "generated_at"}.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, text: str) -> Optional[str]:
+        """Return the stored summary for a chunk's text, or None if it has none."""
+        entry = self.entries.get(chunk_hash(text))
+        return entry["summary"] if entry else None
+
+    def status(self, metadatas: Iterable[Any], generator: Optional[str] = None) -> Dict[str, int]:
+        """Count indexed chunks with current, missing and orphaned summaries.
+
+        Args:
+            metadatas (Iterable[Any]): Vector store metadata records (None for deleted IDs).
+            generator (str, optional): Count summaries from other generators as missing.
+
+        Returns:
+            Dict[str, int]: chunks, current, missing and orphaned counts.
+        """
+        hashes = {chunk_hash(meta.get("text", "")) for meta in metadatas if meta}
+        current = sum(1 for h in hashes if h in self.entries
+                      and (generator is None or self.entries[h]["generator"] == generator))
+        return {
+            "chunks": len(hashes),
+            "current": current,
+            "missing": len(hashes) - current,
+            "orphaned": sum(1 for h in self.entries if h not in hashes),
+        }
+
+    def build(self, metadatas: Iterable[Any], generator: str, summarize: Callable[[Dict[str, Any]], str],
+              persist_dir: Optional[str] = None, workers: int = 1, save_every: int = 100,
+              limit: Optional[int] = None) -> Dict[str, int]:
+        """Summarize every chunk without a current summary.
+
+        Args:
+            metadatas (Iterable[Any]): Vector store metadata records with "text".
+            generator (str): Generator name; summaries from another generator are regenerated.
+            summarize (Callable[[Dict[str, Any]], str]): Chunk metadata -> summary.
+            persist_dir (str, optional): Save here every save_every summaries and at the end.
+            workers (int): Concurrent summarize calls (threads; Groq calls are I/O bound). Defaults to 1.
+            save_every (int): Summaries generated between saves. Defaults to 100.
+            limit (int, optional): Generate at most this many summaries in this run.
+
+        Returns:
+            Dict[str, int]: generated, reused, pruned and failed counts.
+        """
+        pending: Dict[str, Dict[str, Any]] = {}
+        live = set()
+        for meta in metadatas:
+            if not meta or not meta.get("text"):
+                continue
+            key = chunk_hash(meta["text"])
+            live.add(key)
+            entry = self.entries.get(key)
+            if (entry is None or entry["generator"] != generator) and key not in pending:
+                pending[key] = meta
+
+        stale = [key for key in self.entries if key not in live]
+        for key in stale:
+            del self.entries[key]
+        todo: List[Tuple[str, Dict[str, Any]]] = list(pending.items())[:limit]
+        stats = {"generated": 0, "reused": len(live) - len(pending), "pruned": len(stale), "failed": 0}
+        print(f"[INFO] {len(todo)} summaries to generate, {stats['reused']} reused, {len(stale)} pruned")
+
+        def run(item: Tuple[str, Dict[str, Any]]) -> Tuple[str, Optional[str]]:
+            key, meta = item
+            try:
+                return key, summarize(meta)
+            except Exception as e:
+                print(f"[WARN] Summary failed for {_citation(meta).strip() or meta.get('source', key[:12])}: {e}")
+                return key, None
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for offset in range(0, len(todo), max(1, save_every)):
+                for key, summary in pool.map(run, todo[offset:offset + max(1, save_every)]):
+                    if summary is None:
+                        stats["failed"] += 1
+                        continue
+                    self.entries[key] = {"summary": summary, "generator": generator,
+                                         "generated_at": datetime.utcnow().isoformat()}
+                    stats["generated"] += 1
+                if persist_dir:
+                    self.save(persist_dir)
+                print(f"[INFO] Generated {stats['generated']}/{len(todo)} summaries")
+        if persist_dir:
+            self.save(persist_dir)
+        return stats
+
+    def save(self, directory: str):
+        """Write summaries.json to directory (atomically, like the FAISS index)."""
+        path = os.path.join(directory, SUMMARIES_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"version": SUMMARIES_VERSION, "entries": self.entries}, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, directory: str) -> "ProvisionSummaries":
+        """Read summaries.json from directory, or return an empty store if there is none."""
+        summaries = cls()
+        if cls.exists(directory):
+            with open(os.path.join(directory, SUMMARIES_FILE)) as f:
+                summaries.entries = json.load(f).get("entries", {})
+        return summaries
+
+    @classmethod
+    def exists(cls, directory: str) -> bool:
+        """Return True if directory holds saved summaries."""
+        return os.path.exists(os.path.join(directory, SUMMARIES_FILE))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or inspect precomputed chunk summaries.")
+    parser.add_argument("command", choices=["status", "build"])
+    parser.add_argument("--persist-dir", default="data/faiss_store")
+    parser.add_argument("--generator", choices=GENERATORS, default="groq")
+    parser.add_argument("--llm-model", default="llama-3.3-70b-versatile")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=None, help="summaries to generate in this run")
+    args = parser.parse_args()
+
+    from src.vectorstore import FaissVectorStore
+    store = FaissVectorStore(args.persist_dir)
+    store.load()
+    summaries = ProvisionSummaries.load(args.persist_dir)
+    if args.command == "status":
+        print(summaries.status(store.metadata))
+    else:
+        if args.generator == "groq":
+            name, summarize = groq_generator(args.llm_model)
+        else:
+            name, summarize = extractive_generator(store.model)
+            args.workers = 1  # one model, encoded in-process
+        print(summaries.build(store.metadata, name, summarize, persist_dir=args.persist_dir,
+                              workers=args.workers, limit=args.limit))
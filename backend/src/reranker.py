@@ -0,0 +1,119 @@
+"""Cross-Encoder Reranker Module for Nyaya-Flow Legal Aid Platform.
+
+This module adds an optional rerank stage between vector search and LLM
+summarization. A larger candidate pool from FAISS is scored against the query
+by a small local cross-encoder on CPU, and only the best few chunks go into
+the Groq prompt, which cuts prompt tokens at equal or better relevance.
+
+Scoring runs in batches under a millisecond budget. When the budget runs out
+before every candidate is scored, the stage falls back to the dense order so
+reranking never adds unbounded latency.
+
+Functionalities:
+    - Lazy loading of a sentence-transformers CrossEncoder
+    - Batched (query, chunk) scoring with a latency budget
+    - Dense-order fallback and rerank statistics
+
+Typical Usage:
+    from src.reranker import CrossEncoderReranker
+
+    reranker = CrossEncoderReranker(budget_ms=200)
+    candidates = store.query("Section 35 refund", top_k=20)
+    best = reranker.rerank("Section 35 refund", candidates, keep=3)
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+
+class CrossEncoderReranker:
+    """Reranks vector search results with a cross-encoder under a time budget.
+
+    Attributes:
+        model_name (str): Cross-encoder checkpoint.
+        batch_size (int): Candidate pairs scored per forward pass.
+        budget_ms (float): Scoring time allowed per call before falling back.
+    """
+
+    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2", batch_size: int = 16,
+                 budget_ms: float = 200.0, device: str = "cpu"):
+        """Initialize the reranker without loading the model.
+
+        Args:
+            model_name (str): Cross-encoder checkpoint. Defaults to "cross-encoder/ms-marco-MiniLM-L-6-v2".
+            batch_size (int): Pairs per forward pass. Defaults to 16.
+            budget_ms (float): Millisecond budget per rerank call. Defaults to 200.
+            device (str): Torch device. Defaults to "cpu".
+        """
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.budget_ms = budget_ms
+        self.device = device
+        self._model = None
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._fallbacks = 0
+        self._total_ms = 0.0
+
+    def _get_model(self):
+        """Load the cross-encoder on first use (not counted against the budget)."""
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import CrossEncoder
+                self._model = CrossEncoder(self.model_name, device=self.device)
+                print(f"[INFO] Loaded cross-encoder: {self.model_name}")
+            return self._model
+
+    def rerank(self, query: str, results: List[Dict[str, Any]], keep: int) -> List[Dict[str, Any]]:
+        """Return the best `keep` results for query.
+
+        Args:
+            query (str): Search query.
+            results (List[Dict[str, Any]]): Vector store results in dense order,
+                each with metadata["text"].
+            keep (int): Number of results to return.
+
+        Returns:
+            List[Dict[str, Any]]: Results sorted by cross-encoder score (with a
+            'rerank_score' key), or the first `keep` in dense order if the
+            budget was exceeded.
+        """
+        candidates = [r for r in results if r.get("metadata")]
+        if len(candidates) <= keep:
+            return candidates
+        model = self._get_model()
+
+        start = time.perf_counter()
+        scores = []
+        for offset in range(0, len(candidates), self.batch_size):
+            if (time.perf_counter() - start) * 1000 > self.budget_ms:
+                break
+            batch = candidates[offset:offset + self.batch_size]
+            scores.extend(model.predict([(query, r["metadata"].get("text", "")) for r in batch]))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._calls += 1
+            self._total_ms += elapsed_ms
+            if len(scores) < len(candidates):
+                self._fallbacks += 1
+        if len(scores) < len(candidates):
+            print(f"[WARN] Rerank exceeded {self.budget_ms} ms budget; using dense order")
+            return candidates[:keep]
+
+        ranked = sorted(zip(candidates, scores), key=lambda pair: float(pair[1]), reverse=True)
+        return [{**r, "rerank_score": float(score)} for r, score in ranked[:keep]]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return call, fallback and latency statistics.
+
+        Returns:
+            Dict[str, Any]: calls, fallbacks and avg_ms.
+        """
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "fallbacks": self._fallbacks,
+                "avg_ms": round(self._total_ms / self._calls, 2) if self._calls else 0.0,
+            }
@@ -1,36 +1,238 @@
 import os
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
 from src.vectorstore import FaissVectorStore
+from src.shards import ShardedVectorStore
+from src.executors import run_io
+from src.reranker import CrossEncoderReranker
+from src.statute_splitter import CENTRAL_JURISDICTION, STATUTE_MAX_CHARS, find_states
+from src.citation_index import parse_citations
+from src.extractive_summarizer import ExtractiveSummarizer
+from src.provision_summaries import ProvisionSummaries
 from langchain_groq import ChatGroq
 
 load_dotenv()
 
+SUMMARY_MODES = ("abstractive", "extractive", "precomputed")
+
 class RAGSearch:
-    def __init__(self, persist_dir: str = "data/faiss_store", embedding_model: str = "all-MiniLM-L6-v2", llm_model: str = "llama-3.3-70b-versatile"):
-        self.vectorstore = FaissVectorStore(persist_dir, embedding_model)
-        # Load or build vectorstore
-        faiss_path = os.path.join(persist_dir, "faiss.index")
-        meta_path = os.path.join(persist_dir, "metadata.pkl")
-        if not (os.path.exists(faiss_path) and os.path.exists(meta_path)):
-            from src.data_loader import load_all_documents
-            docs = load_all_documents("docustore/pdf")
-            self.vectorstore.build_from_documents(docs)
+    def __init__(self, persist_dir: str = "data/faiss_store", embedding_model: str = "all-MiniLM-L6-v2", llm_model: str = "llama-3.3-70b-versatile",
+                 shards: Optional[List[str]] = None):
+        # Index type only applies to new builds; a saved index keeps its own type.
+        # "hybrid" retrieval fuses BM25 with dense results, so fewer chunks reach the LLM.
+        # Optional PCA/prefix reduction is stored inside the index and applied to queries too.
+        index_params = {}
+        if os.getenv("FAISS_DIM_REDUCTION"):
+            index_params = {"reduce": os.getenv("FAISS_DIM_REDUCTION"), "reduced_dim": int(os.getenv("FAISS_REDUCED_DIM", "128"))}
+        # "statute" chunking stores whole sections (up to STATUTE_MAX_CHARS) with act/section metadata.
+        # It is opt-in: switching an existing index to it rebuilds the index on the next sync.
+        chunking = os.getenv("CHUNKING_STRATEGY", "recursive")
+        chunk_size = STATUTE_MAX_CHARS if chunking == "statute" else 1000
+        store_kwargs = dict(chunk_size=chunk_size, index_type=os.getenv("FAISS_INDEX_TYPE", "flat"), index_params=index_params,
+                            retrieval_mode=os.getenv("RAG_RETRIEVAL_MODE", "dense"), chunking=chunking)
+        # Stream documents straight into the index in bounded-memory batches
+        build_kwargs = dict(batch_size=int(os.getenv("INGEST_BATCH_SIZE", "256")),
+                            max_memory_mb=float(os.getenv("INGEST_MAX_MEMORY_MB", "256")),
+                            flush_every=int(os.getenv("INGEST_FLUSH_EVERY", "0")))
+        # A shard config splits the corpus into per-jurisdiction / document-class indexes;
+        # shards restricts routing to the domain's shards.
+        shards_config = os.getenv("RAG_SHARDS_CONFIG", "")
+        if shards_config and os.path.exists(shards_config):
+            self.vectorstore = ShardedVectorStore.from_config(shards_config, embedding_model, allowed=shards, **store_kwargs)
+            self.vectorstore.load_or_build(**build_kwargs)
+            summary_dirs = self.vectorstore.persist_dirs()
         else:
-            self.vectorstore.load()
-        groq_api_key = os.getenv("GROQ_API_KEY", "")
-        self.llm = ChatGroq(groq_api_key=groq_api_key, model_name=llm_model)
-        print(f"[INFO] Groq LLM initialized: {llm_model}")
-
-    def search_and_summarize(self, query: str, top_k: int = 5) -> str:
-        results = self.vectorstore.query(query, top_k=top_k)
-        texts = [r["metadata"].get("text", "") for r in results if r["metadata"]]
-        context = "\n\n".join(texts)
-        if not context:
+            if shards:
+                print(f"[WARN] No shard config at '{shards_config}'; searching the single store instead of {shards}")
+            self.vectorstore = FaissVectorStore(persist_dir, embedding_model, **store_kwargs)
+            # Load or build vectorstore
+            faiss_path = os.path.join(persist_dir, "faiss.index")
+            meta_paths = [os.path.join(persist_dir, name) for name in ("metadata.bin", "metadata.pkl")]
+            if not (os.path.exists(faiss_path) and any(os.path.exists(p) for p in meta_paths)):
+                from src.data_loader import iter_documents
+                self.vectorstore.build_from_documents(iter_documents("docustore/pdf"), **build_kwargs)
+            else:
+                self.vectorstore.load()
+            summary_dirs = [persist_dir]
+        # Queries naming a State search only that State's and central Acts
+        self.jurisdiction_filter = os.getenv("RAG_JURISDICTION_FILTER", "true").lower() == "true"
+        # Citation lookup needs section numbers, which only statute chunking stores
+        self.citation_lookup = self.vectorstore.provision_count() > 0
+        if not self.citation_lookup:
+            print("[WARN] The index has no section metadata, so citation lookup and provision texts are off; "
+                  "rebuild it with CHUNKING_STRATEGY=statute to enable them")
+        if self.jurisdiction_filter and CENTRAL_JURISDICTION.lower() not in self.vectorstore.filter_values("jurisdiction"):
+            print("[WARN] No chunk is tagged with the central jurisdiction, so jurisdiction filters are off; "
+                  "rebuild the index to enable them")
+        # Optional cross-encoder stage: rerank a larger candidate pool, keep top_k
+        self.reranker = None
+        self.rerank_candidates = int(os.getenv("RAG_RERANK_CANDIDATES", "20"))
+        if os.getenv("RAG_RERANK", "false").lower() == "true":
+            self.reranker = CrossEncoderReranker(
+                model_name=os.getenv("RAG_RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2"),
+                budget_ms=float(os.getenv("RAG_RERANK_BUDGET_MS", "200")),
+            )
+        # "extractive" picks query-relevant sentences locally (MMR over the loaded
+        # embedding model) instead of asking Groq for a summary: no network hop.
+        # "precomputed" serves summaries built offline by src.provision_summaries.
+        self.summary_mode = os.getenv("RAG_SUMMARY_MODE", "abstractive").lower()
+        if self.summary_mode not in SUMMARY_MODES:
+            raise ValueError(f"Unknown RAG_SUMMARY_MODE '{self.summary_mode}'. Choose from {SUMMARY_MODES}")
+        self.llm = None
+        self.summarizer = None
+        self.summaries = None
+        if self.summary_mode == "precomputed":
+            self.summaries = ProvisionSummaries()
+            for directory in summary_dirs:
+                self.summaries.entries.update(ProvisionSummaries.load(directory).entries)
+            if not len(self.summaries):
+                print("[WARN] No precomputed summaries found; run python -m src.provision_summaries build")
+            print(f"[INFO] Serving {len(self.summaries)} precomputed summaries; Groq is not used for RAG")
+        elif self.summary_mode == "extractive":
+            self.summarizer = ExtractiveSummarizer(
+                self.vectorstore.model,
+                max_sentences=int(os.getenv("RAG_EXTRACTIVE_SENTENCES", "8")),
+                max_chars=int(os.getenv("RAG_EXTRACTIVE_MAX_CHARS", "1500")),
+                diversity=float(os.getenv("RAG_EXTRACTIVE_DIVERSITY", "0.3")),
+            )
+            print("[INFO] Extractive summarization enabled; Groq is not used for RAG")
+        else:
+            groq_api_key = os.getenv("GROQ_API_KEY", "")
+            self.llm = ChatGroq(groq_api_key=groq_api_key, model_name=llm_model)
+            print(f"[INFO] Groq LLM initialized: {llm_model}")
+
+    def jurisdiction_filters(self, text: str) -> Optional[Dict[str, Any]]:
+        """Metadata filters for the States named in text.
+
+        A grievance naming Kerala searches Kerala Acts and central Acts only;
+        text naming no State (or RAG_JURISDICTION_FILTER=false, or a store
+        whose central Acts carry no jurisdiction yet) searches everything.
+
+        Args:
+            text (str): Query or grievance text.
+
+        Returns:
+            Optional[Dict[str, Any]]: {"jurisdiction": [...states, "India"]}, or None.
+        """
+        states = find_states(text) if self.jurisdiction_filter else []
+        # Stores built before every file was tagged have untagged central Acts; filtering would drop them
+        if not states or CENTRAL_JURISDICTION.lower() not in self.vectorstore.filter_values("jurisdiction"):
+            return None
+        return {"jurisdiction": states + [CENTRAL_JURISDICTION]}
+
+    def search_and_summarize(self, query: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None) -> str:
+        filters = filters or self.jurisdiction_filters(query)
+        # Explicitly cited provisions resolve through the citation index; no embedding or vector search
+        results = self.vectorstore.lookup_citations(query, limit=top_k) if self.citation_lookup else []
+        if results:
+            print(f"[INFO] Resolved {len(results)} cited chunks without vector search")
+        elif self.reranker:
+            candidates = self.vectorstore.query(query, top_k=max(top_k, self.rerank_candidates), filters=filters)
+            results = self.reranker.rerank(query, candidates, keep=top_k)
+        else:
+            results = self.vectorstore.query(query, top_k=top_k, filters=filters)
+        if self.summaries is not None:
+            return self._precomputed_summary(results)
+        if self.summarizer:
+            return self._extractive_summary(query, results)
+        prompt = self._build_prompt(query, results)
+        if prompt is None:
             return "No relevant documents found."
-        prompt = f"""Summarize the following context for the query: '{query}'\n\nContext:\n{context}\n\nSummary:"""
         response = self.llm.invoke([prompt])
         return response.content
 
+    async def asearch_and_summarize(self, query: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None) -> str:
+        """Async variant of search_and_summarize that keeps the event loop free.
+
+        The vector search, optional rerank and the synchronous Groq call (or
+        the local extractive summary) each run on the shared I/O thread pool.
+        Citation lookups and precomputed summaries are dictionary reads and
+        run inline.
+        """
+        filters = filters or self.jurisdiction_filters(query)
+        results = self.vectorstore.lookup_citations(query, limit=top_k) if self.citation_lookup else []
+        if results:
+            print(f"[INFO] Resolved {len(results)} cited chunks without vector search")
+        elif self.reranker:
+            candidates = await self.vectorstore.aquery(query, top_k=max(top_k, self.rerank_candidates), filters=filters)
+            results = await run_io(self.reranker.rerank, query, candidates, top_k)
+        else:
+            results = await self.vectorstore.aquery(query, top_k=top_k, filters=filters)
+        if self.summaries is not None:
+            return self._precomputed_summary(results)
+        if self.summarizer:
+            return await run_io(self._extractive_summary, query, results)
+        prompt = self._build_prompt(query, results)
+        if prompt is None:
+            return "No relevant documents found."
+        response = await run_io(self.llm.invoke, [prompt])
+        return response.content
+
+    def provision_texts(self, text: str) -> Dict[str, str]:
+        """Fetch the statute text of every indexed provision cited in text.
+
+        Used to give the drafter and reviewer the exact wording of the
+        provisions named in research findings.
+
+        Args:
+            text (str): Text containing citations, e.g. joined legal_provisions.
+
+        Returns:
+            Dict[str, str]: "Section N, <act>" -> provision text, for cited
+            provisions found in the index (none when it has no section metadata).
+        """
+        texts = {}
+        if not self.citation_lookup:
+            return texts
+        for act, section in parse_citations(text):
+            provision = self.vectorstore.get_provision(act, section)
+            if provision:
+                texts[f"Section {section}, {act.title()}"] = provision
+        return texts
+
+    def close(self):
+        """Release the vector store's background resources (shard search threads)."""
+        self.vectorstore.close()
+
+    def _extractive_summary(self, query: str, results: list) -> str:
+        """Summarize results locally with MMR sentence selection (no LLM call)."""
+        # The query was just embedded for the search, so this is a cache hit
+        query_embedding = self.vectorstore.embed_query(query)
+        summary = self.summarizer.summarize(query, [r for r in results if r["metadata"]], query_embedding)
+        return summary or "No relevant documents found."
+
+    def _precomputed_summary(self, results: list) -> str:
+        """Assemble context from stored chunk summaries (chunk text where none is stored yet)."""
+        parts, missing = [], 0
+        for r in results:
+            metadata = r["metadata"]
+            if not metadata:
+                continue
+            summary = self.summaries.get(metadata.get("text", ""))
+            if summary is None:
+                missing += 1
+                parts.append(self._format_chunk(metadata))
+            else:
+                parts.append(self._format_chunk({**metadata, "text": summary}))
+        if missing:
+            print(f"[WARN] {missing} retrieved chunks have no precomputed summary; using their text")
+        return "\n\n".join(parts) or "No relevant documents found."
+
+    @staticmethod
+    def _format_chunk(metadata: dict) -> str:
+        """Chunk text, headed by its citation when the chunk is a statute section."""
+        text = metadata.get("text", "")
+        if metadata.get("act") and metadata.get("section"):
+            return f"[{metadata['act']}, Section {metadata['section']}]\n{text}"
+        return text
+
+    def _build_prompt(self, query: str, results: list):
+        texts = [self._format_chunk(r["metadata"]) for r in results if r["metadata"]]
+        context = "\n\n".join(texts)
+        if not context:
+            return None
+        return f"""Summarize the following context for the query: '{query}'\n\nContext:\n{context}\n\nSummary:"""
+
 # Example usage
 if __name__ == "__main__":
     rag_search = RAGSearch()
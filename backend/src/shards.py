@@ -0,0 +1,377 @@
+"""Sharded Vector Store Module for Nyaya-Flow Legal Aid Platform.
+
+This module splits the corpus into named shards (by jurisdiction or
+document class, e.g. "kerala", "central", "case_law"), each a
+FaissVectorStore with its own persisted index directory and source
+documents. Shards build, sync and load independently, so adding a State's
+Acts or a case-law collection rebuilds one small index rather than the whole
+store, and a query only searches the shards that can answer it.
+
+A query is routed by the domain's allowed shards and a cheap classifier:
+shards whose jurisdictions match a State named in the query, or whose
+keywords appear in it, are selected together with the "always" shards
+(central Acts); a query matching none searches every allowed shard. Selected
+shards are searched in parallel on a thread pool (FAISS releases the GIL)
+with one shared embedding model and query embedding cache, and the results
+are merged by distance (or fused score in hybrid mode).
+
+Merging by distance only works while every shard measures distance on the
+same scale. Shards may override the index type among the exact-distance
+types (flat, hnsw, ivf); lossy storage (fp16, int8, ivfpq) and prefix
+dimension reduction must then be the same for every shard, and PCA
+reduction is rejected because each shard would learn its own projection.
+The check runs on the configuration and again on the indexes actually
+loaded, since a saved index keeps the type it was built with.
+
+Shards outside the domain's allowed list are never searched, and they are
+not consulted for citation, provision or filter lookups either.
+
+Shard configuration (JSON, path in RAG_SHARDS_CONFIG):
+    {
+      "root": "data/shards",
+      "shards": {
+        "kerala":   {"data_dir": "docustore/pdf/kerala", "jurisdictions": ["Kerala"]},
+        "central":  {"data_dir": "docustore/pdf/central", "jurisdictions": ["India"], "always": true},
+        "case_law": {"data_dir": "docustore/case_law", "keywords": ["judgment", "precedent"],
+                     "index_type": "hnsw"}
+      }
+    }
+
+Functionalities:
+    - Shard configuration with per-shard data directory and index settings
+    - Query routing by allowed shards, named States and keywords
+    - Parallel per-shard search with score-ordered merging
+    - Check that shard distances are comparable before merging them
+    - FaissVectorStore-compatible query, citation and provision lookups
+
+Typical Usage:
+    from src.shards import ShardedVectorStore
+
+    store = ShardedVectorStore.from_config("config/rag_shards.json")
+    store.load_or_build()
+    results = store.query("Panchayat in Kerala delayed my certificate", top_k=5)
+    print(results[0]["shard"], results[0]["metadata"]["act"])
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from src.embedding import EMBEDDING_BACKEND, backend_kwargs
+from src.executors import run_io
+from src.statute_splitter import find_states
+from src.vectorstore import FaissVectorStore
+
+# Index types whose search distances are exact float32 L2
+EXACT_INDEX_TYPES = ("flat", "hnsw", "ivf")
+
+
+class ShardSpec:
+    """Configuration of one shard.
+
+    Attributes:
+        name (str): Shard name, also its directory under the shards root.
+        persist_dir (str): Index directory.
+        data_dir (str): Source documents for builds, if any.
+        jurisdictions (List[str]): States (or "India") the shard answers for.
+        keywords (List[str]): Words that route a query to the shard.
+        always (bool): Search the shard whenever routing selects any shard.
+        index_type (str, optional): Index type override for this shard.
+        index_params (dict, optional): Index parameter overrides for this shard.
+    """
+
+    def __init__(self, name: str, persist_dir: str, data_dir: Optional[str] = None,
+                 jurisdictions: Sequence[str] = (), keywords: Sequence[str] = (), always: bool = False,
+                 index_type: Optional[str] = None, index_params: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.persist_dir = persist_dir
+        self.data_dir = data_dir
+        self.jurisdictions = list(jurisdictions)
+        self.keywords = [k.lower() for k in keywords]
+        self.always = always
+        self.index_type = index_type
+        self.index_params = index_params
+
+
+def route(query: str, specs: Sequence[ShardSpec], allowed: Optional[Sequence[str]] = None) -> List[str]:
+    """Pick the shards to search for a query.
+
+    Args:
+        query (str): Query or grievance text.
+        specs (Sequence[ShardSpec]): Configured shards.
+        allowed (Sequence[str], optional): Shards the caller's domain may use; all by default.
+
+    Returns:
+        List[str]: Shard names in configuration order. Shards matching a named
+        State or a keyword plus the "always" shards, or every allowed shard if
+        nothing matched.
+    """
+    candidates = [spec for spec in specs if allowed is None or spec.name in allowed]
+    states = set(find_states(query))
+    words = set(re.findall(r"[a-z0-9]+", query.lower()))
+    matched = {spec.name for spec in candidates
+               if states & set(spec.jurisdictions) or any(k in words for k in spec.keywords)}
+    if not matched:
+        return [spec.name for spec in candidates]
+    return [spec.name for spec in candidates if spec.name in matched or spec.always]
+
+
+def distance_scale(index_type: str, index_params: Optional[Dict[str, Any]] = None) -> tuple:
+    """Return what determines the scale of a shard's search distances.
+
+    Shards can be merged by distance only when this is equal for all of them.
+
+    Args:
+        index_type (str): FaissVectorStore index type.
+        index_params (dict, optional): FaissVectorStore index parameters.
+
+    Returns:
+        tuple: ("exact" or the lossy index type, prefix reduction or None).
+
+    Raises:
+        ValueError: If the index uses PCA reduction, whose projection is learned per shard.
+    """
+    params = index_params or {}
+    reduce = params.get("reduce")
+    if reduce == "pca":
+        raise ValueError("PCA dimension reduction is learned per shard, so sharded distances "
+                         "would not be comparable; use 'prefix' or no reduction")
+    storage = "exact" if index_type in EXACT_INDEX_TYPES else index_type
+    return storage, (reduce, params.get("reduced_dim")) if reduce else None
+
+
+def _check_comparable(scales: Dict[str, tuple]):
+    """Raise ValueError unless every shard's distance_scale() is the same."""
+    if len(set(scales.values())) > 1:
+        detail = ", ".join(f"{name}: {scale}" for name, scale in scales.items())
+        raise ValueError(f"Shard distances are not comparable ({detail}). Lossy index types and "
+                         f"dimension reduction must be the same for every shard")
+
+
+def merge_results(result_lists: Sequence[List[dict]], top_k: int) -> List[dict]:
+    """Merge per-shard result lists into one ranking.
+
+    Args:
+        result_lists (Sequence[List[dict]]): Results from each shard.
+        top_k (int): Results to keep.
+
+    Returns:
+        List[dict]: Highest fused 'score' first when results carry one (hybrid),
+        otherwise smallest 'distance' first.
+    """
+    merged = [r for results in result_lists for r in results]
+    if any("score" in r for r in merged):
+        merged.sort(key=lambda r: -r.get("score", 0.0))
+    else:
+        merged.sort(key=lambda r: float("inf") if r.get("distance") is None else float(r["distance"]))
+    return merged[:top_k]
+
+
+class ShardedVectorStore:
+    """Named FaissVectorStore shards searched in parallel behind one interface.
+
+    Attributes:
+        specs (Dict[str, ShardSpec]): Shard configuration by name.
+        shards (Dict[str, FaissVectorStore]): Loaded shards by name.
+        allowed (List[str], optional): Shards queries may be routed to (domain config).
+        model (SentenceTransformer): Embedding model shared by every shard.
+    """
+
+    def __init__(self, specs: Sequence[ShardSpec], embedding_model: str = "all-MiniLM-L6-v2",
+                 allowed: Optional[Sequence[str]] = None, embedding_backend: Optional[str] = None,
+                 **store_kwargs):
+        """Create the shard stores (without loading or building them).
+
+        Args:
+            specs (Sequence[ShardSpec]): Shard configuration.
+            embedding_model (str): Sentence-transformer model name (the same for
+                every shard, so distances are comparable when merging).
+            allowed (Sequence[str], optional): Restrict routing to these shards.
+            embedding_backend (str, optional): Inference backend (see EmbeddingPipeline).
+            **store_kwargs: FaissVectorStore arguments shared by the shards
+                (chunk_size, index_type, index_params, retrieval_mode, chunking).
+
+        Raises:
+            ValueError: If no shards are configured, allowed names an unknown
+                shard, or the shards' index settings give incomparable distances.
+        """
+        if not specs:
+            raise ValueError("No shards configured")
+        self.specs = {spec.name: spec for spec in specs}
+        unknown = set(allowed or ()) - set(self.specs)
+        if unknown:
+            raise ValueError(f"Unknown shards {sorted(unknown)}. Configured: {', '.join(self.specs)}")
+        self.allowed = list(allowed) if allowed else None
+        backend = embedding_backend or EMBEDDING_BACKEND
+        self.model = SentenceTransformer(embedding_model, **backend_kwargs(backend))
+        self.shards: Dict[str, FaissVectorStore] = {}
+        shard_kwargs = {}
+        for spec in specs:
+            kwargs = dict(store_kwargs)
+            if spec.index_type:
+                kwargs["index_type"] = spec.index_type
+                kwargs["index_params"] = spec.index_params or {}
+            shard_kwargs[spec.name] = kwargs
+        _check_comparable({name: distance_scale(kwargs.get("index_type", "flat"), kwargs.get("index_params"))
+                           for name, kwargs in shard_kwargs.items()})
+        for spec in specs:
+            kwargs = shard_kwargs[spec.name]
+            self.shards[spec.name] = FaissVectorStore(spec.persist_dir, embedding_model, embedding_backend=backend,
+                                                      model=self.model, **kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=len(self.shards), thread_name_prefix="shard-search")
+        self._searchable: List[str] = []
+
+    @classmethod
+    def from_config(cls, path: str, embedding_model: str = "all-MiniLM-L6-v2",
+                    allowed: Optional[Sequence[str]] = None, **store_kwargs) -> "ShardedVectorStore":
+        """Create a sharded store from a JSON shard configuration.
+
+        Args:
+            path (str): Configuration file (see the module docstring).
+            embedding_model (str): Sentence-transformer model name.
+            allowed (Sequence[str], optional): Restrict routing to these shards.
+            **store_kwargs: Shared FaissVectorStore arguments.
+
+        Returns:
+            ShardedVectorStore: Store with unloaded shards.
+        """
+        with open(path) as f:
+            config = json.load(f)
+        root = config.get("root", "data/shards")
+        specs = [ShardSpec(name, entry.get("persist_dir", os.path.join(root, name)), entry.get("data_dir"),
+                           entry.get("jurisdictions", ()), entry.get("keywords", ()), entry.get("always", False),
+                           entry.get("index_type"), entry.get("index_params"))
+                 for name, entry in config["shards"].items()]
+        return cls(specs, embedding_model, allowed=allowed, **store_kwargs)
+
+    def persist_dirs(self) -> List[str]:
+        """Return the index directory of every shard."""
+        return [spec.persist_dir for spec in self.specs.values()]
+
+    def load_or_build(self, **build_kwargs):
+        """Load each saved shard, and build the missing ones from their data_dir.
+
+        Shards with neither a saved index nor source documents are skipped
+        (and never routed to) until they are built.
+
+        Args:
+            **build_kwargs: FaissVectorStore.build_from_documents arguments
+                (batch_size, max_memory_mb, flush_every).
+
+        Raises:
+            ValueError: If the loaded indexes give incomparable distances.
+        """
+        from src.data_loader import iter_documents
+        self._searchable = []
+        for name, store in self.shards.items():
+            spec = self.specs[name]
+            if os.path.exists(os.path.join(spec.persist_dir, "faiss.index")):
+                store.load()
+            elif spec.data_dir and os.path.isdir(spec.data_dir):
+                print(f"[INFO] Building shard '{name}' from {spec.data_dir}")
+                store.build_from_documents(iter_documents(spec.data_dir), **build_kwargs)
+            else:
+                print(f"[WARN] Shard '{name}' has no saved index or documents; skipping it")
+                continue
+            self._searchable.append(name)
+        _check_comparable({name: distance_scale(self.shards[name].index_type, self.shards[name].index_params)
+                           for name in self._searchable})
+
+    def _usable(self) -> List[str]:
+        """Return the searchable shards the domain is allowed to use."""
+        return [name for name in self._searchable if self.allowed is None or name in self.allowed]
+
+    def route(self, query: str) -> List[str]:
+        """Return the searchable shards a query is routed to (see route())."""
+        specs = [self.specs[name] for name in self.shards if name in self._searchable]
+        return route(query, specs, self.allowed)
+
+    def embed_query(self, query_text: str) -> np.ndarray:
+        """Embed a query once for all shards (they share the model and cache)."""
+        return next(iter(self.shards.values())).embed_query(query_text)
+
+    def query(self, query_text: str, top_k: int = 5, mode: Optional[str] = None,
+              filters: Optional[Dict[str, Any]] = None, shards: Optional[Sequence[str]] = None) -> List[dict]:
+        """Search the routed shards in parallel and merge their results.
+
+        The query is embedded once; each shard's own query() then hits the
+        shared query embedding cache.
+
+        Args:
+            query_text (str): Natural language query.
+            top_k (int): Results to return after merging. Defaults to 5.
+            mode (str, optional): "dense" or "hybrid" (see FaissVectorStore.query()).
+            filters (dict, optional): Metadata filters applied within each shard.
+            shards (Sequence[str], optional): Search these shards instead of routing.
+
+        Returns:
+            List[dict]: Merged results, each with a 'shard' key naming its shard.
+
+        Raises:
+            ValueError: If shards names a shard that is unknown or not allowed.
+        """
+        if shards:
+            forbidden = [name for name in shards
+                         if name not in self.shards or (self.allowed is not None and name not in self.allowed)]
+            if forbidden:
+                raise ValueError(f"Shards {forbidden} are unknown or not allowed. Allowed: "
+                                 f"{', '.join(self.allowed or self.specs)}")
+        names = list(shards) if shards else self.route(query_text)
+        if not names:
+            return []
+        print(f"[INFO] Routing query to shards: {', '.join(names)}")
+        self.embed_query(query_text)
+
+        def search(name: str) -> List[dict]:
+            return [{**r, "shard": name} for r in self.shards[name].query(query_text, top_k, mode, filters)]
+
+        return merge_results(list(self._pool.map(search, names)), top_k)
+
+    async def aquery(self, query_text: str, top_k: int = 5, mode: Optional[str] = None,
+                     filters: Optional[Dict[str, Any]] = None) -> List[dict]:
+        """Async variant of query() running on the shared I/O thread pool."""
+        return await run_io(self.query, query_text, top_k, mode, filters)
+
+    def lookup_citations(self, text: str, limit: Optional[int] = None) -> List[dict]:
+        """Resolve explicit citations in every usable shard (dictionary lookups only).
+
+        Args:
+            text (str): Query, grievance or research text.
+            limit (int, optional): Most chunks to return.
+
+        Returns:
+            List[dict]: Cited chunks with a 'shard' key, in shard order.
+        """
+        results = []
+        for name in self._usable():
+            results.extend({**r, "shard": name} for r in self.shards[name].lookup_citations(text))
+        return results[:limit]
+
+    def get_provision(self, act: str, section: str) -> Optional[str]:
+        """Return the text of one provision from the first shard that indexes it."""
+        for name in self._usable():
+            provision = self.shards[name].get_provision(act, section)
+            if provision:
+                return provision
+        return None
+
+    def provision_count(self) -> int:
+        """Return the number of indexed (act, section) provisions over usable shards."""
+        return sum(self.shards[name].provision_count() for name in self._usable())
+
+    def filter_values(self, field: str) -> Dict[str, int]:
+        """Return indexed filter values and chunk counts summed over usable shards."""
+        counts: Dict[str, int] = {}
+        for name in self._usable():
+            for value, count in self.shards[name].filter_values(field).items():
+                counts[value] = counts.get(value, 0) + count
+        return counts
+
+    def close(self):
+        """Stop the shard search threads."""
+        self._pool.shutdown(wait=False)
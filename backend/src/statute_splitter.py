@@ -0,0 +1,338 @@
+"""Statute-Aware Splitter Module for Nyaya-Flow Legal Aid Platform.
+
+This module splits Acts into one chunk per section instead of fixed-size
+character windows. Indian statutes number their provisions as "N. Heading.—"
+at the start of a line and group them under "CHAPTER ..." headings, so a
+section is the natural retrieval unit: a chunk that holds a whole provision
+can be cited and quoted on its own, and no prompt has to carry the tail of
+one section and the head of the next.
+
+Each chunk carries the Act title, jurisdiction (the State named in the
+title, or "India" for central Acts), chapter, section number and heading,
+source file and starting page. Sections longer than max_chars are split
+further, and every continuation repeats the section heading so its
+embedding keeps the context. Files without section headings (plain notes,
+CSV rows) fall back to recursive character splitting.
+
+The Act title and jurisdiction are resolved once per source file by
+annotate_files(), whatever the chunking strategy, so recursive chunks of a
+central Act are still tagged "India" and survive jurisdiction filters.
+
+Functionalities:
+    - Act title detection from PDF metadata, the first page or the file name
+    - Chapter and "Section N." heading detection across page boundaries
+    - One chunk per provision, with heading-prefixed continuations for long ones
+    - Jurisdiction detection from the Act title or file name
+    - Per-file act / jurisdiction annotation for any chunking strategy
+    - act / jurisdiction / chapter / section / section_title / source / page chunk metadata
+
+Typical Usage:
+    from src.statute_splitter import StatuteSplitter
+
+    splitter = StatuteSplitter(max_chars=2000)
+    chunks = splitter.split_documents(load_document("docustore/pdf/TheKeralaPublicHealthAct2023.pdf"))
+    print(chunks[5].metadata["act"], chunks[5].metadata["section"])
+"""
+
+import bisect
+import re
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+STATUTE_MAX_CHARS = 2000
+
+# "3. Appointment of Survey Officers.-(1) ..." / "2. Definitions.—" at the start of a
+# line; long headings wrap onto the next lines before the dash
+_SECTION_PATTERN = re.compile(r"^[ \t]*(\d{1,3}[A-Z]{0,2})\.[ \t]+([A-Z][^—–]{0,300}?)(?:\.\s*[—–-]|\s*[—–])", re.MULTILINE)
+_MAX_HEADING_LINES = 3
+# "CHAPTER II." followed by the chapter title on the next line
+_CHAPTER_PATTERN = re.compile(r"^[ \t]*CHAPTER[ \t]+([IVXLC]+|\d+)\.?[ \t]*\n[ \t]*([^\n]*)", re.MULTILINE)
+_ACT_PATTERN = re.compile(r"\b(The [A-Z][A-Za-z ,'()&-]{3,120}? Act,? \d{4})")
+
+# States and Union Territories that enact their own laws; other Acts are central ("India")
+STATE_JURISDICTIONS = (
+    "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh", "Delhi", "Goa", "Gujarat",
+    "Haryana", "Himachal Pradesh", "Jammu and Kashmir", "Jharkhand", "Karnataka", "Kerala", "Madhya Pradesh",
+    "Maharashtra", "Manipur", "Meghalaya", "Mizoram", "Nagaland", "Odisha", "Puducherry", "Punjab",
+    "Rajasthan", "Sikkim", "Tamil Nadu", "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal",
+)
+CENTRAL_JURISDICTION = "India"
+_STATE_PATTERN = re.compile(
+    r"(?<![a-z])(" + "|".join(name.replace(" ", r"[\s_-]*") for name in STATE_JURISDICTIONS) + r")(?![a-z])",
+    re.IGNORECASE,
+)
+
+
+def normalize_act(title: str) -> str:
+    """Tidy an Act title into "The ... Act, YYYY" form.
+
+    Args:
+        title (str): Raw title, e.g. "THE KERALA SURVEY AND BOUNDARIES ACT, 1961    [1]".
+
+    Returns:
+        str: Title with footnote markers and extra whitespace removed.
+    """
+    title = re.sub(r"\[\d+\]", "", title)
+    title = " ".join(title.split()).strip(" .,")
+    if title.isupper():
+        title = title.title()
+    return re.sub(r"\s*Act,?\s*(\d{4})$", r" Act, \1", title)
+
+
+def detect_act(pages: List[Any]) -> str:
+    """Find the Act title for a file's pages.
+
+    Uses the PDF title when it names an Act, then the first "The ... Act, YYYY"
+    on the first page, then the file name.
+
+    Args:
+        pages (List[Any]): LangChain Documents of one file, in page order.
+
+    Returns:
+        str: Act title.
+    """
+    metadata = pages[0].metadata if pages else {}
+    title = str(metadata.get("title") or "")
+    if re.search(r"\bact\b", title, re.IGNORECASE):
+        return normalize_act(title)
+    match = _ACT_PATTERN.search(pages[0].page_content) if pages else None
+    if match:
+        return normalize_act(match.group(1))
+    stem = Path(str(metadata.get("source", "document"))).stem
+    return normalize_act(re.sub(r"(?<=[a-z])(?=[A-Z0-9])|[_-]+", " ", stem))
+
+
+def find_states(text: str) -> List[str]:
+    """Return the States named in text, in order of first mention.
+
+    Args:
+        text (str): Act title, file name or free text ("TheKeralaPublicHealthAct" names Kerala).
+
+    Returns:
+        List[str]: Canonical State names without duplicates.
+    """
+    states = []
+    for match in _STATE_PATTERN.finditer(re.sub(r"(?<=[a-z])(?=[A-Z])", " ", text)):
+        found = re.sub(r"[\s_-]+", "", match.group(1)).lower()
+        state = next(name for name in STATE_JURISDICTIONS if name.replace(" ", "").lower() == found)
+        if state not in states:
+            states.append(state)
+    return states
+
+
+def detect_state(text: str) -> Optional[str]:
+    """Return the first State named in text, or None."""
+    states = find_states(text)
+    return states[0] if states else None
+
+
+def detect_jurisdiction(act: Optional[str], source: Optional[str] = None) -> Optional[str]:
+    """Return the jurisdiction of a chunk from its Act title or source file.
+
+    Args:
+        act (str, optional): Act title, if the chunk came from a statute.
+        source (str, optional): Source file path.
+
+    Returns:
+        Optional[str]: The State named in the title or file name, "India" for
+        an Act naming no State, or None for non-statute text naming none.
+    """
+    state = detect_state(act or "") or detect_state(Path(str(source or "")).stem)
+    if state:
+        return state
+    return CENTRAL_JURISDICTION if act else None
+
+
+def file_metadata(pages: List[Any]) -> Dict[str, str]:
+    """Return the act and jurisdiction shared by every chunk of one source file.
+
+    Args:
+        pages (List[Any]): LangChain Documents of one file, in page order.
+
+    Returns:
+        Dict[str, str]: "act" when the detected title names an Act, and
+        "jurisdiction" (the State named in the title or file name, else
+        "India" for an Act). Keys without a value are left out.
+    """
+    if not pages:
+        return {}
+    act = detect_act(pages)
+    if not re.search(r"\bact\b", act, re.IGNORECASE):
+        act = None
+    jurisdiction = detect_jurisdiction(act, pages[0].metadata.get("source"))
+    return {key: value for key, value in (("act", act), ("jurisdiction", jurisdiction)) if value}
+
+
+def annotate_files(documents: List[Any]) -> List[Document]:
+    """Add each source file's act and jurisdiction to the metadata of its pages.
+
+    Pages of the same source must be consecutive. Metadata the pages already
+    carry is kept.
+
+    Args:
+        documents (List[Any]): LangChain Documents (one per PDF page).
+
+    Returns:
+        List[Document]: Copies of the pages with act / jurisdiction metadata.
+    """
+    annotated = []
+    for _, group in groupby(documents, key=lambda doc: doc.metadata.get("source")):
+        pages = list(group)
+        shared = file_metadata(pages)
+        annotated.extend(Document(page_content=page.page_content, metadata={**shared, **page.metadata})
+                         for page in pages)
+    return annotated
+
+
+def _section_key(label: str) -> Tuple[int, str]:
+    """Sort key for a section label ("3A" -> (3, "A"))."""
+    number = re.match(r"\d+", label).group()
+    return int(number), label[len(number):]
+
+
+class StatuteSplitter:
+    """Splits statute documents on section headings.
+
+    Attributes:
+        max_chars (int): Longest chunk before a section is split further.
+        overlap (int): Overlap between continuation chunks of a long section.
+    """
+
+    def __init__(self, max_chars: int = STATUTE_MAX_CHARS, overlap: int = 200):
+        """Initialize the splitter.
+
+        Args:
+            max_chars (int): Longest chunk before a section is split further. Defaults to 2000.
+            overlap (int): Overlap between continuation chunks. Defaults to 200.
+        """
+        self.max_chars = max_chars
+        self.overlap = overlap
+        self._fallback = RecursiveCharacterTextSplitter(
+            chunk_size=max_chars,
+            chunk_overlap=overlap,
+            length_function=len,
+            separators=["\n\n", "\n", " ", ""]
+        )
+
+    def split_documents(self, documents: List[Any]) -> List[Document]:
+        """Split documents into section chunks, one source file at a time.
+
+        Pages of the same source must be consecutive (as load_document and
+        iter_documents produce them) so sections spanning pages stay whole.
+
+        Args:
+            documents (List[Any]): LangChain Documents (one per PDF page).
+
+        Returns:
+            List[Document]: Chunks with act, jurisdiction, chapter, section,
+            section_title, source and page metadata.
+        """
+        chunks = []
+        for _, pages in groupby(documents, key=lambda doc: doc.metadata.get("source")):
+            chunks.extend(self._split_file(list(pages)))
+        return chunks
+
+    def _split_file(self, pages: List[Any]) -> List[Document]:
+        """Split the pages of one file."""
+        text, page_starts = self._join_pages(pages)
+        headings = self._find_sections(text)
+        if not headings:
+            return self._fallback.split_documents(pages)
+
+        act = detect_act(pages)
+        source = pages[0].metadata.get("source")
+        jurisdiction = detect_jurisdiction(act, source)
+        chapters = [(m.start(), f"Chapter {m.group(1)}: {m.group(2).strip()}".rstrip(": "))
+                    for m in _CHAPTER_PATTERN.finditer(text)]
+        chapter_starts = [start for start, _ in chapters]
+
+        def page_at(offset: int) -> Any:
+            return pages[bisect.bisect_right(page_starts, offset) - 1].metadata.get("page")
+
+        def chapter_at(offset: int) -> Optional[str]:
+            i = bisect.bisect_right(chapter_starts, offset) - 1
+            return chapters[i][1] if i >= 0 else None
+
+        # Preamble (title, disclaimer, long title) before the first section
+        spans: List[Tuple[int, int, Optional[Tuple[str, str]]]] = [(0, headings[0][0], None)]
+        for i, (start, label, heading) in enumerate(headings):
+            end = headings[i + 1][0] if i + 1 < len(headings) else len(text)
+            spans.append((start, end, (label, heading)))
+
+        chunks = []
+        for start, end, section in spans:
+            body = text[start:end]
+            # A chapter heading right before the next section belongs to that section
+            next_chapter = next((c for c in chapter_starts if start < c < end), None)
+            if next_chapter is not None and section is not None:
+                body = text[start:next_chapter]
+            body = body.strip()
+            if not body:
+                continue
+            metadata = {
+                "act": act,
+                "jurisdiction": jurisdiction,
+                "chapter": chapter_at(start),
+                "section": section[0] if section else None,
+                "section_title": section[1] if section else None,
+                "source": source,
+                "page": page_at(start),
+            }
+            chunks.extend(self._section_chunks(body, metadata))
+        return chunks
+
+    def _section_chunks(self, body: str, metadata: Dict[str, Any]) -> List[Document]:
+        """Return one chunk for a provision, or heading-prefixed parts if it is too long."""
+        if len(body) <= self.max_chars:
+            return [Document(page_content=body, metadata=metadata)]
+        parts = self._fallback.split_text(body)
+        prefix = f"Section {metadata['section']}. {metadata['section_title']} (continued)\n" if metadata["section"] else ""
+        return [Document(page_content=part if i == 0 else prefix + part, metadata={**metadata, "part": i + 1})
+                for i, part in enumerate(parts)]
+
+    @staticmethod
+    def _join_pages(pages: List[Any]) -> Tuple[str, List[int]]:
+        """Concatenate page texts, returning the text and each page's start offset."""
+        starts, texts, offset = [], [], 0
+        for page in pages:
+            starts.append(offset)
+            texts.append(page.page_content)
+            offset += len(page.page_content) + 1
+        return "\n".join(texts), starts
+
+    @staticmethod
+    def _find_sections(text: str) -> List[Tuple[int, str, str]]:
+        """Locate section headings as (offset, number, heading).
+
+        Candidates that start a line are kept only if they form the longest
+        run of increasing section numbers, which drops numbered lists,
+        amendment notes and cross-references that look like headings.
+        """
+        candidates = []
+        for match in _SECTION_PATTERN.finditer(text):
+            heading = match.group(2)
+            if heading.count("\n") >= _MAX_HEADING_LINES:
+                continue
+            candidates.append((match.start(), match.group(1), " ".join(heading.split()).rstrip(".")))
+        if not candidates:
+            return []
+
+        # Longest increasing subsequence of section keys, preferring small gaps
+        keys = [_section_key(label) for _, label, _ in candidates]
+        best = [(1, -keys[i][0], -1) for i in range(len(candidates))]
+        for i in range(len(candidates)):
+            for j in range(i):
+                if keys[j] < keys[i]:
+                    score = (best[j][0] + 1, best[j][1] - (keys[i][0] - keys[j][0]), j)
+                    if score[:2] > best[i][:2]:
+                        best[i] = score
+        i = max(range(len(candidates)), key=lambda k: best[k][:2])
+        chain = []
+        while i >= 0:
+            chain.append(candidates[i])
+            i = best[i][2]
+        return chain[::-1]
@@ -10,6 +10,17 @@ Functionalities:
     - Vector similarity search for legal document retrieval
     - Persistent storage and loading of vector indices
     - Metadata tracking for retrieved chunks
+    - Selectable index types (flat, HNSW, IVF, IVF-PQ) with search-time knobs
+    - Compressed storage: fp16/int8 scalar quantization and PCA or prefix dimension reduction
+    - Recall-versus-flat evaluation for approximate indexes
+    - Incremental updates driven by a per-document manifest (ID-mapped index)
+    - Memory-mapped index and metadata for near-instant, shared loading
+    - Hybrid retrieval: BM25 lexical index fused with dense results (RRF)
+    - Direct (act, section) citation lookup that bypasses embeddings
+    - Metadata-filtered search (jurisdiction, act, source) with FAISS ID selectors
+    - Section-level statute chunks with act/section/source/page metadata
+    - Streaming builds in fixed-size batches with a memory ceiling and periodic flushes
+    - PyTorch, ONNX Runtime or int8-quantized ONNX inference for query and build encoding
 
 Typical Usage:
     from backend.rag.vector_store import FaissVectorStore
@@ -19,15 +30,167 @@ Typical Usage:
     store = FaissVectorStore(persist_dir="faiss_store")
     store.build_from_documents(docs)
     results = store.query("Indian Penal Code Section 420", top_k=5)
+
+    # Approximate index for large corpora
+    store = FaissVectorStore(persist_dir="faiss_store", index_type="hnsw",
+                             index_params={"M": 32, "efSearch": 64})
+    store.build_from_documents(docs)   # reports recall@10 against exact search
+    store.set_search_params(efSearch=128)
+
+    # int8 codes on 128 PCA dimensions: about 12x smaller than 384-dim float32
+    store = FaissVectorStore(persist_dir="faiss_store", index_type="int8",
+                             index_params={"reduce": "pca", "reduced_dim": 128})
+
+    # Only embed documents that were added or changed since the last sync
+    store.sync_documents("docustore/pdf")
+
+    # Stream a large corpus: documents are embedded and indexed batch by batch
+    store.build_from_documents(iter_documents("docustore/pdf"), batch_size=256, max_memory_mb=128)
+
+    # Exact tokens like "Section 35" are matched lexically and fused with dense hits
+    results = store.query("Section 35 Consumer Protection Act 2019", top_k=3, mode="hybrid")
+
+    # Scan only Kerala and central Acts
+    results = store.query("delay in service delivery", top_k=3, filters={"jurisdiction": ["Kerala", "India"]})
 """
 
 import os
+import json
+import math
+import time
 import faiss
 import numpy as np
 import pickle
-from typing import List, Any
+from typing import List, Any, Dict, Iterable, Optional, Tuple
 from sentence_transformers import SentenceTransformer
-from src.embedding import EmbeddingPipeline
+from pathlib import Path
+from src.embedding import EMBEDDING_BACKEND, EmbeddingPipeline, QueryEmbeddingCache, backend_kwargs, query_embedding_cache
+from src.executors import run_io
+from src.index_manifest import IndexManifest
+from src.data_loader import load_document
+from src.metadata_store import MetadataStore
+from src.bm25 import BM25Index, reciprocal_rank_fusion
+from src.citation_index import CitationIndex
+from src.metadata_filter import MetadataFilterIndex, search_parameters
+from src.statute_splitter import detect_jurisdiction
+
+# Build parameters per index type; search-time knobs (nprobe, efSearch) can be
+# changed after building with FaissVectorStore.set_search_params.
+INDEX_DEFAULTS = {
+    "flat": {},
+    "hnsw": {"M": 32, "efConstruction": 40, "efSearch": 64},
+    "ivf": {"nlist": None, "nprobe": 8},
+    "ivfpq": {"nlist": None, "nprobe": 8, "m": 16, "nbits": 8},
+    "fp16": {},
+    "int8": {},
+}
+SEARCH_PARAMS = ("nprobe", "efSearch")
+
+# Optional index_params["reduce"]: project vectors to index_params["reduced_dim"]
+# dimensions by PCA or by keeping the leading dimensions, for any index type
+DIM_REDUCTIONS = ("pca", "prefix")
+
+# "dense" = FAISS only; "hybrid" = FAISS and BM25 fused with reciprocal rank fusion
+RETRIEVAL_MODES = ("dense", "hybrid")
+HYBRID_MIN_CANDIDATES = 20
+
+# Chunk metadata stored next to the text for citations (statute chunks set all of them)
+CHUNK_METADATA_KEYS = ("source", "page", "act", "jurisdiction", "chapter", "section", "section_title", "part")
+
+# Streaming builds: chunks per embedding batch, and unflushed data allowed before saving
+INGEST_BATCH_SIZE = 256
+INGEST_MAX_MEMORY_MB = 256
+RECALL_SPILL_FILE = "recall_vectors.f32"
+# Ground-truth vectors searched per block when measuring recall (64k x 384 float32 = 96 MB)
+RECALL_BLOCK_ROWS = 65536
+
+
+def chunk_metadata(chunk: Any) -> Dict[str, Any]:
+    """Build the stored metadata record for a chunk.
+    
+    Args:
+        chunk (Any): LangChain Document produced by EmbeddingPipeline.
+    
+    Returns:
+        Dict[str, Any]: "text" plus whichever CHUNK_METADATA_KEYS the chunk carries.
+        Chunks without a jurisdiction get one from their act or file name when it names a State.
+    """
+    record = {"text": chunk.page_content}
+    for key in CHUNK_METADATA_KEYS:
+        if chunk.metadata.get(key) is not None:
+            record[key] = chunk.metadata[key]
+    if "jurisdiction" not in record:
+        jurisdiction = detect_jurisdiction(record.get("act"), record.get("source"))
+        if jurisdiction:
+            record["jurisdiction"] = jurisdiction
+    return record
+
+
+def exact_search(embeddings: np.ndarray, queries: np.ndarray, top_k: int,
+                 block_rows: int = RECALL_BLOCK_ROWS) -> np.ndarray:
+    """Exact L2 nearest neighbours, searching embeddings one block at a time.
+    
+    Only one block of embeddings is held in a flat index at once, so a
+    memory-mapped spill file larger than RAM can serve as ground truth.
+    
+    Args:
+        embeddings (np.ndarray): Vectors to search (may be a np.memmap), shape (n_vectors, dimension).
+        queries (np.ndarray): Query vectors, shape (n_queries, dimension).
+        top_k (int): Neighbours returned per query.
+        block_rows (int): Vectors searched per block. Defaults to RECALL_BLOCK_ROWS.
+    
+    Returns:
+        np.ndarray: Row positions of the top_k nearest vectors per query, nearest first.
+    """
+    best_dist = np.empty((len(queries), 0), dtype='float32')
+    best_ids = np.empty((len(queries), 0), dtype='int64')
+    for offset in range(0, embeddings.shape[0], block_rows):
+        block = np.ascontiguousarray(embeddings[offset:offset + block_rows], dtype='float32')
+        flat = faiss.IndexFlatL2(block.shape[1])
+        flat.add(block)
+        dist, ids = flat.search(queries, min(top_k, len(block)))
+        best_dist = np.hstack([best_dist, dist])
+        best_ids = np.hstack([best_ids, ids + offset])
+        order = np.argsort(best_dist, axis=1, kind='stable')[:, :top_k]
+        best_dist = np.take_along_axis(best_dist, order, axis=1)
+        best_ids = np.take_along_axis(best_ids, order, axis=1)
+    return best_ids
+
+
+def measure_recall(index: Any, embeddings: np.ndarray, queries: np.ndarray, top_k: int = 10) -> Dict[str, float]:
+    """Compare an index against exact (flat L2) search over the same vectors.
+    
+    Ground truth comes from exact_search, so embeddings may be a memory-mapped
+    file larger than RAM.
+    
+    Args:
+        index (faiss.Index): Index to evaluate. Its IDs must be row positions in embeddings.
+        embeddings (np.ndarray): Ground-truth vectors, shape (n_vectors, dimension).
+        queries (np.ndarray): Query vectors, shape (n_queries, dimension).
+        top_k (int): Neighbours compared per query. Defaults to 10.
+    
+    Returns:
+        Dict[str, float]: recall@k plus per-query latency of both indexes in ms.
+    """
+    top_k = min(top_k, embeddings.shape[0])
+
+    start = time.perf_counter()
+    truth = exact_search(embeddings, queries, top_k)
+    flat_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    start = time.perf_counter()
+    _, found = index.search(queries, top_k)
+    index_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    hits = sum(len(set(t) & set(f)) for t, f in zip(truth, found))
+    return {
+        "recall_at_k": round(hits / (len(queries) * top_k), 4),
+        "top_k": top_k,
+        "num_queries": len(queries),
+        "flat_ms_per_query": round(flat_ms, 4),
+        "index_ms_per_query": round(index_ms, 4),
+    }
+
 
 class FaissVectorStore:
     """FAISS-based vector store for semantic search over legal documents.
@@ -39,14 +202,30 @@ class FaissVectorStore:
     Attributes:
         persist_dir (str): Directory path for storing FAISS index and metadata.
         index (faiss.Index): FAISS index for vector similarity search.
-        metadata (List[dict]): List of metadata dictionaries for each indexed chunk.
+        metadata (MetadataStore): List-like metadata for each indexed chunk.
         embedding_model (str): Name of the sentence-transformer model.
         model (SentenceTransformer): Loaded embedding model instance.
+        embedding_backend (str): Inference backend, "torch", "onnx" or "onnx-int8".
         chunk_size (int): Maximum characters per document chunk.
         chunk_overlap (int): Overlapping characters between consecutive chunks.
+        chunking (str): Chunking strategy for builds, "recursive" or "statute".
+        index_type (str): One of "flat", "hnsw", "ivf", "ivfpq", "fp16" or "int8".
+        index_params (dict): Build and search parameters for the index type.
+        recall_report (dict): Last recall-versus-flat measurement, if any.
+        bm25 (BM25Index): Lexical index over the same chunks, keyed by vector ID.
+        citations (CitationIndex): (act, section) -> vector IDs for statute chunks.
+        filters (MetadataFilterIndex): jurisdiction / act / source -> vector IDs for filtered search.
+        retrieval_mode (str): Default query() mode, "dense" or "hybrid".
+        query_cache (QueryEmbeddingCache): Repeated query texts skip the model.
+    
+    Vectors are stored under explicit IDs (IndexIDMap2) and metadata[i] belongs
+    to vector ID i; removed chunks leave a None placeholder so IDs stay stable.
     """
     
-    def __init__(self, persist_dir: str = "data/faiss_store", embedding_model: str = "all-MiniLM-L6-v2", chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(self, persist_dir: str = "data/faiss_store", embedding_model: str = "all-MiniLM-L6-v2", chunk_size: int = 1000, chunk_overlap: int = 200,
+                 index_type: str = "flat", index_params: Optional[Dict[str, Any]] = None, retrieval_mode: str = "dense",
+                 query_cache: Optional[QueryEmbeddingCache] = None, chunking: str = "recursive",
+                 embedding_backend: Optional[str] = None, model: Optional[Any] = None):
         """Initialize the FAISS vector store with embedding configuration.
         
         Args:
@@ -54,102 +233,587 @@ class FaissVectorStore:
             embedding_model (str): Sentence-transformer model name. Defaults to "all-MiniLM-L6-v2".
             chunk_size (int): Maximum characters per chunk. Defaults to 1000.
             chunk_overlap (int): Overlapping characters between chunks. Defaults to 200.
+            index_type (str): Index used for new builds: "flat" (exact), "hnsw",
+                "ivf", "ivfpq", or scalar-quantized "fp16" / "int8" (2x / 4x smaller
+                than flat). Defaults to "flat". A loaded index keeps its saved type.
+            index_params (dict, optional): Overrides for INDEX_DEFAULTS[index_type],
+                e.g. {"nlist": 1024, "nprobe": 16} or {"M": 48, "efSearch": 128}.
+                Add {"reduce": "pca" or "prefix", "reduced_dim": 128} to store
+                vectors with fewer dimensions.
+            retrieval_mode (str): Default mode for query(): "dense" or "hybrid". Defaults to "dense".
+            query_cache (QueryEmbeddingCache, optional): Cache for query embeddings.
+                Defaults to the process-wide query_embedding_cache.
+            chunking (str): "recursive" or "statute" (see EmbeddingPipeline). Defaults to "recursive".
+            embedding_backend (str, optional): "torch", "onnx" or "onnx-int8" inference
+                for queries and builds. Defaults to EMBEDDING_BACKEND.
+            model (SentenceTransformer, optional): Already-loaded embedding_model to
+                share (e.g. between shards) instead of loading another copy.
+        
+        Raises:
+            ValueError: If index_type, the dimension reduction, retrieval_mode or
+                embedding_backend is not supported.
         """
+        if index_type not in INDEX_DEFAULTS:
+            raise ValueError(f"Unsupported index_type '{index_type}'. Choose from: {', '.join(INDEX_DEFAULTS)}")
+        reduce = (index_params or {}).get("reduce")
+        if reduce and reduce not in DIM_REDUCTIONS:
+            raise ValueError(f"Unsupported dimension reduction '{reduce}'. Choose from: {', '.join(DIM_REDUCTIONS)}")
+        if retrieval_mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unsupported retrieval mode '{retrieval_mode}'. Choose from: {', '.join(RETRIEVAL_MODES)}")
         self.persist_dir = persist_dir
         os.makedirs(self.persist_dir, exist_ok=True)
         self.index = None
-        self.metadata = []
+        self.metadata = MetadataStore()
+        self._mmapped = False
+        self.index_type = index_type
+        self.retrieval_mode = retrieval_mode
+        self.query_cache = query_cache if query_cache is not None else query_embedding_cache
+        self.index_params = {**INDEX_DEFAULTS[index_type], **(index_params or {})}
+        self.recall_report = None
+        self.bm25 = BM25Index()
+        self.citations = CitationIndex()
+        self.filters = MetadataFilterIndex()
+        self._stale_vectors = 0
         self.embedding_model = embedding_model
-        self.model = SentenceTransformer(embedding_model)
+        self.embedding_backend = embedding_backend or EMBEDDING_BACKEND
+        # Backends give slightly different vectors, so their cached queries are kept apart
+        self._query_cache_key = embedding_model if self.embedding_backend == "torch" else f"{embedding_model}@{self.embedding_backend}"
+        self.model = model if model is not None else SentenceTransformer(embedding_model, **backend_kwargs(self.embedding_backend))
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        print(f"[INFO] Loaded embedding model: {embedding_model}")
+        self.chunking = chunking
+        print(f"[INFO] Loaded embedding model: {embedding_model} ({self.embedding_backend})")
 
-    def build_from_documents(self, documents: List[Any]):
-        """Build vector store from raw documents by chunking, embedding, and indexing.
+    def build_from_documents(self, documents: Iterable[Any], batch_size: int = INGEST_BATCH_SIZE,
+                             max_memory_mb: float = INGEST_MAX_MEMORY_MB, flush_every: int = 0):
+        """Build vector store from raw documents by streaming them through chunking, embedding, and indexing.
+        
+        Documents (a list, or a generator such as iter_documents()) are chunked
+        and embedded in fixed-size batches that are added to the index as they
+        are produced, so chunks and embeddings for the whole corpus are never
+        held at once. Unflushed batch data (vectors plus chunk text) counts
+        against max_memory_mb; crossing it, or every flush_every batches, saves
+        the index and metadata to disk, after which metadata is memory-mapped
+        rather than kept in RAM.
         
-        Processes documents through the complete pipeline: chunking into smaller segments,
-        generating embeddings, adding to FAISS index, and persisting to disk.
+        IVF, IVF-PQ, int8 and PCA-reduced indexes are trained before their
+        first add, so their first batches are buffered (up to max_memory_mb) as
+        the training set. For approximate or compressed indexes the vectors are
+        spilled to a temporary file in persist_dir so recall against exact
+        search can still be measured.
         
         Args:
-            documents (List[Any]): List of LangChain Document objects to process.
+            documents (Iterable[Any]): LangChain Document objects to process.
+            batch_size (int): Chunks embedded and added per batch. Defaults to 256.
+            max_memory_mb (float): Unflushed data allowed before flushing to disk. Defaults to 256.
+            flush_every (int): Also flush after this many batches; 0 disables. Defaults to 0.
         
         Note:
-            Automatically saves the index after building. Existing index is replaced.
-        """
-        print(f"[INFO] Building vector store from {len(documents)} raw documents...")
-        emb_pipe = EmbeddingPipeline(model_name=self.embedding_model, chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap)
-        chunks = emb_pipe.chunk_documents(documents)
-        embeddings = emb_pipe.embed_chunks(chunks)
-        metadatas = [{"text": chunk.page_content} for chunk in chunks]
-        self.add_embeddings(np.array(embeddings).astype('float32'), metadatas)
+            Automatically saves the index after building. Existing index is replaced,
+            and any manifest is discarded so the next sync_documents rebuilds it.
+            The FAISS index itself stays in RAM while it is being written.
+        """
+        print(f"[INFO] Building vector store from streamed documents (batch size {batch_size})...")
+        self._reset()
+        manifest = IndexManifest(self.persist_dir)
+        if manifest.exists():
+            os.remove(manifest.path)
+        emb_pipe = EmbeddingPipeline(model_name=self.embedding_model, chunk_size=self.chunk_size,
+                                     chunk_overlap=self.chunk_overlap, chunking=self.chunking,
+                                     backend=self.embedding_backend)
+        ceiling = max_memory_mb * 2 ** 20
+        spill_path = os.path.join(self.persist_dir, RECALL_SPILL_FILE)
+        spill = open(spill_path, "wb") if not self._is_exact() else None
+        buffered = []
+        unflushed_bytes = 0
+        batches = 0
+        try:
+            for chunks, embeddings in emb_pipe.iter_batches(documents, batch_size):
+                if spill:
+                    spill.write(embeddings.tobytes())
+                buffered.append((chunks, embeddings))
+                unflushed_bytes += embeddings.nbytes + sum(len(chunk.page_content.encode("utf-8")) for chunk in chunks)
+                if self.index is None and self._needs_training() and unflushed_bytes < ceiling:
+                    continue
+                self._add_chunk_batches(buffered)
+                buffered = []
+                batches += 1
+                if unflushed_bytes >= ceiling or (flush_every and batches % flush_every == 0):
+                    print(f"[INFO] Flushing {len(self.metadata)} vectors to {self.persist_dir}")
+                    self.save()
+                    unflushed_bytes = 0
+            if buffered:
+                self._add_chunk_batches(buffered)
+            if spill:
+                spill.close()
+                if self.index is not None:
+                    self.evaluate_recall(np.memmap(spill_path, dtype='float32', mode='r').reshape(-1, self.index.d))
+        finally:
+            emb_pipe.close()
+            if spill:
+                spill.close()
+                os.remove(spill_path)
+        print(f"[INFO] Encode throughput: {emb_pipe.get_encode_report()}")
+        if self.index is None:
+            print("[WARN] No chunks produced; nothing to index.")
+            return
         self.save()
         print(f"[INFO] Vector store built and saved to {self.persist_dir}")
 
-    def add_embeddings(self, embeddings: np.ndarray, metadatas: List[Any] = None):
+    def _add_chunk_batches(self, batches: List[Tuple[List[Any], np.ndarray]]) -> np.ndarray:
+        """Add buffered (chunks, embeddings) batches to the index in one call."""
+        chunks = [chunk for batch_chunks, _ in batches for chunk in batch_chunks]
+        embeddings = np.concatenate([batch_embeddings for _, batch_embeddings in batches])
+        return self.add_embeddings(embeddings, [chunk_metadata(chunk) for chunk in chunks])
+
+    def _is_exact(self) -> bool:
+        """Return True if the configured index stores full float32 vectors (exact search)."""
+        return self.index_type == "flat" and not self.index_params.get("reduce")
+
+    def _needs_training(self) -> bool:
+        """Return True if a new index of the configured type must be trained before adding."""
+        return self.index_type in ("ivf", "ivfpq", "int8") or self.index_params.get("reduce") == "pca"
+
+    def _reset(self):
+        """Drop the in-memory index and metadata."""
+        self.index = None
+        self.metadata = MetadataStore()
+        self._mmapped = False
+        self.recall_report = None
+        self.bm25 = BM25Index()
+        self.citations = CitationIndex()
+        self.filters = MetadataFilterIndex()
+        self._stale_vectors = 0
+
+    def _create_index(self, dim: int, num_vectors: int):
+        """Create an empty ID-mapped index of the configured type.
+        
+        Args:
+            dim (int): Embedding dimension.
+            num_vectors (int): Vectors available for training.
+        
+        A configured dimension reduction becomes a FAISS pre-transform inside
+        the index, so added vectors and queries are projected identically and
+        the projection is saved with the index.
+        
+        Returns:
+            faiss.IndexIDMap2: Untrained (IVF, int8, PCA) or empty index using L2 distance.
+        """
+        reduce = self.index_params.get("reduce")
+        if not reduce:
+            return faiss.IndexIDMap2(self._create_base_index(dim, num_vectors))
+        reduced_dim = min(int(self.index_params.get("reduced_dim") or dim // 2), dim)
+        self.index_params["reduced_dim"] = reduced_dim
+        if reduce == "pca":
+            transform = faiss.PCAMatrix(dim, reduced_dim)
+        else:
+            # Keep the leading dimensions (Matryoshka-style truncation)
+            transform = faiss.RemapDimensionsTransform(dim, reduced_dim, False)
+        base = self._create_base_index(reduced_dim, num_vectors)
+        return faiss.IndexIDMap2(faiss.IndexPreTransform(transform, base))
+
+    def _create_base_index(self, dim: int, num_vectors: int):
+        """Create the underlying index of the configured type.
+        
+        IVF list counts and PQ code sizes are clamped to what the first batch
+        of vectors can train, so small corpora still build.
+        
+        Args:
+            dim (int): Embedding dimension.
+            num_vectors (int): Vectors available for training.
+        
+        Returns:
+            faiss.Index: Untrained (IVF) or empty index using L2 distance.
+        """
+        params = self.index_params
+        if self.index_type == "flat":
+            return faiss.IndexFlatL2(dim)
+        if self.index_type == "fp16":
+            return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_L2)
+        if self.index_type == "int8":
+            # Per-dimension min/max ranges are learned from the training batch
+            return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(dim, params["M"])
+            index.hnsw.efConstruction = params["efConstruction"]
+            return index
+
+        # IVF: roughly 4 * sqrt(n) lists unless given, never more than the training set
+        nlist = params.get("nlist") or int(4 * math.sqrt(num_vectors))
+        params["nlist"] = max(1, min(nlist, num_vectors))
+        if self.index_type == "ivf":
+            return faiss.index_factory(dim, f"IVF{params['nlist']},Flat")
+        if dim % params["m"] != 0:
+            raise ValueError(f"PQ sub-quantizers m={params['m']} must divide the embedding dimension {dim}")
+        # Each PQ codebook needs at least 2**nbits training points
+        params["nbits"] = max(1, min(params["nbits"], int(math.log2(max(num_vectors, 2)))))
+        return faiss.index_factory(dim, f"IVF{params['nlist']},PQ{params['m']}x{params['nbits']}")
+
+    def set_search_params(self, **params):
+        """Change search-time knobs on the live index.
+        
+        Args:
+            **params: nprobe (IVF lists scanned per query) and/or efSearch
+                (HNSW candidate list size). Higher values trade latency for recall.
+        
+        Raises:
+            ValueError: If a parameter is not a search-time knob.
+        """
+        for name, value in params.items():
+            if name not in SEARCH_PARAMS:
+                raise ValueError(f"Unknown search parameter '{name}'. Choose from: {', '.join(SEARCH_PARAMS)}")
+            self.index_params[name] = value
+        self._apply_search_params()
+
+    def _apply_search_params(self):
+        """Push stored nprobe/efSearch values that apply to this index type."""
+        if self.index is None:
+            return
+        space = faiss.ParameterSpace()
+        for name in SEARCH_PARAMS:
+            if name in self.index_params and name in INDEX_DEFAULTS.get(self.index_type, {}):
+                space.set_index_parameter(self.index, name, self.index_params[name])
+
+    def evaluate_recall(self, embeddings: np.ndarray, num_queries: int = 100, top_k: int = 10) -> Dict[str, float]:
+        """Measure recall@k of the current index against exact search.
+        
+        Queries are a random sample of the indexed vectors, so this needs the
+        embeddings that were added (in insertion order, starting from vector
+        ID 0). Exact search runs block by block, so a memory-mapped spill file
+        is never loaded whole. The report is kept in recall_report and saved
+        with the index configuration.
+        
+        Args:
+            embeddings (np.ndarray): Vectors that were added to the index (may be a np.memmap).
+            num_queries (int): Number of sampled queries. Defaults to 100.
+            top_k (int): Neighbours compared per query. Defaults to 10.
+        
+        Returns:
+            Dict[str, float]: recall_at_k and per-query latency for flat and this index.
+        """
+        rng = np.random.default_rng(0)
+        sample = np.sort(rng.choice(len(embeddings), size=min(num_queries, len(embeddings)), replace=False))
+        queries = np.ascontiguousarray(embeddings[sample], dtype='float32')
+        self.recall_report = measure_recall(self.index, embeddings, queries, top_k)
+        print(f"[INFO] {self.index_type} recall@{self.recall_report['top_k']} vs flat: "
+              f"{self.recall_report['recall_at_k']:.3f} "
+              f"({self.recall_report['index_ms_per_query']:.3f} ms vs {self.recall_report['flat_ms_per_query']:.3f} ms per query)")
+        return self.recall_report
+
+    def add_embeddings(self, embeddings: np.ndarray, metadatas: List[Any] = None) -> np.ndarray:
         """Add embedding vectors and their metadata to the FAISS index.
         
-        Creates a new FAISS IndexFlatL2 if none exists, then adds vectors.
-        IndexFlatL2 uses L2 (Euclidean) distance for similarity measurement.
+        Creates a new index of the configured type if none exists, training it
+        on this batch when the type requires it (IVF, IVF-PQ), then adds vectors
+        under the next free IDs. All index types use L2 (Euclidean) distance.
         
         Args:
             embeddings (np.ndarray): Array of shape (n_vectors, dimension) with float32 dtype.
             metadatas (List[Any], optional): List of metadata dicts for each vector.
+        
+        Returns:
+            np.ndarray: The int64 vector IDs assigned, in order.
         """
         dim = embeddings.shape[1]
+        self._ensure_writable()
         if self.index is None:
-            self.index = faiss.IndexFlatL2(dim)
-        self.index.add(embeddings)
-        if metadatas:
-            self.metadata.extend(metadatas)
+            self.index = self._create_index(dim, embeddings.shape[0])
+            if not self.index.is_trained:
+                print(f"[INFO] Training {self.index_type} index on {embeddings.shape[0]} vectors...")
+                self.index.train(embeddings)
+            self._apply_search_params()
+        ids = np.arange(len(self.metadata), len(self.metadata) + embeddings.shape[0], dtype='int64')
+        if isinstance(self.index, faiss.IndexIDMap):
+            self.index.add_with_ids(embeddings, ids)
+        else:
+            # Indexes saved before ID mapping: IDs are insertion positions
+            self.index.add(embeddings)
+        self.metadata.extend(metadatas if metadatas else [{} for _ in range(embeddings.shape[0])])
+        if self.bm25 is not None and metadatas:
+            self.bm25.add(ids, [(meta or {}).get("text", "") for meta in metadatas])
+        if self.citations is not None and metadatas:
+            self.citations.add(ids, metadatas)
+        if self.filters is not None and metadatas:
+            self.filters.add(ids, metadatas)
         print(f"[INFO] Added {embeddings.shape[0]} vectors to Faiss index.")
+        return ids
+
+    def remove_ids(self, ids: List[int]):
+        """Delete vectors and their metadata by ID.
+        
+        HNSW graphs cannot delete nodes; for them the vectors stay in the index
+        as tombstones that search() skips, until the next full rebuild.
+        
+        Args:
+            ids (List[int]): Vector IDs to delete.
+        
+        Raises:
+            ValueError: If the index predates ID mapping (rebuild it first).
+        """
+        if not len(ids):
+            return
+        if not isinstance(self.index, faiss.IndexIDMap):
+            raise ValueError("Index was built without ID mapping; rebuild it before removing vectors")
+        self._ensure_writable()
+        try:
+            self.index.remove_ids(np.asarray(ids, dtype='int64'))
+        except RuntimeError:
+            self._stale_vectors += len(ids)
+        if self.bm25 is not None:
+            self.bm25.remove(ids, [(self.metadata[idx] or {}).get("text", "") for idx in ids])
+        if self.citations is not None:
+            self.citations.remove(ids, [self.metadata[idx] for idx in ids])
+        if self.filters is not None:
+            self.filters.remove(ids, [self.metadata[idx] for idx in ids])
+        for idx in ids:
+            self.metadata[idx] = None
+        print(f"[INFO] Removed {len(ids)} vectors from Faiss index.")
+
+    def sync_documents(self, data_dir: str) -> Dict[str, Any]:
+        """Bring the index in line with data_dir, embedding only what changed.
+        
+        Compares content hashes against manifest.json. Chunks of changed and
+        removed documents are deleted, and added and changed documents are
+        chunked, embedded and inserted. Without a manifest (or when the model,
+        embedding backend or chunk settings differ from it) the index is
+        rebuilt from scratch.
+        Documents that fail to load are left out of the manifest, so the next
+        sync retries them. Saves the index and manifest afterwards.
+        
+        Args:
+            data_dir (str): Directory holding the source documents.
+        
+        Returns:
+            Dict[str, Any]: Document counts per change type, chunks embedded and
+            the names of documents that failed to load.
+        """
+        manifest = IndexManifest(self.persist_dir).load()
+        settings = {"embedding_model": self.embedding_model, "chunk_size": self.chunk_size,
+                    "chunk_overlap": self.chunk_overlap}
+        if self.chunking != "recursive":
+            # Only recorded when set, so manifests from before statute chunking still match
+            settings["chunking"] = self.chunking
+        if self.embedding_backend != "torch":
+            # ONNX vectors differ slightly from torch ones; never mix backends in one index
+            settings["embedding_backend"] = self.embedding_backend
+        if manifest.settings != settings or not isinstance(self.index, faiss.IndexIDMap):
+            print("[INFO] Manifest missing or outdated; rebuilding index from scratch.")
+            self._reset()
+            manifest.settings, manifest.documents = settings, {}
+
+        status = manifest.diff(data_dir)
+        for name in status["removed"] + status["changed"]:
+            self.remove_ids(manifest.ids_for(name))
+            del manifest.documents[name]
+
+        # Chunk every new version first so one embedding pass (and, for IVF,
+        # one training batch) covers them all
+        pending = status["added"] + status["changed"]
+        root = Path(data_dir).resolve()
+        chunks_per_doc = []
+        chunks = []
+        failed = []
+        if pending:
+            emb_pipe = EmbeddingPipeline(model_name=self.embedding_model, chunk_size=self.chunk_size,
+                                     chunk_overlap=self.chunk_overlap, chunking=self.chunking,
+                                     backend=self.embedding_backend)
+            for name in pending:
+                try:
+                    doc_chunks = emb_pipe.chunk_documents(load_document(str(root / name)))
+                except Exception as e:
+                    print(f"[ERROR] Failed to load {name}: {e}")
+                    failed.append(name)
+                    doc_chunks = []
+                chunks_per_doc.append(doc_chunks)
+                chunks.extend(doc_chunks)
+            if chunks:
+                embeddings = np.array(emb_pipe.embed_chunks(chunks)).astype('float32')
+                ids = self.add_embeddings(embeddings, [chunk_metadata(chunk) for chunk in chunks])
+            else:
+                ids = np.array([], dtype='int64')
+            emb_pipe.close()
+
+            offset = 0
+            for name, doc_chunks in zip(pending, chunks_per_doc):
+                if name not in failed:
+                    manifest.record(name, status["hashes"][name], ids[offset:offset + len(doc_chunks)])
+                offset += len(doc_chunks)
+
+        if self.index is not None:
+            self.save()
+        manifest.save()
+        summary = {
+            "added": len(status["added"]),
+            "changed": len(status["changed"]),
+            "removed": len(status["removed"]),
+            "unchanged": len(status["unchanged"]),
+            "chunks_embedded": len(chunks),
+            "failed": failed,
+        }
+        print(f"[INFO] Synced {data_dir}: {summary}")
+        return summary
 
     def save(self):
         """Persist FAISS index and metadata to disk.
         
-        Saves two files:
+        Saves these files, each written under a temporary name and renamed into
+        place so processes that have the previous version mapped are unaffected:
             - faiss.index: Binary FAISS index file
-            - metadata.pkl: Pickled metadata list
+            - metadata.bin / metadata.offsets.npy: Offset-indexed metadata blob
+            - bm25.json: Lexical index for hybrid retrieval
+            - citations.json: (act, section) -> vector IDs for direct citation lookup
+            - filters.json: jurisdiction / act / source -> vector IDs for filtered search
+            - index_config.json: Index type, build/search parameters and last recall report
+        
+        A legacy metadata.pkl is removed once the blob has been written.
         """
         faiss_path = os.path.join(self.persist_dir, "faiss.index")
-        meta_path = os.path.join(self.persist_dir, "metadata.pkl")
-        faiss.write_index(self.index, faiss_path)
-        with open(meta_path, "wb") as f:
-            pickle.dump(self.metadata, f)
+        legacy_meta_path = os.path.join(self.persist_dir, "metadata.pkl")
+        config_path = os.path.join(self.persist_dir, "index_config.json")
+        faiss.write_index(self.index, faiss_path + ".tmp")
+        os.replace(faiss_path + ".tmp", faiss_path)
+        MetadataStore.write(self.persist_dir, self.metadata)
+        self.metadata = MetadataStore.open(self.persist_dir)
+        if os.path.exists(legacy_meta_path):
+            os.remove(legacy_meta_path)
+        if self.bm25 is not None:
+            self.bm25.save(self.persist_dir)
+        if self.citations is not None:
+            self.citations.save(self.persist_dir)
+        if self.filters is not None:
+            self.filters.save(self.persist_dir)
+        with open(config_path, "w") as f:
+            json.dump({
+                "index_type": self.index_type,
+                "index_params": self.index_params,
+                "dimension": self.index.d,
+                "recall_report": self.recall_report,
+            }, f, indent=2)
         print(f"[INFO] Saved Faiss index and metadata to {self.persist_dir}")
 
-    def load(self):
+    def _read_index(self, mmap: bool):
+        """Read faiss.index, memory-mapping its vectors when mmap is True.
+        
+        Flat and HNSW codes are mapped with IO_FLAG_MMAP_IFC; IVF inverted
+        lists with IO_FLAG_MMAP. Mapped indexes are read-only.
+        """
+        faiss_path = os.path.join(self.persist_dir, "faiss.index")
+        if not mmap:
+            return faiss.read_index(faiss_path)
+        flag = faiss.IO_FLAG_MMAP if self.index_type in ("ivf", "ivfpq") else faiss.IO_FLAG_MMAP_IFC
+        return faiss.read_index(faiss_path, flag | faiss.IO_FLAG_READ_ONLY)
+
+    def _ensure_writable(self):
+        """Replace a memory-mapped index with an in-RAM copy before modifying it.
+        
+        Mapped FAISS storage cannot grow or shrink (flat codes abort the
+        process), so every write path calls this first.
+        """
+        if self._mmapped:
+            self.index = self._read_index(mmap=False)
+            self._mmapped = False
+            self._apply_search_params()
+
+    def load(self, mmap: bool = True):
         """Load previously saved FAISS index and metadata from disk.
         
+        By default the index vectors and the metadata blob are memory-mapped:
+        loading is near-instant, pages are read on demand and worker processes
+        opening the same store share them. Adding or removing vectors later
+        transparently switches to an in-RAM copy of the index.
+        
+        The saved index type and search parameters replace the constructor
+        values. Indexes saved before index_config.json existed load as "flat",
+        and stores saved before metadata.bin existed load metadata.pkl.
+        
+        Args:
+            mmap (bool): Memory-map the index and metadata. Defaults to True.
+        
         Raises:
             FileNotFoundError: If index files don't exist in persist_dir.
         """
-        faiss_path = os.path.join(self.persist_dir, "faiss.index")
-        meta_path = os.path.join(self.persist_dir, "metadata.pkl")
-        self.index = faiss.read_index(faiss_path)
-        with open(meta_path, "rb") as f:
-            self.metadata = pickle.load(f)
-        print(f"[INFO] Loaded Faiss index and metadata from {self.persist_dir}")
+        legacy_meta_path = os.path.join(self.persist_dir, "metadata.pkl")
+        config_path = os.path.join(self.persist_dir, "index_config.json")
+        if os.path.exists(config_path):
+            with open(config_path) as f:
+                config = json.load(f)
+            self.index_type = config["index_type"]
+            self.index_params = config["index_params"]
+            self.recall_report = config.get("recall_report")
+        else:
+            self.index_type, self.index_params, self.recall_report = "flat", {}, None
+        self.index = self._read_index(mmap)
+        self._mmapped = mmap
+        if MetadataStore.exists(self.persist_dir):
+            self.metadata = MetadataStore.open(self.persist_dir)
+        else:
+            with open(legacy_meta_path, "rb") as f:
+                self.metadata = MetadataStore(pickle.load(f))
+        # Stores saved before hybrid retrieval get their BM25 index on first hybrid query
+        self.bm25 = BM25Index.load(self.persist_dir) if BM25Index.exists(self.persist_dir) else None
+        self.citations = CitationIndex.load(self.persist_dir) if CitationIndex.exists(self.persist_dir) else None
+        self.filters = MetadataFilterIndex.load(self.persist_dir) if MetadataFilterIndex.exists(self.persist_dir) else None
+        self._stale_vectors = max(self.index.ntotal - self.metadata.count_live(), 0)
+        self._apply_search_params()
+        print(f"[INFO] Loaded {self.index_type} Faiss index and metadata from {self.persist_dir}"
+              f"{' (memory-mapped)' if mmap else ''}")
 
-    def search(self, query_embedding: np.ndarray, top_k: int = 5):
+    def search(self, query_embedding: np.ndarray, top_k: int = 5, filters: Optional[Dict[str, Any]] = None):
         """Search for similar vectors using a pre-computed query embedding.
         
         Args:
             query_embedding (np.ndarray): Query vector of shape (1, dimension).
             top_k (int): Number of nearest neighbors to retrieve. Defaults to 5.
+            filters (dict, optional): Metadata filters (see search_batch()).
         
         Returns:
             List[dict]: List of results with keys 'index', 'distance', and 'metadata'.
                        Lower distance indicates higher similarity.
         """
-        D, I = self.index.search(query_embedding, top_k)
-        results = []
-        for idx, dist in zip(I[0], D[0]):
-            meta = self.metadata[idx] if idx < len(self.metadata) else None
-            results.append({"index": idx, "distance": dist, "metadata": meta})
-        return results
+        return self.search_batch(query_embedding, top_k=top_k, filters=filters)[0]
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 5,
+                     filters: Optional[Dict[str, Any]] = None) -> List[List[dict]]:
+        """Search for several pre-computed query embeddings in one FAISS call.
+        
+        Args:
+            query_embeddings (np.ndarray): Query matrix of shape (n_queries, dimension).
+            top_k (int): Number of nearest neighbors per query. Defaults to 5.
+            filters (dict, optional): field -> value or list of values over
+                "jurisdiction", "act" and "source", e.g. {"jurisdiction": ["Kerala", "India"]}.
+                Applied inside FAISS with an ID selector, so other vectors are not scanned.
+        
+        Returns:
+            List[List[dict]]: One result list per query row (see search()).
+        
+        Raises:
+            ValueError: If a filter field is not supported.
+        """
+        params = None
+        if filters:
+            self._ensure_filters()
+            allowed = self.filters.select(filters)
+            if not len(allowed):
+                return [[] for _ in range(len(query_embeddings))]
+            params = search_parameters(allowed, self.index_type, self.index_params)
+        # Over-fetch past tombstoned vectors (HNSW removals) so top_k live results remain
+        D, I = self.index.search(query_embeddings, top_k + self._stale_vectors, params=params)
+        batch_results = []
+        for ids, distances in zip(I, D):
+            results = []
+            for idx, dist in zip(ids, distances):
+                # Approximate indexes return -1 when fewer than top_k neighbours are found
+                if idx < 0:
+                    continue
+                meta = self.metadata[idx] if idx < len(self.metadata) else None
+                if meta is None and idx < len(self.metadata):
+                    continue
+                results.append({"index": idx, "distance": dist, "metadata": meta})
+            batch_results.append(results[:top_k])
+        return batch_results
 
-    def query(self, query_text: str, top_k: int = 5):
+    def query(self, query_text: str, top_k: int = 5, mode: Optional[str] = None,
+              filters: Optional[Dict[str, Any]] = None):
         """Query the vector store using natural language text.
         
         Converts query text to embedding and retrieves most similar document chunks.
@@ -158,23 +822,225 @@ class FaissVectorStore:
         Args:
             query_text (str): Natural language query (e.g., "IPC Section 420 fraud cases").
             top_k (int): Number of most relevant chunks to return. Defaults to 5.
+            mode (str, optional): "dense" (FAISS only) or "hybrid" (FAISS + BM25
+                with reciprocal rank fusion). Defaults to retrieval_mode.
+            filters (dict, optional): Metadata filters, e.g. {"jurisdiction": "Kerala"}
+                (see search_batch()).
         
         Returns:
             List[dict]: Ranked results with document chunks and similarity scores.
+                Hybrid results also carry the fused 'score'; chunks found only
+                lexically have a 'distance' of None.
+        
+        Raises:
+            ValueError: If mode or a filter field is not supported.
         
         Example:
             >>> results = store.query("Kerala land acquisition laws", top_k=3)
             >>> print(results[0]['metadata']['text'])
         """
+        mode = mode or self.retrieval_mode
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unsupported retrieval mode '{mode}'. Choose from: {', '.join(RETRIEVAL_MODES)}")
         print(f"[INFO] Querying vector store for: '{query_text}'")
-        query_emb = self.model.encode([query_text]).astype('float32')
-        return self.search(query_emb, top_k=top_k)
+        query_emb = self.embed_query(query_text)[None, :]
+        if mode == "hybrid":
+            return self._hybrid_search(query_text, query_emb, top_k, filters)
+        return self.search(query_emb, top_k=top_k, filters=filters)
+
+    def embed_query(self, query_text: str) -> np.ndarray:
+        """Embed one query through the query embedding cache.
+        
+        Args:
+            query_text (str): Natural language query.
+        
+        Returns:
+            np.ndarray: float32 vector of shape (dimension,).
+        """
+        return self.query_cache.encode(self.model, self._query_cache_key, [query_text])[0]
+
+    def lookup_citations(self, text: str, limit: Optional[int] = None) -> List[dict]:
+        """Return the chunks of provisions cited explicitly in text, without embedding it.
+        
+        "Section 3 of the Kerala Right to Public Service Act" resolves through
+        the citation index with dictionary lookups, so no model call or vector
+        search is made.
+        
+        Args:
+            text (str): Query, grievance or research text.
+            limit (int, optional): Maximum chunks to return.
+        
+        Returns:
+            List[dict]: Results shaped like query() ('index', 'distance' of 0.0,
+            'metadata'), in citation order; empty if nothing cited is indexed.
+        """
+        self._ensure_citations()
+        results = []
+        for idx in self.citations.resolve(text)[:limit]:
+            meta = self.metadata[idx] if idx < len(self.metadata) else None
+            if meta is not None:
+                results.append({"index": idx, "distance": 0.0, "metadata": meta})
+        return results
+
+    def get_provision(self, act: str, section: str) -> Optional[str]:
+        """Return the full text of one indexed provision.
+        
+        Args:
+            act (str): Act name in any form ("Kerala Public Health Act").
+            section (str): Section label ("3", "4A").
+        
+        Returns:
+            Optional[str]: The section's chunk texts joined in order, or None if not indexed.
+        """
+        self._ensure_citations()
+        texts = [self.metadata[idx]["text"] for idx in self.citations.lookup(act, section)
+                 if idx < len(self.metadata) and self.metadata[idx] is not None]
+        return "\n".join(texts) if texts else None
+
+    def provision_count(self) -> int:
+        """Return how many (act, section) provisions the citation index holds.
+        
+        Zero for stores built with recursive chunking, whose chunks carry no
+        section numbers.
+        """
+        self._ensure_citations()
+        return len(self.citations)
+
+    def _ensure_citations(self):
+        """Build the citation index from stored chunk metadata if the store predates it."""
+        if self.citations is None:
+            self.citations = CitationIndex()
+            self.citations.add(
+                [idx for idx, meta in enumerate(self.metadata) if meta is not None],
+                [meta for meta in self.metadata if meta is not None],
+            )
+
+    def filter_values(self, field: str) -> Dict[str, int]:
+        """Return each indexed value of a filter field with its chunk count.
+        
+        Args:
+            field (str): "jurisdiction", "act" or "source".
+        
+        Returns:
+            Dict[str, int]: Normalized value -> number of chunks; empty for stores
+            whose chunks predate the field.
+        """
+        self._ensure_filters()
+        return self.filters.values(field)
+
+    def close(self):
+        """Release background resources; a single store holds none (see ShardedVectorStore.close)."""
+
+    def _ensure_filters(self):
+        """Build the filter index from stored chunk metadata if the store predates it."""
+        if self.filters is None:
+            self.filters = MetadataFilterIndex()
+            self.filters.add(
+                [idx for idx, meta in enumerate(self.metadata) if meta is not None],
+                [meta for meta in self.metadata if meta is not None],
+            )
+
+    def _ensure_bm25(self):
+        """Build the BM25 index from stored chunk texts if the store predates it."""
+        if self.bm25 is None:
+            print("[INFO] Building BM25 index from stored metadata...")
+            self.bm25 = BM25Index()
+            self.bm25.add(
+                [idx for idx, meta in enumerate(self.metadata) if meta is not None],
+                [meta.get("text", "") for meta in self.metadata if meta is not None],
+            )
+
+    def _hybrid_search(self, query_text: str, query_emb: np.ndarray, top_k: int,
+                       filters: Optional[Dict[str, Any]] = None) -> List[dict]:
+        """Fuse dense and BM25 candidate rankings with reciprocal rank fusion.
+        
+        Args:
+            query_text (str): Query text for BM25.
+            query_emb (np.ndarray): Query embedding of shape (1, dimension).
+            top_k (int): Number of fused results to return.
+            filters (dict, optional): Metadata filters applied to both rankings.
+        
+        Returns:
+            List[dict]: Results ordered by fused score (see query()).
+        """
+        self._ensure_bm25()
+        depth = max(top_k * 4, HYBRID_MIN_CANDIDATES)
+        dense = self.search(query_emb, top_k=depth, filters=filters)
+        lexical = self.bm25.search(query_text, top_k=depth)
+        if filters:
+            allowed = set(self.filters.select(filters).tolist())
+            lexical = [(doc_id, score) for doc_id, score in lexical if doc_id in allowed]
+        fused = reciprocal_rank_fusion([[r["index"] for r in dense], [doc_id for doc_id, _ in lexical]])
+
+        dense_by_id = {int(r["index"]): r for r in dense}
+        results = []
+        for doc_id, score in fused[:top_k]:
+            hit = dense_by_id.get(doc_id) or {"index": doc_id, "distance": None, "metadata": self.metadata[doc_id]}
+            results.append({**hit, "score": score})
+        return results
+
+    def query_batch(self, query_texts: List[str], top_k: int = 5,
+                    filters: Optional[Dict[str, Any]] = None) -> List[List[dict]]:
+        """Query the vector store with several texts at once.
+        
+        All uncached queries are encoded in a single SentenceTransformer forward
+        pass and searched with a single index.search over the resulting matrix,
+        which amortizes per-call model and FAISS overhead across the batch.
+        
+        Args:
+            query_texts (List[str]): Natural language queries.
+            top_k (int): Number of most relevant chunks per query. Defaults to 5.
+            filters (dict, optional): Metadata filters shared by every query (see search_batch()).
+        
+        Returns:
+            List[List[dict]]: Ranked results for each query, in input order.
+        
+        Example:
+            >>> batches = store.query_batch(["Section 35 refund", "RTI appeal deadline"], top_k=3)
+            >>> print(batches[1][0]['metadata']['text'])
+        """
+        if not query_texts:
+            return []
+        print(f"[INFO] Querying vector store for {len(query_texts)} queries")
+        query_embs = self.query_cache.encode(self.model, self._query_cache_key, list(query_texts))
+        return self.search_batch(query_embs, top_k=top_k, filters=filters)
+
+    async def aquery(self, query_text: str, top_k: int = 5, mode: Optional[str] = None,
+                     filters: Optional[Dict[str, Any]] = None):
+        """Async variant of query() for use from the event loop.
+        
+        Embedding and FAISS search run on the shared I/O thread pool so a slow
+        encode does not block other coroutines.
+        
+        Args:
+            query_text (str): Natural language query.
+            top_k (int): Number of most relevant chunks to return. Defaults to 5.
+            mode (str, optional): "dense" or "hybrid" (see query()). Defaults to retrieval_mode.
+            filters (dict, optional): Metadata filters (see search_batch()).
+        
+        Returns:
+            List[dict]: Ranked results with document chunks and similarity scores.
+        """
+        return await run_io(self.query, query_text, top_k, mode, filters)
+
+    async def aquery_batch(self, query_texts: List[str], top_k: int = 5,
+                           filters: Optional[Dict[str, Any]] = None) -> List[List[dict]]:
+        """Async variant of query_batch() running on the shared I/O thread pool.
+        
+        Args:
+            query_texts (List[str]): Natural language queries.
+            top_k (int): Number of most relevant chunks per query. Defaults to 5.
+            filters (dict, optional): Metadata filters shared by every query.
+        
+        Returns:
+            List[List[dict]]: Ranked results for each query, in input order.
+        """
+        return await run_io(self.query_batch, query_texts, top_k, filters)
 
 # Example usage
 if __name__ == "__main__":
-    from src.data_loader import load_all_documents
-    docs = load_all_documents("docustore/pdf")
+    from src.data_loader import iter_documents
     store = FaissVectorStore("data/faiss_store")
-    store.build_from_documents(docs)
+    store.build_from_documents(iter_documents("docustore/pdf"))
     store.load()
-    print(store.query("What is attention mechanism?", top_k=3))
\ No newline at end of file
+    print(store.query("What is attention mechanism?", top_k=3))
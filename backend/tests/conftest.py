@@ -6,3 +6,14 @@ from pathlib import Path
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_query_embedding_cache():
+    """Keep cached query embeddings from leaking between tests."""
+    from src.embedding import query_embedding_cache
+    query_embedding_cache.clear()
+    yield
+    query_embedding_cache.clear()
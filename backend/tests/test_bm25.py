@@ -0,0 +1,47 @@
+"""Tests for bm25 module."""
+
+from src.bm25 import BM25Index, reciprocal_rank_fusion, tokenize
+
+
+def test_tokenize_keeps_numbers():
+    """Test section and year numbers survive tokenization."""
+    assert tokenize("Section 35 of the Consumer Protection Act, 2019") == [
+        "section", "35", "consumer", "protection", "act", "2019"
+    ]
+
+
+def test_search_prefers_exact_tokens():
+    """Test BM25 ranks the chunk containing the exact section first."""
+    index = BM25Index()
+    index.add([0, 1, 2], [
+        "Section 34 deals with jurisdiction of the District Commission",
+        "Section 35 lays down the manner in which a complaint shall be made",
+        "Refund of deposit by a landlord",
+    ])
+
+    results = index.search("section 35 complaint", top_k=2)
+
+    assert results[0][0] == 1
+    assert len(results) == 2
+
+
+def test_remove_and_persist(tmp_path):
+    """Test removed chunks stop matching and the index round-trips through disk."""
+    index = BM25Index()
+    index.add([0, 1], ["Right to Information Act", "Rent Control Act"])
+    index.remove([0], ["Right to Information Act"])
+    index.save(str(tmp_path))
+
+    loaded = BM25Index.load(str(tmp_path))
+
+    assert len(loaded) == 1
+    assert loaded.search("information") == []
+    assert loaded.search("rent")[0][0] == 1
+
+
+def test_reciprocal_rank_fusion():
+    """Test items ranked well by both lists win."""
+    fused = reciprocal_rank_fusion([[1, 2, 3], [3, 1, 4]])
+
+    assert [doc_id for doc_id, _ in fused][:2] == [1, 3]
+    assert {doc_id for doc_id, _ in fused} == {1, 2, 3, 4}
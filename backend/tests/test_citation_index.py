@@ -0,0 +1,74 @@
+"""Tests for citation_index module."""
+
+from src.citation_index import CitationIndex, normalize_act_key, parse_citations
+
+ACT = "The Kerala Right to Public Service Act, 2025"
+
+
+def test_normalize_act_key():
+    """Test Act names normalize without article, punctuation or year."""
+    assert normalize_act_key(ACT) == "kerala right to public service act"
+    assert normalize_act_key("KERALA RIGHT TO PUBLIC SERVICE ACT") == "kerala right to public service act"
+
+
+def test_parse_citations():
+    """Test section-first and act-first citation forms are extracted in order."""
+    text = ("Under Section 3 of the Kerala Right to Public Service Act, 2025 and "
+            "the Kerala Public Health Act, 2023, s. 12A(1), the officer must act. See section 3 of this Act.")
+    assert parse_citations(text) == [
+        ("kerala right to public service act", "3"),
+        ("kerala public health act", "12A"),
+    ]
+
+
+def test_parse_citations_expands_section_lists():
+    """Test "3 and 4", "3, 4 and 5" and "3 to 5" cite every listed section."""
+    assert parse_citations("Sections 3 and 4 of the Kerala Right to Public Service Act") == [
+        ("kerala right to public service act", "3"),
+        ("kerala right to public service act", "4"),
+    ]
+    expected = [("kerala public health act", s) for s in ("3", "4", "5")]
+    assert parse_citations("Sections 3, 4 and 5 of the Kerala Public Health Act, 2023") == expected
+    assert parse_citations("the Kerala Public Health Act, 2023, Sections 3 to 5") == expected
+
+
+def test_parse_citations_short_names_and_generic_acts():
+    """Test short Act names resolve through ACT_ALIASES and a bare "the Act" is skipped."""
+    assert parse_citations("BNS Section 420") == [("bharatiya nyaya sanhita", "420")]
+    assert parse_citations("Section 420 IPC and s. 154 of the Cr.P.C.") == [
+        ("indian penal code", "420"),
+        ("code of criminal procedure", "154"),
+    ]
+    assert parse_citations("Section 6 of the RTI Act") == [("right to information act", "6")]
+    assert parse_citations("Section 3 of the Act") == []
+    assert parse_citations("See section 3 of this Act.") == []
+
+
+def test_index_resolves_cited_provisions():
+    """Test citations resolve to the chunk IDs of every part of the section."""
+    index = CitationIndex()
+    index.add([0, 1, 2, 3], [
+        {"act": ACT, "section": "3", "text": "part 1"},
+        {"act": ACT, "section": "3", "text": "part 2"},
+        {"act": ACT, "section": "4", "text": "other"},
+        {"text": "preamble"},
+    ])
+
+    assert index.resolve("Is Section 3 of the Kerala Right to Public Service Act violated?") == [0, 1]
+    assert index.lookup("Right to Public Service Act", "4") == [2]
+    assert index.lookup(ACT, "9") == []
+    assert index.resolve("no citation here") == []
+
+
+def test_index_remove_and_persistence(tmp_path):
+    """Test removal drops IDs and the index round-trips through citations.json."""
+    index = CitationIndex()
+    metas = [{"act": ACT, "section": "3"}, {"act": ACT, "section": "4"}]
+    index.add([0, 1], metas)
+    index.remove([0], metas[:1])
+    index.save(str(tmp_path))
+
+    loaded = CitationIndex.load(str(tmp_path))
+    assert CitationIndex.exists(str(tmp_path))
+    assert loaded.lookup(ACT, "3") == []
+    assert loaded.lookup(ACT, "4") == [1]
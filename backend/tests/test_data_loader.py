@@ -3,7 +3,7 @@
 import pytest
 import tempfile
 from pathlib import Path
-from src.data_loader import load_all_documents
+from src.data_loader import load_all_documents, iter_documents
 
 
 def test_load_all_documents_empty_dir():
@@ -38,3 +38,47 @@ def test_load_all_documents_multiple_files():
         
         docs = load_all_documents(tmpdir)
         assert len(docs) == 2
+
+
+def test_load_all_documents_uppercase_extension():
+    """Test extensions are matched case-insensitively."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "ACT.TXT").write_text("Upper case extension")
+        
+        docs = load_all_documents(tmpdir, workers=1)
+        assert len(docs) == 1
+
+
+def test_load_all_documents_parallel_keeps_file_order():
+    """Test process-pool loading returns documents in file order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(4):
+            (Path(tmpdir) / f"doc{i}.txt").write_text(f"Document {i}")
+        
+        docs = load_all_documents(tmpdir, workers=2)
+        assert [d.page_content for d in docs] == [f"Document {i}" for i in range(4)]
+
+
+def test_iter_documents_yields_every_file():
+    """Test generator mode yields the documents of every file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "doc1.txt").write_text("Document 1")
+        (Path(tmpdir) / "doc2.txt").write_text("Document 2")
+        (Path(tmpdir) / "notes.md").write_text("ignored")
+        
+        docs = list(iter_documents(tmpdir, workers=2))
+        assert sorted(d.page_content for d in docs) == ["Document 1", "Document 2"]
+
+
+def test_load_all_documents_uses_shared_process_pool():
+    """Test default parallel loading parses files on the executor layer's process pool."""
+    from src.executors import cpu_pool
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "doc1.txt").write_text("Document 1")
+        (Path(tmpdir) / "doc2.txt").write_text("Document 2")
+        completed = cpu_pool.stats()["completed"]
+        
+        docs = load_all_documents(tmpdir)
+        assert [d.page_content for d in docs] == ["Document 1", "Document 2"]
+        assert cpu_pool.stats()["completed"] == completed + 2
+    cpu_pool.shutdown()
@@ -2,8 +2,8 @@
 
 import pytest
 import numpy as np
-from unittest.mock import Mock
-from src.embedding import EmbeddingPipeline
+from unittest.mock import Mock, patch
+from src.embedding import EmbeddingPipeline, QueryEmbeddingCache, backend_kwargs
 
 
 @pytest.fixture
@@ -49,3 +49,97 @@ def test_embed_chunks():
     assert isinstance(embeddings, np.ndarray)
     assert embeddings.shape[0] == 1
     assert embeddings.shape[1] > 0
+
+
+def test_multiprocess_embed_chunks_keeps_order():
+    """Test sharded encoding across worker processes reassembles chunk order."""
+    def encode(texts, **kwargs):
+        return np.array([[float(text.split()[1])] * 4 for text in texts], dtype='float32')
+
+    chunks = [Mock(page_content=f"chunk {i}") for i in range(50)]
+    with patch("src.embedding.SentenceTransformer") as mock_cls:
+        mock_cls.return_value.encode.side_effect = encode
+        # fork so workers inherit the patched model class
+        pipeline = EmbeddingPipeline(workers=3, threads_per_worker=1, start_method="fork")
+        try:
+            embeddings = pipeline.embed_chunks(chunks)
+        finally:
+            pipeline.close()
+
+    assert embeddings[:, 0].tolist() == list(range(50))
+    report = pipeline.get_encode_report()
+    assert report["chunks"] == 50
+    assert report["cores"] == 3
+    assert report["chunks_per_sec_per_core"] > 0
+
+
+def test_query_embedding_cache_lru_and_stats():
+    """Test the query cache normalizes keys, evicts LRU entries and counts hits."""
+    cache = QueryEmbeddingCache(max_entries=2)
+    cache.put("model", "Section 35  refund", np.ones(4))
+    cache.put("model", "RTI appeal", np.zeros(4))
+
+    assert cache.get("model", " Section 35 refund ") is not None
+    assert cache.get("other-model", "Section 35 refund") is None
+
+    cache.put("model", "Rent deposit", np.ones(4))
+    assert cache.get("model", "RTI appeal") is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_query_embedding_cache_encodes_only_misses():
+    """Test repeated texts skip the model and misses share one forward pass."""
+    cache = QueryEmbeddingCache()
+    model = Mock()
+    model.encode.side_effect = lambda texts, **kwargs: np.arange(len(texts) * 3, dtype='float32').reshape(len(texts), 3)
+
+    first = cache.encode(model, "model", ["a", "b"])
+    second = cache.encode(model, "model", ["b", "c", "a"])
+
+    assert model.encode.call_count == 2
+    assert model.encode.call_args[0][0] == ["c"]
+    np.testing.assert_array_equal(second[0], first[1])
+    np.testing.assert_array_equal(second[2], first[0])
+
+
+def test_backend_kwargs():
+    """Test each inference backend maps to SentenceTransformer arguments."""
+    assert backend_kwargs("torch") == {}
+    assert backend_kwargs("onnx") == {"backend": "onnx"}
+    assert backend_kwargs("onnx-int8")["model_kwargs"]["file_name"].endswith(".onnx")
+    with pytest.raises(ValueError, match="embedding backend"):
+        backend_kwargs("tensorrt")
+
+
+@patch("src.embedding.SentenceTransformer")
+def test_pipeline_loads_selected_backend(mock_cls):
+    """Test the pipeline passes the backend through to the model loader."""
+    pipeline = EmbeddingPipeline(backend="onnx-int8")
+
+    assert pipeline.backend == "onnx-int8"
+    assert mock_cls.call_args.kwargs["backend"] == "onnx"
+    assert "file_name" in mock_cls.call_args.kwargs["model_kwargs"]
+
+
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_onnx_backend_parity_with_torch(backend):
+    """Test ONNX embeddings point the same way as the PyTorch ones."""
+    pytest.importorskip("optimum.onnxruntime")
+    from benchmarks.embedding_backends import cosine_agreement
+    from sentence_transformers import SentenceTransformer
+
+    texts = [
+        "Refund for a defective mobile phone under consumer protection",
+        "Section 3 of the Kerala Right to Public Service Act",
+        "Penalty on officer for not providing notified service within the stipulated time",
+    ]
+    try:
+        reference = SentenceTransformer("all-MiniLM-L6-v2").encode(texts)
+        candidate = SentenceTransformer("all-MiniLM-L6-v2", **backend_kwargs(backend)).encode(texts)
+    except OSError as e:
+        pytest.skip(f"model files unavailable: {e}")
+
+    agreement = cosine_agreement(np.asarray(reference), np.asarray(candidate))
+    # fp32 ONNX is numerically the same graph; int8 weights cost a little precision
+    assert agreement.min() > (0.9999 if backend == "onnx" else 0.98)
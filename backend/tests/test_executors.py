@@ -0,0 +1,75 @@
+"""Tests for executors module."""
+
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.executors import ExecutorPool, cpu_pool, get_executor_stats, run_cpu, run_io
+
+
+@pytest.fixture
+def small_pool():
+    """Create a two-thread pool for isolated statistics."""
+    pool = ExecutorPool("test", lambda n: ThreadPoolExecutor(max_workers=n), 2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_io_returns_result_off_loop():
+    """Test blocking calls run on a worker thread."""
+    loop_thread = threading.get_ident()
+    worker_thread = await run_io(threading.get_ident)
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_run_io_propagates_exceptions():
+    """Test exceptions raised in the pool reach the caller."""
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await run_io(fail)
+
+
+@pytest.mark.asyncio
+async def test_run_cpu_executes_in_process_pool():
+    """Test picklable work runs on the process pool."""
+    result = await run_cpu(pow, 2, 10)
+    assert result == 1024
+    assert cpu_pool.stats()["completed"] >= 1
+    cpu_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive(small_pool):
+    """Test a slow blocking call does not stall other coroutines."""
+    slow = asyncio.ensure_future(small_pool.run(time.sleep, 0.3))
+    started = time.perf_counter()
+    await asyncio.sleep(0.01)
+    assert time.perf_counter() - started < 0.2
+    await slow
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_and_wait_time(small_pool):
+    """Test saturation is reported as queue depth and wait time."""
+    futures = [small_pool.submit(time.sleep, 0.1) for _ in range(4)]
+    stats = small_pool.stats()
+    assert stats["in_flight"] == 4
+    assert stats["queue_depth"] == 2
+
+    await asyncio.gather(*[asyncio.wrap_future(f) for f in futures])
+    stats = small_pool.stats()
+    assert stats["completed"] == 4
+    assert stats["queue_depth"] == 0
+    assert stats["max_wait_ms"] >= 50
+
+
+def test_get_executor_stats_lists_pools():
+    """Test statistics are reported for both pools."""
+    stats = get_executor_stats()
+    assert set(stats) == {"io", "cpu"}
+    assert "avg_wait_ms" in stats["io"]
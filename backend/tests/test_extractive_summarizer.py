@@ -0,0 +1,74 @@
+"""Tests for extractive_summarizer module."""
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from src.extractive_summarizer import ExtractiveSummarizer, mmr_select, split_sentences
+
+
+class _BagOfWordsModel:
+    """Deterministic stand-in for a sentence-transformer: word-count vectors."""
+
+    VOCAB = ["refund", "goods", "defective", "penalty", "appeal", "officer", "days", "fee"]
+
+    def encode(self, texts, batch_size=32):
+        return np.array([[text.lower().count(word) for word in self.VOCAB] for text in texts], dtype="float32")
+
+
+def test_split_sentences_keeps_abbreviations_and_clauses():
+    """Test "Sec." and "No." do not end sentences and short fragments are merged."""
+    text = ("(1) A refund under Sec. 3 shall be paid\nwithin thirty days of the claim. "
+            "(2) See No. 4. (3) An appeal lies to the officer named in the notification.")
+
+    assert split_sentences(text) == [
+        "(1) A refund under Sec. 3 shall be paid within thirty days of the claim.",
+        "(2) See No. 4. (3) An appeal lies to the officer named in the notification.",
+    ]
+
+
+def test_mmr_select_skips_near_duplicates():
+    """Test a diverse second pick is preferred over a copy of the first."""
+    vectors = np.array([[1.0, 0.0], [1.0, 0.0], [0.6, 0.8]], dtype="float32")
+    query = np.array([1.0, 0.0], dtype="float32")
+
+    assert mmr_select(query, vectors, k=2, diversity=0.0) == [0, 1]
+    assert mmr_select(query, vectors, k=2, diversity=0.7) == [0, 2]
+
+
+def test_summarize_keeps_relevant_sentences_under_citations():
+    """Test summaries quote the relevant sentences in document order under each citation."""
+    results = [
+        {"metadata": {"text": "The fee for an appeal is one hundred rupees in every case. "
+                              "Defective goods shall be replaced or a refund of the price paid shall be made.",
+                      "act": "The Kerala Sample Act, 2024", "section": "5"}},
+        {"metadata": {"text": "A refund for defective goods is due within thirty days of the complaint.",
+                      "source": "notes.txt"}},
+    ]
+    summarizer = ExtractiveSummarizer(_BagOfWordsModel(), max_sentences=2, diversity=0.2)
+
+    summary = summarizer.summarize("refund for defective goods", results)
+
+    assert summary == (
+        "[The Kerala Sample Act, 2024, Section 5]\n"
+        "Defective goods shall be replaced or a refund of the price paid shall be made.\n\n"
+        "[notes.txt]\nA refund for defective goods is due within thirty days of the complaint."
+    )
+
+
+def test_summarize_uses_precomputed_query_embedding():
+    """Test a cached query vector skips encoding the query again."""
+    model = Mock(wraps=_BagOfWordsModel())
+    summarizer = ExtractiveSummarizer(model)
+    query_embedding = model.encode(["refund"])[0]
+    model.encode.reset_mock()
+
+    summarizer.summarize("refund", [{"metadata": {"text": "A refund is paid within thirty days of the claim."}}],
+                         query_embedding=query_embedding)
+
+    assert model.encode.call_count == 1
+
+
+def test_invalid_diversity():
+    """Test diversity outside [0, 1] is rejected."""
+    with pytest.raises(ValueError, match="diversity"):
+        ExtractiveSummarizer(Mock(), diversity=1.5)
@@ -0,0 +1,42 @@
+"""Tests for metadata_filter module."""
+
+import pytest
+from src.metadata_filter import MetadataFilterIndex
+
+
+def _metadatas():
+    return [
+        {"act": "The Kerala Public Health Act, 2023", "jurisdiction": "Kerala", "source": "pdf/KPH.pdf"},
+        {"act": "The Tamil Nadu Prohibition Of Harassment Of Women Act, 1998", "source": "pdf/TN.pdf"},
+        {"act": "The Consumer Protection Act, 2019", "source": "pdf/CPA.pdf"},
+        None,
+        {"source": "notes/kerala_notes.txt"},
+    ]
+
+
+def test_select_ands_fields_and_ors_values():
+    """Test filters match case-insensitively, OR within a field and AND across fields."""
+    filters = MetadataFilterIndex()
+    filters.add(range(5), _metadatas())
+
+    assert filters.select({"jurisdiction": "kerala"}).tolist() == [0, 4]
+    assert filters.select({"jurisdiction": ["Kerala", "India"]}).tolist() == [0, 2, 4]
+    assert filters.select({"jurisdiction": "Tamil Nadu"}).tolist() == [1]
+    assert filters.select({"jurisdiction": "Kerala", "act": "Kerala Public Health Act"}).tolist() == [0]
+    assert filters.select({"jurisdiction": "Goa"}).tolist() == []
+    with pytest.raises(ValueError, match="filter field"):
+        filters.select({"chapter": "I"})
+
+
+def test_remove_and_persist(tmp_path):
+    """Test removed IDs leave the postings and the index round-trips through JSON."""
+    filters = MetadataFilterIndex()
+    metadatas = _metadatas()
+    filters.add(range(5), metadatas)
+    filters.remove([0], [metadatas[0]])
+    filters.save(str(tmp_path))
+
+    reloaded = MetadataFilterIndex.load(str(tmp_path))
+
+    assert reloaded.select({"jurisdiction": "Kerala"}).tolist() == [4]
+    assert reloaded.values("jurisdiction") == {"kerala": 1, "tamil nadu": 1, "india": 1}
@@ -0,0 +1,80 @@
+"""Tests for provision_summaries module."""
+
+from unittest.mock import Mock, patch
+from src.provision_summaries import ProvisionSummaries, chunk_hash
+
+
+def _metadatas(*texts):
+    return [{"text": text, "act": "The Kerala Sample Act, 2024", "section": str(i + 1)} for i, text in enumerate(texts)]
+
+
+def test_build_generates_each_chunk_once(tmp_path):
+    """Test summaries are generated per chunk, saved, and reused on the next build."""
+    summarize = Mock(side_effect=lambda meta: f"summary of {meta['text']}")
+    summaries = ProvisionSummaries()
+
+    stats = summaries.build(_metadatas("alpha", "beta", "alpha"), "test", summarize, persist_dir=str(tmp_path))
+    reloaded = ProvisionSummaries.load(str(tmp_path))
+    again = reloaded.build(_metadatas("alpha", "beta"), "test", summarize)
+
+    assert stats == {"generated": 2, "reused": 0, "pruned": 0, "failed": 0}
+    assert reloaded.get("beta") == "summary of beta"
+    assert again == {"generated": 0, "reused": 2, "pruned": 0, "failed": 0}
+    assert summarize.call_count == 2
+
+
+def test_changed_chunks_are_regenerated_and_stale_ones_pruned():
+    """Test only chunks whose text hash changed get new summaries."""
+    summaries = ProvisionSummaries()
+    summaries.build(_metadatas("alpha", "beta"), "test", lambda meta: meta["text"].upper())
+
+    summarize = Mock(side_effect=lambda meta: meta["text"].upper())
+    stats = summaries.build(_metadatas("alpha", "beta amended"), "test", summarize)
+
+    assert stats == {"generated": 1, "reused": 1, "pruned": 1, "failed": 0}
+    assert summarize.call_args.args[0]["text"] == "beta amended"
+    assert summaries.get("beta") is None
+    assert set(summaries.entries) == {chunk_hash("alpha"), chunk_hash("beta amended")}
+
+
+def test_generator_change_and_failures():
+    """Test a new generator regenerates summaries and failed chunks stay missing."""
+    summaries = ProvisionSummaries()
+    summaries.build(_metadatas("alpha", "beta"), "v1", lambda meta: "old")
+
+    def flaky(meta):
+        if meta["text"] == "beta":
+            raise RuntimeError("rate limited")
+        return "new"
+
+    stats = summaries.build(_metadatas("alpha", "beta", None), "v2", flaky)
+
+    assert stats["generated"] == 1 and stats["failed"] == 1
+    assert summaries.get("alpha") == "new"
+    assert summaries.status(_metadatas("alpha", "beta"), generator="v2") == {
+        "chunks": 2, "current": 1, "missing": 1, "orphaned": 0}
+
+
+@patch("src.search.ChatGroq")
+@patch("src.search.FaissVectorStore")
+def test_rag_search_serves_precomputed_summaries(mock_vectorstore, mock_llm, tmp_path, monkeypatch):
+    """Test precomputed mode assembles context from stored summaries without an LLM."""
+    from src.search import RAGSearch
+
+    summaries = ProvisionSummaries()
+    summaries.build(_metadatas("Long text of section one."), "test", lambda meta: "Section one in brief.")
+    summaries.save(str(tmp_path))
+    monkeypatch.setenv("RAG_SUMMARY_MODE", "precomputed")
+    mock_vectorstore.return_value.lookup_citations.return_value = []
+    mock_vectorstore.return_value.provision_count.return_value = 0
+    mock_vectorstore.return_value.filter_values.return_value = {}
+    mock_vectorstore.return_value.query.return_value = [
+        {"metadata": _metadatas("Long text of section one.")[0]},
+        {"metadata": {"text": "Unsummarized note."}},
+    ]
+
+    rag = RAGSearch(persist_dir=str(tmp_path))
+
+    assert rag.search_and_summarize("section one", top_k=2) == (
+        "[The Kerala Sample Act, 2024, Section 1]\nSection one in brief.\n\nUnsummarized note.")
+    mock_llm.assert_not_called()
@@ -0,0 +1,64 @@
+"""Tests for reranker module."""
+
+import time
+from unittest.mock import Mock, patch
+from src.reranker import CrossEncoderReranker
+
+
+def _results(n):
+    return [{"index": i, "distance": float(i), "metadata": {"text": f"chunk {i}"}} for i in range(n)]
+
+
+@patch("sentence_transformers.CrossEncoder")
+def test_rerank_orders_by_cross_encoder_score(mock_cross_encoder):
+    """Test candidates are re-sorted by score and trimmed to keep."""
+    # Score rises with the chunk number, reversing the dense order
+    mock_cross_encoder.return_value.predict.side_effect = lambda pairs: [int(text.split()[1]) for _, text in pairs]
+    reranker = CrossEncoderReranker(batch_size=4)
+
+    ranked = reranker.rerank("query", _results(10), keep=3)
+
+    assert [r["index"] for r in ranked] == [9, 8, 7]
+    assert mock_cross_encoder.return_value.predict.call_count == 3
+    assert reranker.get_stats()["fallbacks"] == 0
+
+
+@patch("sentence_transformers.CrossEncoder")
+def test_rerank_falls_back_when_over_budget(mock_cross_encoder):
+    """Test dense order is kept when scoring exceeds the budget."""
+    def slow_predict(pairs):
+        time.sleep(0.02)
+        return [0.0] * len(pairs)
+
+    mock_cross_encoder.return_value.predict.side_effect = slow_predict
+    reranker = CrossEncoderReranker(batch_size=2, budget_ms=10)
+
+    ranked = reranker.rerank("query", _results(10), keep=3)
+
+    assert [r["index"] for r in ranked] == [0, 1, 2]
+    assert mock_cross_encoder.return_value.predict.call_count == 1
+    assert reranker.get_stats()["fallbacks"] == 1
+
+
+@patch("src.search.ChatGroq")
+@patch("src.search.FaissVectorStore")
+def test_rag_search_reranks_candidate_pool(mock_vectorstore, mock_llm, tmp_path, monkeypatch):
+    """Test RAGSearch pulls a larger pool and summarizes only the reranked chunks."""
+    from src.search import RAGSearch
+
+    monkeypatch.setenv("RAG_RERANK", "true")
+    monkeypatch.setenv("RAG_RERANK_CANDIDATES", "10")
+    mock_vectorstore.return_value.lookup_citations.return_value = []
+    mock_vectorstore.return_value.provision_count.return_value = 0
+    mock_vectorstore.return_value.filter_values.return_value = {}
+    mock_vectorstore.return_value.query.return_value = _results(10)
+    mock_llm.return_value.invoke.return_value = Mock(content="summary")
+
+    rag = RAGSearch(persist_dir=str(tmp_path))
+    rag.reranker = Mock()
+    rag.reranker.rerank.return_value = _results(2)
+
+    assert rag.search_and_summarize("fraud", top_k=2) == "summary"
+    mock_vectorstore.return_value.query.assert_called_once_with("fraud", top_k=10, filters=None)
+    prompt = mock_llm.return_value.invoke.call_args[0][0][0]
+    assert "chunk 1" in prompt and "chunk 5" not in prompt
@@ -13,11 +13,19 @@ def temp_store_dir():
         yield tmpdir
 
 
+def _statute_store():
+    """Mock store built with statute chunking (section and jurisdiction metadata)."""
+    store = Mock()
+    store.provision_count.return_value = 5
+    store.filter_values.return_value = {"kerala": 3, "india": 2}
+    return store
+
+
 @patch('src.search.ChatGroq')
 @patch('src.search.FaissVectorStore')
 def test_rag_search_initialization(mock_vectorstore, mock_llm, temp_store_dir):
     """Test RAGSearch initializes correctly."""
-    mock_store_instance = Mock()
+    mock_store_instance = _statute_store()
     mock_vectorstore.return_value = mock_store_instance
     
     rag = RAGSearch(persist_dir=temp_store_dir)
@@ -30,7 +38,8 @@ def test_rag_search_initialization(mock_vectorstore, mock_llm, temp_store_dir):
 @patch('src.search.FaissVectorStore')
 def test_search_and_summarize_with_results(mock_vectorstore, mock_llm, temp_store_dir):
     """Test search and summarize with valid results."""
-    mock_store_instance = Mock()
+    mock_store_instance = _statute_store()
+    mock_store_instance.lookup_citations.return_value = []
     mock_store_instance.query.return_value = [
         {"metadata": {"text": "IPC Section 420 deals with fraud"}},
         {"metadata": {"text": "Punishment includes imprisonment"}}
@@ -47,14 +56,15 @@ def test_search_and_summarize_with_results(mock_vectorstore, mock_llm, temp_stor
     result = rag.search_and_summarize("fraud laws", top_k=2)
     
     assert result == "Summary of fraud laws"
-    mock_store_instance.query.assert_called_once_with("fraud laws", top_k=2)
+    mock_store_instance.query.assert_called_once_with("fraud laws", top_k=2, filters=None)
 
 
 @patch('src.search.ChatGroq')
 @patch('src.search.FaissVectorStore')
 def test_search_and_summarize_no_results(mock_vectorstore, mock_llm, temp_store_dir):
     """Test search and summarize with no results."""
-    mock_store_instance = Mock()
+    mock_store_instance = _statute_store()
+    mock_store_instance.lookup_citations.return_value = []
     mock_store_instance.query.return_value = []
     mock_vectorstore.return_value = mock_store_instance
     
@@ -62,3 +72,94 @@ def test_search_and_summarize_no_results(mock_vectorstore, mock_llm, temp_store_
     result = rag.search_and_summarize("nonexistent query")
     
     assert result == "No relevant documents found."
+
+
+@patch('src.search.ChatGroq')
+@patch('src.search.FaissVectorStore')
+def test_search_and_summarize_resolves_citations(mock_vectorstore, mock_llm, temp_store_dir):
+    """Test explicitly cited provisions skip the vector search."""
+    mock_store_instance = _statute_store()
+    mock_store_instance.lookup_citations.return_value = [
+        {"index": 4, "distance": 0.0, "metadata": {"text": "3. Right to obtain public services.—",
+                                                   "act": "The Kerala Right to Public Service Act, 2025", "section": "3"}}
+    ]
+    mock_vectorstore.return_value = mock_store_instance
+    mock_llm.return_value.invoke.return_value = Mock(content="Section 3 summary")
+    
+    rag = RAGSearch(persist_dir=temp_store_dir)
+    result = rag.search_and_summarize("Section 3 of the Kerala Right to Public Service Act", top_k=2)
+    
+    assert result == "Section 3 summary"
+    mock_store_instance.query.assert_not_called()
+    prompt = mock_llm.return_value.invoke.call_args[0][0][0]
+    assert "[The Kerala Right to Public Service Act, 2025, Section 3]" in prompt
+
+
+@patch('src.search.ChatGroq')
+@patch('src.search.FaissVectorStore')
+def test_extractive_mode_skips_groq(mock_vectorstore, mock_llm, temp_store_dir, monkeypatch):
+    """Test extractive summary mode answers locally without creating or calling the LLM."""
+    monkeypatch.setenv("RAG_SUMMARY_MODE", "extractive")
+    mock_store_instance = _statute_store()
+    mock_store_instance.lookup_citations.return_value = []
+    mock_store_instance.query.return_value = [
+        {"metadata": {"text": "IPC Section 420 deals with cheating and dishonestly inducing delivery of property."}}
+    ]
+    mock_vectorstore.return_value = mock_store_instance
+
+    rag = RAGSearch(persist_dir=temp_store_dir)
+    rag.summarizer = Mock()
+    rag.summarizer.summarize.return_value = "IPC Section 420 deals with cheating."
+
+    assert rag.search_and_summarize("cheating", top_k=1) == "IPC Section 420 deals with cheating."
+    mock_llm.assert_not_called()
+    assert rag.summarizer.summarize.call_args.args[:2] == ("cheating", mock_store_instance.query.return_value)
+
+
+@patch('src.search.ChatGroq')
+@patch('src.search.FaissVectorStore')
+def test_unknown_summary_mode(mock_vectorstore, mock_llm, temp_store_dir, monkeypatch):
+    """Test an unknown RAG_SUMMARY_MODE is rejected."""
+    monkeypatch.setenv("RAG_SUMMARY_MODE", "bullet")
+
+    with pytest.raises(ValueError, match="RAG_SUMMARY_MODE"):
+        RAGSearch(persist_dir=temp_store_dir)
+
+
+@patch('src.search.ChatGroq')
+@patch('src.search.FaissVectorStore')
+def test_state_named_in_query_filters_jurisdiction(mock_vectorstore, mock_llm, temp_store_dir):
+    """Test a query naming a State searches that State's and central Acts only."""
+    mock_store_instance = _statute_store()
+    mock_store_instance.lookup_citations.return_value = []
+    mock_store_instance.query.return_value = [{"metadata": {"text": "Kerala service delivery"}}]
+    mock_vectorstore.return_value = mock_store_instance
+    mock_llm.return_value.invoke.return_value = Mock(content="summary")
+
+    rag = RAGSearch(persist_dir=temp_store_dir)
+    rag.search_and_summarize("Panchayat in Kerala delayed my certificate", top_k=2)
+
+    mock_store_instance.query.assert_called_once_with(
+        "Panchayat in Kerala delayed my certificate", top_k=2, filters={"jurisdiction": ["Kerala", "India"]})
+
+    # Central Acts without a jurisdiction tag would be filtered out, so search everything
+    mock_store_instance.filter_values.return_value = {"kerala": 3}
+    assert rag.jurisdiction_filters("Panchayat in Kerala delayed my certificate") is None
+
+
+@patch('src.search.ChatGroq')
+@patch('src.search.FaissVectorStore')
+def test_citation_lookup_off_without_section_metadata(mock_vectorstore, mock_llm, temp_store_dir, capsys):
+    """Test a store without section metadata warns and skips citation lookups."""
+    mock_store_instance = _statute_store()
+    mock_store_instance.provision_count.return_value = 0
+    mock_store_instance.query.return_value = [{"metadata": {"text": "Services must be delivered on time."}}]
+    mock_vectorstore.return_value = mock_store_instance
+    mock_llm.return_value.invoke.return_value = Mock(content="summary")
+
+    rag = RAGSearch(persist_dir=temp_store_dir)
+
+    assert "citation lookup and provision texts are off" in capsys.readouterr().out
+    assert rag.search_and_summarize("Section 3 of the Kerala Right to Public Service Act", top_k=1) == "summary"
+    mock_store_instance.lookup_citations.assert_not_called()
+    assert rag.provision_texts("Section 3 of the Kerala Right to Public Service Act") == {}
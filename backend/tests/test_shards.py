@@ -0,0 +1,132 @@
+"""Tests for shards module."""
+
+import json
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.shards import ShardSpec, ShardedVectorStore, distance_scale, merge_results, route
+from src.vectorstore import FaissVectorStore
+
+
+SPECS = [
+    ShardSpec("kerala", "unused", jurisdictions=["Kerala"]),
+    ShardSpec("tamil_nadu", "unused", jurisdictions=["Tamil Nadu"]),
+    ShardSpec("central", "unused", jurisdictions=["India"], always=True),
+    ShardSpec("case_law", "unused", keywords=["judgment", "precedent"]),
+]
+
+
+@pytest.fixture
+def offline_model():
+    """Replace the sentence-transformer so shard tests need no model download."""
+    with patch("src.vectorstore.SentenceTransformer") as mock_cls, \
+         patch("src.shards.SentenceTransformer", mock_cls), \
+         patch("src.embedding.SentenceTransformer", mock_cls):
+        mock_cls.return_value.encode.side_effect = lambda texts, **kwargs: np.zeros((len(texts), 8), dtype="float32")
+        yield mock_cls
+
+
+def _save_shard(directory, offsets, texts):
+    """Save a shard whose vectors lie at the given distances from the zero query vector."""
+    store = FaissVectorStore(persist_dir=str(directory))
+    vectors = np.zeros((len(offsets), 8), dtype="float32")
+    vectors[:, 0] = offsets
+    store.add_embeddings(vectors, [{"text": t, "act": "The Kerala Public Health Act, 2023", "section": str(i + 1)}
+                                   for i, t in enumerate(texts)])
+    store.save()
+
+
+@pytest.fixture
+def shard_config(tmp_path, offline_model):
+    """Config with saved kerala and central shards and an unbuilt tamil_nadu shard."""
+    _save_shard(tmp_path / "kerala", [0.1, 0.3, 0.5], ["kerala a", "kerala b", "kerala c"])
+    _save_shard(tmp_path / "central", [0.2, 0.4], ["central a", "central b"])
+    config = {"root": str(tmp_path), "shards": {
+        "kerala": {"jurisdictions": ["Kerala"]},
+        "central": {"jurisdictions": ["India"], "always": True},
+        "tamil_nadu": {"jurisdictions": ["Tamil Nadu"], "data_dir": str(tmp_path / "missing")},
+    }}
+    path = tmp_path / "shards.json"
+    path.write_text(json.dumps(config))
+    return str(path)
+
+
+def test_route_by_state_keyword_and_fallback():
+    """Test routing picks named States and keywords plus always-on shards, else everything."""
+    assert route("My Panchayat in Kerala refused a certificate", SPECS) == ["kerala", "central"]
+    assert route("Is there a precedent on delayed refunds?", SPECS) == ["central", "case_law"]
+    assert route("Refund for defective goods", SPECS) == ["kerala", "tamil_nadu", "central", "case_law"]
+    assert route("Refund for defective goods", SPECS, allowed=["central", "case_law"]) == ["central", "case_law"]
+    assert route("Tamil Nadu rules", SPECS, allowed=["kerala", "central"]) == ["kerala", "central"]
+
+
+def test_merge_results_orders_by_distance_or_score():
+    """Test merging keeps the nearest results, or the highest fused scores in hybrid mode."""
+    dense = merge_results([[{"distance": 0.5}, {"distance": 0.9}], [{"distance": 0.1}]], top_k=2)
+    assert [r["distance"] for r in dense] == [0.1, 0.5]
+    hybrid = merge_results([[{"score": 0.02}], [{"score": 0.03}, {"score": 0.01}]], top_k=3)
+    assert [r["score"] for r in hybrid] == [0.03, 0.02, 0.01]
+
+
+def test_sharded_query_routes_and_merges(shard_config, offline_model):
+    """Test routed shards share one model and their results merge by distance."""
+    offline_model.reset_mock()
+    store = ShardedVectorStore.from_config(shard_config)
+    store.load_or_build()
+
+    assert offline_model.call_count == 1
+    assert all(shard.model is store.model for shard in store.shards.values())
+    results = store.query("Kerala certificate delay", top_k=4)
+    assert [r["metadata"]["text"] for r in results] == ["kerala a", "central a", "kerala b", "central b"]
+    assert [r["shard"] for r in results] == ["kerala", "central", "kerala", "central"]
+    assert [r["shard"] for r in store.query("Kerala certificate delay", top_k=5, shards=["central"])] == ["central"] * 2
+    # tamil_nadu has no index or documents, so its queries fall back to every loaded shard
+    assert store.route("Tamil Nadu ration card") == ["kerala", "central"]
+    store.close()
+
+
+def test_sharded_lookups_span_shards(shard_config):
+    """Test citation, provision and filter lookups combine every loaded shard."""
+    store = ShardedVectorStore.from_config(shard_config)
+    store.load_or_build()
+
+    cited = store.lookup_citations("Section 2 of the Kerala Public Health Act")
+    assert [(r["shard"], r["metadata"]["text"]) for r in cited] == [("kerala", "kerala b"), ("central", "central b")]
+    assert store.get_provision("Kerala Public Health Act", "1") == "kerala a"
+    assert store.filter_values("jurisdiction") == {"kerala": 5}
+    assert store.provision_count() == 5
+    store.close()
+
+
+def test_allowed_shards_validated(shard_config):
+    """Test a domain naming an unknown shard is rejected."""
+    with pytest.raises(ValueError):
+        ShardedVectorStore.from_config(shard_config, allowed=["kerala", "karnataka"])
+
+
+def test_allowed_shards_limit_lookups_and_explicit_shards(shard_config):
+    """Test a domain restricted to some shards never sees the others' chunks."""
+    store = ShardedVectorStore.from_config(shard_config, allowed=["central"])
+    store.load_or_build()
+
+    cited = store.lookup_citations("Section 2 of the Kerala Public Health Act")
+    assert [r["shard"] for r in cited] == ["central"]
+    assert store.get_provision("Kerala Public Health Act", "1") == "central a"
+    with pytest.raises(ValueError):
+        store.query("Kerala certificate delay", shards=["kerala"])
+    store.close()
+
+
+def test_incomparable_shard_indexes_rejected(tmp_path, offline_model):
+    """Test shards whose distances are on different scales cannot be merged."""
+    flat = ShardSpec("kerala", str(tmp_path / "kerala"))
+    assert distance_scale("hnsw") == distance_scale("flat")
+    with pytest.raises(ValueError):
+        ShardedVectorStore([flat, ShardSpec("central", str(tmp_path / "central"), index_type="ivfpq")])
+    with pytest.raises(ValueError):
+        ShardedVectorStore([flat, ShardSpec("central", str(tmp_path / "central"), index_type="flat",
+                                            index_params={"reduce": "pca", "reduced_dim": 4})])
+    # Lossy storage shared by every shard keeps distances comparable
+    ShardedVectorStore([flat, ShardSpec("central", str(tmp_path / "central"))], index_type="int8").close()
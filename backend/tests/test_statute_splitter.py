@@ -0,0 +1,81 @@
+"""Tests for statute_splitter module."""
+
+from langchain_core.documents import Document
+from src.statute_splitter import StatuteSplitter, detect_act, normalize_act
+
+
+def _pages():
+    """Two pages of a small Act with a section spanning the page break."""
+    source = "docustore/pdf/TheKeralaSampleAct2024.pdf"
+    page0 = (
+        "The Kerala Sample Act, 2024\n"
+        "Act No. 1 of 2024\n"
+        "CHAPTER I.\n"
+        "PRELIMINARY\n"
+        "1. Short title and commencement.—(1) This Act may be called the Kerala Sample Act, 2024.\n"
+        "2. Definitions.—In this Act,—\n"
+        "(a) \"authority\" means the authority notified under section 3;\n"
+    )
+    page1 = (
+        "(b) \"service\" means a notified public service.\n"
+        "CHAPTER II.\n"
+        "RIGHTS\n"
+        "3. Right to obtain public services within the stipulated\n"
+        "time limit.-(1) Every eligible person shall have the right to obtain services.\n"
+        "1. This numbered line is not a section heading.\n"
+    )
+    return [
+        Document(page_content=page0, metadata={"source": source, "page": 0, "title": "THE KERALA SAMPLE ACT, 2024 [1]"}),
+        Document(page_content=page1, metadata={"source": source, "page": 1}),
+    ]
+
+
+def test_normalize_act():
+    """Test Act titles are tidied into title case with a comma before the year."""
+    assert normalize_act("THE KERALA SURVEY AND BOUNDARIES ACT, 1961    [1]") == "The Kerala Survey And Boundaries Act, 1961"
+    assert normalize_act("The Kerala Public Health Act 2023") == "The Kerala Public Health Act, 2023"
+
+
+def test_detect_act_falls_back_to_file_name():
+    """Test the Act title comes from the file name when the text has none."""
+    pages = [Document(page_content="no title here", metadata={"source": "pdf/TheKeralaPublicHealthAct2023.pdf"})]
+    assert detect_act(pages) == "The Kerala Public Health Act, 2023"
+
+
+def test_split_documents_one_chunk_per_section():
+    """Test sections, chapters and pages are detected across page breaks."""
+    chunks = StatuteSplitter().split_documents(_pages())
+    sections = [c.metadata["section"] for c in chunks]
+
+    assert sections == [None, "1", "2", "3"]
+    definitions = chunks[2]
+    assert definitions.metadata["act"] == "The Kerala Sample Act, 2024"
+    assert definitions.metadata["chapter"] == "Chapter I: PRELIMINARY"
+    assert definitions.metadata["page"] == 0
+    assert "(b) \"service\"" in definitions.page_content
+    assert "CHAPTER II" not in definitions.page_content
+    right = chunks[3]
+    assert right.metadata["section_title"] == "Right to obtain public services within the stipulated time limit"
+    assert right.metadata["chapter"] == "Chapter II: RIGHTS"
+    assert right.metadata["page"] == 1
+
+
+def test_long_section_continuations_repeat_heading():
+    """Test oversized sections are split with the heading on each continuation."""
+    pages = _pages()
+    pages[1].page_content += "\n".join(f"({i}) Further provision text for clause {i}." for i in range(2, 80))
+    chunks = StatuteSplitter(max_chars=500, overlap=50).split_documents(pages)
+    parts = [c for c in chunks if c.metadata["section"] == "3"]
+
+    assert len(parts) > 1
+    assert [c.metadata["part"] for c in parts] == list(range(1, len(parts) + 1))
+    assert all(c.page_content.startswith("Section 3. Right to obtain") for c in parts[1:])
+
+
+def test_non_statute_text_falls_back_to_recursive_splitting():
+    """Test files without section headings are split by size."""
+    doc = Document(page_content="plain notes " * 200, metadata={"source": "notes.txt"})
+    chunks = StatuteSplitter(max_chars=300, overlap=0).split_documents([doc])
+
+    assert len(chunks) > 1
+    assert all("section" not in c.metadata for c in chunks)
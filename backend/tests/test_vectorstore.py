@@ -2,10 +2,12 @@
 
 import pytest
 import tempfile
+import faiss
+import pickle
 import numpy as np
 from pathlib import Path
-from unittest.mock import Mock
-from src.vectorstore import FaissVectorStore
+from unittest.mock import Mock, patch
+from src.vectorstore import FaissVectorStore, exact_search
 
 
 @pytest.fixture
@@ -46,7 +48,8 @@ def test_save_and_load(temp_store_dir):
     store.save()
     
     assert Path(temp_store_dir, "faiss.index").exists()
-    assert Path(temp_store_dir, "metadata.pkl").exists()
+    assert Path(temp_store_dir, "metadata.bin").exists()
+    assert Path(temp_store_dir, "metadata.offsets.npy").exists()
     
     new_store = FaissVectorStore(persist_dir=temp_store_dir)
     new_store.load()
@@ -67,3 +70,354 @@ def test_query(temp_store_dir):
     assert len(results) == 3
     assert all("metadata" in r for r in results)
     assert all("distance" in r for r in results)
+
+
+@pytest.fixture
+def offline_model():
+    """Replace the sentence-transformer so index tests need no model download."""
+    with patch("src.vectorstore.SentenceTransformer") as mock_cls, \
+         patch("src.embedding.SentenceTransformer", mock_cls):
+        mock_cls.return_value.encode.side_effect = lambda texts, **kwargs: np.random.rand(len(texts), 32).astype('float32')
+        yield mock_cls
+
+
+@pytest.mark.parametrize("index_type,params", [
+    ("hnsw", {"M": 16, "efSearch": 32}),
+    ("ivf", {"nlist": 8, "nprobe": 8}),
+    ("ivfpq", {"nlist": 4, "nprobe": 4, "m": 8, "nbits": 6}),
+])
+def test_approximate_index_types(temp_store_dir, offline_model, index_type, params):
+    """Test ANN index types train, search and report recall against flat."""
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type=index_type, index_params=params)
+    embeddings = np.random.rand(500, 32).astype('float32')
+    store.add_embeddings(embeddings, [{"text": f"chunk {i}"} for i in range(500)])
+
+    report = store.evaluate_recall(embeddings, num_queries=20, top_k=5)
+
+    assert 0.0 <= report["recall_at_k"] <= 1.0
+    assert len(store.query("test query", top_k=3)) == 3
+
+
+@pytest.mark.parametrize("index_type,params,max_bytes_per_vector", [
+    ("fp16", {}, 64),
+    ("int8", {}, 32),
+    ("flat", {"reduce": "pca", "reduced_dim": 8}, 32),
+    ("int8", {"reduce": "prefix", "reduced_dim": 16}, 16),
+])
+def test_compressed_index_types(temp_store_dir, offline_model, index_type, params, max_bytes_per_vector):
+    """Test quantized and reduced indexes shrink storage and survive save/load."""
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type=index_type, index_params=params)
+    embeddings = np.random.default_rng(0).random((300, 32), dtype="float32")
+    store.add_embeddings(embeddings, [{"text": f"chunk {i}"} for i in range(300)])
+    report = store.evaluate_recall(embeddings, num_queries=20, top_k=5)
+    store.save()
+
+    reloaded = FaissVectorStore(persist_dir=temp_store_dir)
+    reloaded.load()
+    assert reloaded.index_type == index_type
+    assert reloaded.index.d == 32  # queries keep the model dimension
+    assert len(reloaded.query("test query", top_k=3)) == 3
+    assert (Path(temp_store_dir) / "faiss.index").stat().st_size < 300 * max_bytes_per_vector + 8192
+    assert report["recall_at_k"] > 0.3
+
+
+def test_invalid_dimension_reduction(temp_store_dir, offline_model):
+    """Test unknown dimension reductions are rejected."""
+    with pytest.raises(ValueError, match="dimension reduction"):
+        FaissVectorStore(persist_dir=temp_store_dir, index_params={"reduce": "svd"})
+
+
+def test_exhaustive_ivf_matches_flat(temp_store_dir, offline_model):
+    """Test that scanning every IVF list gives exact recall."""
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type="ivf", index_params={"nlist": 4})
+    embeddings = np.random.rand(200, 32).astype('float32')
+    store.add_embeddings(embeddings, [{"text": str(i)} for i in range(200)])
+    store.set_search_params(nprobe=4)
+
+    assert store.evaluate_recall(embeddings, num_queries=20, top_k=5)["recall_at_k"] == 1.0
+
+
+def test_blocked_exact_search_matches_flat(tmp_path):
+    """Test exact search over a memory-mapped file in small blocks matches one flat index."""
+    rng = np.random.default_rng(0)
+    embeddings = rng.random((250, 16), dtype="float32")
+    embeddings.tofile(tmp_path / "vectors.f32")
+    spilled = np.memmap(tmp_path / "vectors.f32", dtype="float32", mode="r").reshape(-1, 16)
+    queries = embeddings[:10]
+    flat = faiss.IndexFlatL2(16)
+    flat.add(embeddings)
+
+    assert (exact_search(spilled, queries, 5, block_rows=64) == flat.search(queries, 5)[1]).all()
+
+
+def test_index_config_persisted(temp_store_dir, offline_model):
+    """Test index type and search knobs survive save and load."""
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type="hnsw")
+    embeddings = np.random.rand(50, 32).astype('float32')
+    store.add_embeddings(embeddings, [{"text": str(i)} for i in range(50)])
+    store.set_search_params(efSearch=96)
+    store.save()
+
+    loaded = FaissVectorStore(persist_dir=temp_store_dir)
+    loaded.load()
+
+    assert loaded.index_type == "hnsw"
+    assert loaded.index_params["efSearch"] == 96
+    assert faiss.downcast_index(loaded.index.index).hnsw.efSearch == 96
+
+
+def test_invalid_index_options(temp_store_dir, offline_model):
+    """Test unsupported index types and search parameters are rejected."""
+    with pytest.raises(ValueError):
+        FaissVectorStore(persist_dir=temp_store_dir, index_type="lsh")
+
+    store = FaissVectorStore(persist_dir=temp_store_dir)
+    with pytest.raises(ValueError):
+        store.set_search_params(nlist=10)
+
+
+def _live_texts(store):
+    return sorted(meta["text"] for meta in store.metadata if meta)
+
+
+def _documents(n):
+    from langchain_core.documents import Document
+    return (Document(page_content=f"Section {i}. Provision text number {i}.") for i in range(n))
+
+
+def test_streaming_build_flushes_periodically(temp_store_dir, offline_model):
+    """Test a generator is indexed batch by batch with flushes to disk."""
+    store = FaissVectorStore(persist_dir=temp_store_dir)
+    with patch.object(store, "save", wraps=store.save) as save:
+        store.build_from_documents(_documents(25), batch_size=4, flush_every=2)
+
+    assert store.index.ntotal == 25
+    assert save.call_count == 4  # after batches 2, 4, 6 and the final save
+    assert store.metadata[24]["text"] == "Section 24. Provision text number 24."
+
+
+def test_statute_chunking_stores_section_metadata(temp_store_dir, offline_model):
+    """Test statute builds store act, section, source and page with each chunk."""
+    from langchain_core.documents import Document
+    text = "The Kerala Sample Act, 2024\n" + "".join(
+        f"{i}. Provision heading {i}.—Body of section {i}.\n" for i in range(1, 6))
+    store = FaissVectorStore(persist_dir=temp_store_dir, chunking="statute", chunk_size=2000)
+    store.build_from_documents([Document(page_content=text, metadata={"source": "act.pdf", "page": 0})])
+
+    records = [store.metadata[i] for i in range(len(store.metadata))]
+    assert [r.get("section") for r in records] == [None, "1", "2", "3", "4", "5"]
+    assert records[3]["act"] == "The Kerala Sample Act, 2024"
+    assert records[3]["source"] == "act.pdf" and records[3]["page"] == 0
+    assert records[3]["jurisdiction"] == "Kerala"
+
+    reloaded = FaissVectorStore(persist_dir=temp_store_dir)
+    reloaded.load()
+    offline_model.return_value.encode.reset_mock()
+    cited = reloaded.lookup_citations("What does Section 4 of the Kerala Sample Act say?")
+    assert [r["metadata"]["section"] for r in cited] == ["4"]
+    offline_model.return_value.encode.assert_not_called()
+    assert reloaded.get_provision("Kerala Sample Act", "2").startswith("2. Provision heading 2")
+
+
+def test_recursive_chunks_keep_central_acts_in_state_filters(temp_store_dir, offline_model):
+    """Test recursive chunks carry their file's act, and central Acts are tagged India."""
+    from langchain_core.documents import Document
+    store = FaissVectorStore(persist_dir=temp_store_dir, chunking="recursive")
+    store.build_from_documents([
+        Document(page_content="Services must be delivered on time.", metadata={"source": "TheKeralaRighttoPublicServiceAct2025.pdf"}),
+        Document(page_content="A consumer may complain about defective goods.", metadata={"source": "ConsumerProtectionAct2019.pdf"}),
+    ])
+
+    records = [store.metadata[i] for i in range(len(store.metadata))]
+    assert [(r["act"], r["jurisdiction"]) for r in records] == [
+        ("The Kerala Rightto Public Service Act, 2025", "Kerala"),
+        ("Consumer Protection Act, 2019", "India"),
+    ]
+    results = store.query("delayed certificate", top_k=5, filters={"jurisdiction": ["Kerala", "India"]})
+    assert sorted(r["metadata"]["jurisdiction"] for r in results) == ["India", "Kerala"]
+
+
+@pytest.mark.parametrize("index_type,params", [
+    ("flat", {}),
+    ("hnsw", {}),
+    ("ivf", {"nlist": 4, "nprobe": 4}),
+    ("int8", {"reduce": "pca", "reduced_dim": 8}),
+])
+def test_filtered_search_scans_only_matching_vectors(temp_store_dir, offline_model, index_type, params):
+    """Test metadata filters restrict results inside FAISS for every index type."""
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type=index_type, index_params=params)
+    embeddings = np.random.default_rng(0).random((200, 32), dtype="float32")
+    states = ["Kerala", "Tamil Nadu", "India", "Kerala"]
+    store.add_embeddings(embeddings, [{"text": f"chunk {i}", "jurisdiction": states[i % 4]} for i in range(200)])
+
+    # The nearest vector to a Tamil Nadu chunk is itself, but it is filtered out
+    results = store.search(embeddings[1:2], top_k=10, filters={"jurisdiction": ["Kerala", "India"]})
+    assert len(results) == 10
+    assert all(r["metadata"]["jurisdiction"] in ("Kerala", "India") for r in results)
+    assert store.search(embeddings[1:2], top_k=3, filters={"jurisdiction": "Goa"}) == []
+
+    store.save()
+    reloaded = FaissVectorStore(persist_dir=temp_store_dir)
+    reloaded.load()
+    hybrid = reloaded.query("chunk 1", top_k=5, mode="hybrid", filters={"jurisdiction": "Tamil Nadu"})
+    assert hybrid and all(r["metadata"]["jurisdiction"] == "Tamil Nadu" for r in hybrid)
+
+
+@pytest.mark.parametrize("index_type,params", [("hnsw", {}), ("ivf", {"nlist": 4})])
+def test_streaming_build_memory_ceiling(temp_store_dir, offline_model, index_type, params):
+    """Test the memory ceiling triggers flushes and IVF trains on buffered batches."""
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type=index_type, index_params=params)
+    with patch.object(store, "save", wraps=store.save) as save:
+        store.build_from_documents(_documents(40), batch_size=5, max_memory_mb=0.001)
+
+    assert store.index.ntotal == 40
+    assert save.call_count > 1
+    assert store.recall_report is not None
+    assert not (Path(temp_store_dir) / "recall_vectors.f32").exists()
+
+
+def test_sync_documents_is_incremental(temp_store_dir, offline_model, tmp_path):
+    """Test that sync only embeds added or changed documents and drops removed ones."""
+    data_dir = tmp_path / "docs"
+    data_dir.mkdir()
+    (data_dir / "consumer.txt").write_text("Consumer Protection Act")
+    (data_dir / "rti.txt").write_text("Right to Information Act")
+
+    store = FaissVectorStore(persist_dir=temp_store_dir)
+    first = store.sync_documents(str(data_dir))
+    assert first["added"] == 2 and first["chunks_embedded"] == 2
+
+    (data_dir / "rti.txt").write_text("Right to Information Act, amended")
+    (data_dir / "consumer.txt").unlink()
+    (data_dir / "rent.txt").write_text("Rent Control Act")
+
+    reloaded = FaissVectorStore(persist_dir=temp_store_dir)
+    reloaded.load()
+    second = reloaded.sync_documents(str(data_dir))
+
+    assert second == {"added": 1, "changed": 1, "removed": 1, "unchanged": 0, "chunks_embedded": 2, "failed": []}
+    assert reloaded.index.ntotal == 2
+    assert _live_texts(reloaded) == ["Rent Control Act", "Right to Information Act, amended"]
+    assert reloaded.sync_documents(str(data_dir))["chunks_embedded"] == 0
+
+
+def test_sync_documents_rebuilds_on_backend_change(temp_store_dir, offline_model, tmp_path):
+    """Test switching the embedding backend rebuilds instead of mixing vectors."""
+    data_dir = tmp_path / "docs"
+    data_dir.mkdir()
+    (data_dir / "rti.txt").write_text("Right to Information Act")
+    FaissVectorStore(persist_dir=temp_store_dir, embedding_backend="torch").sync_documents(str(data_dir))
+
+    onnx = FaissVectorStore(persist_dir=temp_store_dir, embedding_backend="onnx-int8")
+    onnx.load()
+    summary = onnx.sync_documents(str(data_dir))
+
+    assert summary["added"] == 1 and summary["unchanged"] == 0
+    assert onnx.index.ntotal == 1
+
+
+def test_sync_documents_retries_failed_loads(temp_store_dir, offline_model, tmp_path):
+    """Test a document that fails to load stays stale and is retried on the next sync."""
+    data_dir = tmp_path / "docs"
+    data_dir.mkdir()
+    (data_dir / "rti.txt").write_text("Right to Information Act")
+
+    store = FaissVectorStore(persist_dir=temp_store_dir)
+    with patch("src.vectorstore.load_document", side_effect=RuntimeError("parser missing")):
+        first = store.sync_documents(str(data_dir))
+    assert first["failed"] == ["rti.txt"] and first["chunks_embedded"] == 0
+
+    second = store.sync_documents(str(data_dir))
+    assert second["added"] == 1 and second["failed"] == []
+    assert _live_texts(store) == ["Right to Information Act"]
+
+
+def test_sync_documents_hnsw_tombstones(temp_store_dir, offline_model, tmp_path):
+    """Test HNSW removals are hidden from search results."""
+    data_dir = tmp_path / "docs"
+    data_dir.mkdir()
+    for i in range(3):
+        (data_dir / f"act{i}.txt").write_text(f"Act {i}")
+
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type="hnsw")
+    store.sync_documents(str(data_dir))
+    (data_dir / "act0.txt").unlink()
+    store.sync_documents(str(data_dir))
+
+    results = store.query("Act", top_k=3)
+    assert sorted(r["metadata"]["text"] for r in results) == ["Act 1", "Act 2"]
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf"])
+def test_mmap_load_and_update(temp_store_dir, offline_model, index_type):
+    """Test a memory-mapped store searches like the original and can still be updated."""
+    store = FaissVectorStore(persist_dir=temp_store_dir, index_type=index_type, index_params={"nlist": 4, "nprobe": 4})
+    embeddings = np.random.rand(200, 32).astype('float32')
+    store.add_embeddings(embeddings, [{"text": f"chunk {i}"} for i in range(200)])
+    expected = store.search(embeddings[:1], top_k=3)
+    store.save()
+
+    mapped = FaissVectorStore(persist_dir=temp_store_dir)
+    mapped.load()
+
+    assert [r["metadata"] for r in mapped.search(embeddings[:1], top_k=3)] == [r["metadata"] for r in expected]
+    mapped.add_embeddings(np.random.rand(2, 32).astype('float32'), [{"text": "new"}, {"text": "newer"}])
+    mapped.remove_ids([0])
+    mapped.save()
+
+    reloaded = FaissVectorStore(persist_dir=temp_store_dir)
+    reloaded.load(mmap=False)
+    assert len(reloaded.metadata) == 202
+    assert reloaded.metadata[0] is None
+    assert reloaded.metadata[201] == {"text": "newer"}
+
+
+def test_legacy_pickle_metadata_loads(temp_store_dir, offline_model):
+    """Test stores saved as faiss.index + metadata.pkl still load and migrate on save."""
+    index = faiss.IndexFlatL2(32)
+    index.add(np.random.rand(3, 32).astype('float32'))
+    faiss.write_index(index, str(Path(temp_store_dir, "faiss.index")))
+    with open(Path(temp_store_dir, "metadata.pkl"), "wb") as f:
+        pickle.dump([{"text": f"doc {i}"} for i in range(3)], f)
+
+    store = FaissVectorStore(persist_dir=temp_store_dir)
+    store.load()
+    assert store.metadata[2] == {"text": "doc 2"}
+
+    store.save()
+    assert not Path(temp_store_dir, "metadata.pkl").exists()
+    assert Path(temp_store_dir, "metadata.bin").exists()
+
+
+def test_query_batch_matches_single_queries(temp_store_dir, offline_model):
+    """Test query_batch encodes once and returns the same results as query()."""
+    vectors = {f"query {i}": np.random.rand(32).astype('float32') for i in range(4)}
+    offline_model.return_value.encode.side_effect = lambda texts, **kwargs: np.stack([vectors[t] for t in texts])
+    store = FaissVectorStore(persist_dir=temp_store_dir)
+    store.add_embeddings(np.random.rand(50, 32).astype('float32'), [{"text": str(i)} for i in range(50)])
+
+    offline_model.return_value.encode.reset_mock()
+    batched = store.query_batch(list(vectors), top_k=3)
+
+    assert offline_model.return_value.encode.call_count == 1
+    assert len(batched) == 4
+    for text, results in zip(vectors, batched):
+        assert [r["index"] for r in results] == [r["index"] for r in store.query(text, top_k=3)]
+    assert store.query_batch([], top_k=3) == []
+
+
+def test_hybrid_query_surfaces_exact_section(temp_store_dir, offline_model):
+    """Test hybrid mode fuses BM25 so an exact section match is returned."""
+    store = FaissVectorStore(persist_dir=temp_store_dir)
+    texts = [f"General provision number {i}" for i in range(49)] + ["Section 35: manner of filing a complaint"]
+    store.add_embeddings(np.random.rand(50, 32).astype('float32'), [{"text": t} for t in texts])
+    store.save()
+
+    loaded = FaissVectorStore(persist_dir=temp_store_dir, retrieval_mode="hybrid")
+    loaded.load()
+    results = loaded.query("Section 35 complaint", top_k=3)
+
+    assert any(r["metadata"]["text"].startswith("Section 35") for r in results)
+    assert all("score" in r for r in results)
+    with pytest.raises(ValueError):
+        loaded.query("Section 35", mode="sparse")